@@ -0,0 +1,70 @@
+"""
+Compare the DRF serializer path with CategoryJSONRenderer for list pages.
+
+    python benchmarks/bench_category_json.py [--sizes 1000 10000 100000] [--repeat 5]
+
+Rows are built in memory, so the numbers only cover serialization and
+rendering, not the query.
+"""
+import argparse
+import timeit
+
+from _django import setup_django
+
+setup_django()
+
+from faker import Faker
+from rest_framework.renderers import JSONRenderer
+
+from src.core.category.application.usecases import ListCategoryResponse, ListCategoryResponseMeta
+from src.core.category.domain import Category, CategoryProjection
+from django_project.category_app.renderers import CategoryJSONRenderer, SerializableResponse
+from django_project.category_app.serializers import ListCategoryResponseSerializer
+
+
+def build_response(size: int) -> ListCategoryResponse:
+    faker = Faker()
+    Faker.seed(size)
+    return ListCategoryResponse(
+        data=[
+            CategoryProjection.from_category(Category(
+                name=faker.word(),
+                description=faker.sentence(),
+                is_active=faker.boolean()
+            )) for _ in range(size)
+        ],
+        meta=ListCategoryResponseMeta(next_cursor=None, page_size=size)
+    )
+
+
+def drf_path(response: ListCategoryResponse) -> bytes:
+    return JSONRenderer().render(ListCategoryResponseSerializer(instance=response).data)
+
+
+def fast_path(response: ListCategoryResponse) -> bytes:
+    return CategoryJSONRenderer().render(SerializableResponse(response, ListCategoryResponseSerializer))
+
+
+def best_of(function, response: ListCategoryResponse, repeat: int) -> float:
+    return min(timeit.repeat(lambda: function(response), number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'drf (ms)':>10} {'fast (ms)':>10} {'speedup':>8}")
+    for size in args.sizes:
+        response = build_response(size)
+        if drf_path(response) != fast_path(response):
+            raise SystemExit(f"outputs differ for {size} rows")
+
+        drf = best_of(drf_path, response, args.repeat)
+        fast = best_of(fast_path, response, args.repeat)
+        print(f"{size:>8} {drf * 1000:>10.1f} {fast * 1000:>10.1f} {drf / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
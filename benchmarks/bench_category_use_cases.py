@@ -0,0 +1,333 @@
+"""
+Benchmark the category use cases against every repository implementation.
+
+    python benchmarks/bench_category_use_cases.py [--sizes 10000 100000 1000000]
+        [--repositories orm cached memory] [--operations 1000]
+        [--output results.json] [--baseline baseline.json] [--max-regression 0.2]
+
+For each table size the ORM table (in a throwaway test database) and an
+in-memory repository are seeded, then each use case runs `--operations`
+times per repository. Throughput, p50/p99 latency and the peak memory
+traced over a shorter second pass are reported, and written as JSON with
+--output. A previous --output file can be passed as --baseline: use cases
+whose p50 latency or throughput got worse by more than --max-regression
+are listed and the script exits with status 1.
+
+The baseline defaults to baseline_category_use_cases.json next to this
+script, a default-arguments run whose metadata records the machine it ran
+on. Numbers only compare on similar hardware; refresh it after an intended
+performance change, or on a new reference machine, with
+
+    python benchmarks/bench_category_use_cases.py --baseline "" \
+        --output benchmarks/baseline_category_use_cases.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from _django import setup_django
+
+setup_django()
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from src.core.category.application.usecases import (
+    CreateCategory,
+    CreateCategoryRequest,
+    DeleteCategory,
+    DeleteCategoryRequest,
+    GetCategory,
+    GetCategoryRequest,
+    ListCategory,
+    ListCategoryRequest,
+    StreamCategory,
+    UpdateCategory,
+    UpdateCategoryRequest
+)
+from src.core.category.domain import Category, CategoryRepository, CategorySort
+from src.core.category.infra import CachedCategoryRepository, InMemoryCategoryRepository
+from django_project.category_app.repository import DjangoORMCategoryRepository
+
+
+BASELINE = Path(__file__).with_name("baseline_category_use_cases.json")
+SEED_CHUNK_SIZE = 10_000
+HOT_SET_SIZE = 1_000
+TRACED_OPERATIONS = 100
+WORDS = ["action", "animation", "comedy", "documentary", "drama", "horror", "musical", "romance"]
+
+
+@dataclass
+class Result:
+    repository: str
+    rows: int
+    use_case: str
+    operations: int
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_bytes: int
+
+
+@dataclass
+class Scenario:
+    use_case: str
+    operation: Callable[[], object]
+    operations: int
+
+
+def build_categories(size: int, rng: random.Random) -> list[Category]:
+    return [
+        Category(
+            name=f"{rng.choice(WORDS)} {index}",
+            description=f"Category number {index}",
+            is_active=rng.random() < 0.8
+        ) for index in range(size)
+    ]
+
+
+def seed(repository: CategoryRepository, categories: list[Category]) -> None:
+    for start in range(0, len(categories), SEED_CHUNK_SIZE):
+        repository.save_many(categories[start:start + SEED_CHUNK_SIZE])
+
+
+def scenarios(
+    repository: CategoryRepository,
+    categories: list[Category],
+    operations: int,
+    rng: random.Random
+) -> list[Scenario]:
+    hot_ids = [category.id for category in rng.sample(categories, min(HOT_SET_SIZE, len(categories)))]
+    created = []
+
+    def create():
+        created.append(CreateCategory(repository).execute(
+            CreateCategoryRequest(name=f"{rng.choice(WORDS)} new", description="Created by benchmark")
+        ).id)
+
+    def delete():
+        DeleteCategory(repository).execute(DeleteCategoryRequest(id=created.pop()))
+
+    def stream():
+        for _ in StreamCategory(repository).execute().data:
+            pass
+
+    # create runs first and delete last, so the table keeps its size.
+    return [
+        Scenario("CreateCategory", create, operations),
+        Scenario(
+            "GetCategory",
+            lambda: GetCategory(repository).execute(GetCategoryRequest(id=rng.choice(hot_ids))),
+            operations
+        ),
+        Scenario("ListCategory", lambda: ListCategory(repository).execute(ListCategoryRequest()), operations),
+        Scenario(
+            "ListCategory[filtered]",
+            lambda: ListCategory(repository).execute(ListCategoryRequest(
+                is_active=True,
+                name_prefix=rng.choice(WORDS)[:3],
+                sort=CategorySort.NAME
+            )),
+            operations
+        ),
+        Scenario(
+            "UpdateCategory",
+            lambda: UpdateCategory(repository).execute(
+                UpdateCategoryRequest(id=rng.choice(hot_ids), description="Updated by benchmark")
+            ),
+            operations
+        ),
+        Scenario("StreamCategory", stream, 1),
+        Scenario("DeleteCategory", delete, operations),
+    ]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def measure(repository_name: str, rows: int, scenario: Scenario) -> Result:
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(scenario.operations):
+        operation_started = time.perf_counter()
+        scenario.operation()
+        latencies.append(time.perf_counter() - operation_started)
+    elapsed = time.perf_counter() - started
+
+    # Tracing slows every allocation down, so memory gets its own pass.
+    # DeleteCategory already consumed its ids in the timed pass.
+    peak_memory = 0
+    if scenario.use_case != "DeleteCategory":
+        tracemalloc.start()
+        for _ in range(min(scenario.operations, TRACED_OPERATIONS)):
+            scenario.operation()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return Result(
+        repository=repository_name,
+        rows=rows,
+        use_case=scenario.use_case,
+        operations=scenario.operations,
+        throughput=scenario.operations / elapsed,
+        p50_ms=percentile(latencies, 0.50) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+        peak_memory_bytes=peak_memory
+    )
+
+
+def run(sizes: list[int], repository_names: list[str], operations: int) -> list[Result]:
+    results = []
+    for size in sizes:
+        rng = random.Random(size)
+        categories = build_categories(size, rng)
+        repositories = {}
+
+        if {"orm", "cached"} & set(repository_names):
+            call_command("flush", interactive=False, verbosity=0)
+            seed(DjangoORMCategoryRepository(), categories)
+            repositories["orm"] = DjangoORMCategoryRepository()
+            repositories["cached"] = CachedCategoryRepository(repository=DjangoORMCategoryRepository())
+
+        if "memory" in repository_names:
+            repositories["memory"] = InMemoryCategoryRepository(categories)
+
+        for name in repository_names:
+            for scenario in scenarios(repositories[name], categories, operations, rng):
+                result = measure(name, size, scenario)
+                results.append(result)
+                print(format_result(result), flush=True)
+
+    return results
+
+
+def format_result(result: Result) -> str:
+    return (
+        f"{result.repository:>7} {result.rows:>9} {result.use_case:<24}"
+        f" {result.throughput:>10.1f} {result.p50_ms:>9.3f} {result.p99_ms:>9.3f}"
+        f" {result.peak_memory_bytes / 1024:>10.1f}"
+    )
+
+
+def cpu_model() -> str:
+    # platform.processor() is empty on most Linux systems.
+    try:
+        with open("/proc/cpuinfo") as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def compare(results: list[Result], baseline: dict, max_regression: float) -> list[str]:
+    previous = {
+        (result["repository"], result["rows"], result["use_case"]): result
+        for result in baseline["results"]
+    }
+
+    regressions = []
+    for result in results:
+        base = previous.get((result.repository, result.rows, result.use_case))
+        if base is None:
+            continue
+
+        if result.p50_ms > base["p50_ms"] * (1 + max_regression):
+            regressions.append(
+                f"{result.repository} {result.rows} {result.use_case}: "
+                f"p50 {base['p50_ms']:.3f}ms -> {result.p50_ms:.3f}ms"
+            )
+        if result.throughput < base["throughput"] / (1 + max_regression):
+            regressions.append(
+                f"{result.repository} {result.rows} {result.use_case}: "
+                f"throughput {base['throughput']:.1f}/s -> {result.throughput:.1f}/s"
+            )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--repositories",
+        nargs="+",
+        choices=["orm", "cached", "memory"],
+        default=["orm", "cached", "memory"]
+    )
+    parser.add_argument("--operations", type=int, default=1000)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument(
+        "--baseline",
+        default=str(BASELINE),
+        help=f"JSON results of a previous run to compare against (default: {BASELINE.name}; \"\" to skip)"
+    )
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        print(
+            f"{'repo':>7} {'rows':>9} {'use case':<24}"
+            f" {'ops/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9} {'peak (KiB)':>10}"
+        )
+        results = run(args.sizes, args.repositories, args.operations)
+        metadata = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": cpu_model(),
+            "cpu_count": os.cpu_count(),
+            "database": connection.vendor,
+            "database_version": ".".join(map(str, connection.get_database_version())),
+            "sizes": args.sizes,
+            "repositories": args.repositories,
+            "operations": args.operations,
+        }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "metadata": metadata,
+                    "results": [asdict(result) for result in results],
+                },
+                file,
+                indent=2
+            )
+
+    if args.baseline:
+        if args.baseline == str(BASELINE) and not BASELINE.exists():
+            return
+
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.max_regression)
+
+        if regressions:
+            print(f"\nRegressions above {args.max_regression:.0%}:")
+            print("\n".join(f"  {regression}" for regression in regressions))
+            sys.exit(1)
+
+        print(f"\nNo regressions above {args.max_regression:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
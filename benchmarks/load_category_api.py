@@ -0,0 +1,300 @@
+"""
+Load-test the category API and report throughput, latency percentiles and errors.
+
+    python benchmarks/load_category_api.py [--url http://127.0.0.1:8000]
+        [--concurrency 16] [--duration 10] [--warmup 2] [--read-ratio 0.9]
+        [--seed 1000] [--output load.json]
+
+Without --url, requests go straight into the ASGI application from
+django_project/asgi.py, in process, against a throwaway test database.
+With --url, they go over HTTP/1.1 keep-alive connections to a running
+server. Either way `--seed` categories are first created through the
+bulk endpoint. Then `--concurrency` clients send requests for
+`--duration` seconds (after `--warmup` seconds that are not recorded).
+Reads are split between list and retrieve; writes between create, patch
+and delete of categories created during the run.
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from _django import setup_django
+
+
+BULK_SIZE = 1000
+
+
+@dataclass
+class Response:
+    status: int
+    body: bytes
+
+
+class ASGITransport:
+    def __init__(self, application):
+        self.application = application
+
+    async def request(self, method: str, path: str, body: bytes = b"") -> Response:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"accept", b"application/json"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("testserver", 80),
+        }
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        status = 0
+        chunks = []
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # Django listens for a disconnect while the view runs; the client
+            # never disconnects, so this waits until Django cancels it.
+            await asyncio.Future()
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.application(scope, receive, send)
+        return Response(status, b"".join(chunks))
+
+
+class HTTPTransport:
+    def __init__(self, url: str, concurrency: int):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+        self.local = threading.local()
+
+    async def request(self, method: str, path: str, body: bytes = b"") -> Response:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self._request, method, path, body
+        )
+
+    def _request(self, method: str, path: str, body: bytes) -> Response:
+        for attempt in range(2):
+            connection = getattr(self.local, "connection", None)
+            if connection is None:
+                connection = self.local.connection = http.client.HTTPConnection(self.host, self.port)
+
+            try:
+                connection.request(method, self.prefix + path, body=body or None, headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                })
+                response = connection.getresponse()
+                return Response(response.status, response.read())
+            except (http.client.HTTPException, ConnectionError):
+                # The server may close idle keep-alive connections; retry once.
+                connection.close()
+                self.local.connection = None
+                if attempt:
+                    raise
+
+
+@dataclass
+class Stats:
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def record(self, route: str, latency: float, ok: bool) -> None:
+        self.latencies[route].append(latency)
+        if not ok:
+            self.errors[route] += 1
+
+
+class Workload:
+    def __init__(self, transport, ids: list[str], read_ratio: float, rng: random.Random):
+        self.transport = transport
+        self.ids = ids
+        self.created: list[str] = []
+        self.read_ratio = read_ratio
+        self.rng = rng
+
+    async def step(self) -> tuple[str, bool]:
+        if self.rng.random() < self.read_ratio:
+            if self.rng.random() < 0.5:
+                response = await self.transport.request("GET", "/api/categories/")
+                return "list", response.status == 200
+
+            response = await self.transport.request("GET", f"/api/categories/{self.rng.choice(self.ids)}/")
+            return "retrieve", response.status == 200
+
+        choice = self.rng.random()
+        if choice < 0.4 or (choice >= 0.8 and not self.created):
+            response = await self.transport.request("POST", "/api/categories/", json.dumps({
+                "name": f"Load {self.rng.randrange(1_000_000)}",
+                "description": "Created by the load test",
+            }).encode())
+            if response.status == 201:
+                self.created.append(json.loads(response.body)["id"])
+            return "create", response.status == 201
+
+        if choice < 0.8:
+            response = await self.transport.request(
+                "PATCH",
+                f"/api/categories/{self.rng.choice(self.ids)}/",
+                json.dumps({"description": f"Patched {self.rng.randrange(1_000_000)}"}).encode()
+            )
+            return "partial_update", response.status == 204
+
+        id = self.created.pop(self.rng.randrange(len(self.created)))
+        response = await self.transport.request("DELETE", f"/api/categories/{id}/")
+        return "destroy", response.status == 204
+
+
+async def seed(transport, size: int) -> list[str]:
+    ids = []
+    for start in range(0, size, BULK_SIZE):
+        response = await transport.request("POST", "/api/categories/bulk/", json.dumps({
+            "data": [
+                {"name": f"Seed {index}", "description": f"Seeded category {index}"}
+                for index in range(start, min(start + BULK_SIZE, size))
+            ]
+        }).encode())
+        if response.status != 201:
+            raise SystemExit(f"seeding failed with status {response.status}: {response.body[:200]!r}")
+        ids += [item["id"] for item in json.loads(response.body)["data"]]
+    return ids
+
+
+async def client(workload: Workload, stats: Stats, recording_from: float, until: float) -> None:
+    while (now := time.perf_counter()) < until:
+        try:
+            route, ok = await workload.step()
+        except Exception:
+            route, ok = "transport", False
+        if now >= recording_from:
+            stats.record(route, time.perf_counter() - now, ok)
+
+
+async def load(transport, args) -> tuple[Stats, float]:
+    ids = await seed(transport, args.seed)
+    rng = random.Random(args.seed)
+    stats = Stats()
+
+    started = time.perf_counter()
+    recording_from = started + args.warmup
+    until = recording_from + args.duration
+    await asyncio.gather(*(
+        client(Workload(transport, ids, args.read_ratio, random.Random(rng.random())), stats, recording_from, until)
+        for _ in range(args.concurrency)
+    ))
+    return stats, time.perf_counter() - recording_from
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def summarize(stats: Stats, elapsed: float) -> dict:
+    def summary(latencies: list[float], errors: int) -> dict:
+        return {
+            "requests": len(latencies),
+            "rps": len(latencies) / elapsed,
+            "error_rate": errors / len(latencies) if latencies else 0.0,
+            **{
+                f"p{int(fraction * 100)}_ms": percentile(latencies, fraction) * 1000
+                for fraction in (0.5, 0.9, 0.99)
+            },
+            "max_ms": max(latencies) * 1000,
+        }
+
+    routes = {
+        route: summary(latencies, stats.errors[route])
+        for route, latencies in sorted(stats.latencies.items())
+    }
+    everything = [latency for latencies in stats.latencies.values() for latency in latencies]
+    if not everything:
+        raise SystemExit("no requests completed; is the server reachable?")
+
+    return {"total": summary(everything, sum(stats.errors.values())), "routes": routes}
+
+
+def print_summary(summary: dict) -> None:
+    print(
+        f"{'route':<16} {'requests':>9} {'req/s':>9} {'errors':>7}"
+        f" {'p50 (ms)':>9} {'p90 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}"
+    )
+    for route, row in [*summary["routes"].items(), ("total", summary["total"])]:
+        print(
+            f"{route:<16} {row['requests']:>9} {row['rps']:>9.1f} {row['error_rate']:>7.2%}"
+            f" {row['p50_ms']:>9.2f} {row['p90_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['max_ms']:>9.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="base URL of a running server; defaults to the in-process ASGI app")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=1000, help="categories created before the run")
+    parser.add_argument("--output", help="write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    if args.url:
+        stats, elapsed = asyncio.run(load(HTTPTransport(args.url, args.concurrency), args))
+    else:
+        setup_django()
+
+        from django.db import connection
+        from django.test.utils import setup_test_environment, teardown_test_environment
+        from django_project.asgi import application
+
+        if connection.vendor == "sqlite":
+            # Each ASGI request runs its view in its own thread, and SQLite's
+            # default shared in-memory test database fails concurrent writers
+            # with "table is locked" instead of waiting for the lock.
+            connection.settings_dict["TEST"]["NAME"] = str(Path(tempfile.mkdtemp()) / "load.sqlite3")
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            stats, elapsed = asyncio.run(load(ASGITransport(application), args))
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    summary = summarize(stats, elapsed)
+    print_summary(summary)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"arguments": vars(args), **summary}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+from .instrumented import instrumented, registry
+from .metrics_registry import DEFAULT_BUCKETS, Counter, Histogram, MetricsRegistry
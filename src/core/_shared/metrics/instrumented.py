@@ -0,0 +1,43 @@
+from functools import wraps
+from time import perf_counter
+
+from .metrics_registry import MetricsRegistry
+
+
+registry = MetricsRegistry()
+
+use_case_calls = registry.counter(
+    "use_case_calls_total",
+    "Use case executions, including failed ones."
+)
+use_case_errors = registry.counter(
+    "use_case_errors_total",
+    "Use case executions that raised, by exception type."
+)
+use_case_duration = registry.histogram(
+    "use_case_duration_seconds",
+    "Time spent in use case execute, in seconds."
+)
+
+
+def instrumented(execute):
+    """
+    Decorates a use case's execute method so every call is counted, timed
+    and, when it raises, counted as an error under the exception's name.
+    The use case is identified by its class name.
+    """
+
+    @wraps(execute)
+    def wrapper(self, *args, **kwargs):
+        use_case = type(self).__name__
+        started = perf_counter()
+        try:
+            return execute(self, *args, **kwargs)
+        except Exception as e:
+            use_case_errors.inc(use_case=use_case, exception=type(e).__name__)
+            raise
+        finally:
+            use_case_duration.observe(perf_counter() - started, use_case=use_case)
+            use_case_calls.inc(use_case=use_case)
+
+    return wrapper
@@ -0,0 +1,129 @@
+import math
+import threading
+from bisect import bisect_left
+from typing import Iterator
+
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._values: dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        with self._lock:
+            values = dict(self._values)
+
+        for labels, value in sorted(values.items()):
+            yield self.name, labels, value
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative count per bucket (+Inf last), sum.
+        self._values: dict[Labels, tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        counts, _ = self._values.get(tuple(sorted(labels.items())), ([], 0.0))
+        return sum(counts)
+
+    def samples(self) -> Iterator[tuple[str, Labels, float]]:
+        with self._lock:
+            values = {labels: (list(counts), total) for labels, (counts, total) in self._values.items()}
+
+        for labels, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", (*labels, ("le", _format_value(bound))), cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """
+    In-process, thread-safe store of counters and histograms that renders
+    itself in the Prometheus text exposition format.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self._register(Counter, name, documentation)
+
+    def histogram(self, name: str, documentation: str, **kwargs) -> Histogram:
+        return self._register(Histogram, name, documentation, **kwargs)
+
+    def _register(self, metric_class, name: str, documentation: str, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, documentation, **kwargs)
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"metric {name} is already registered as a {metric.type}")
+            return metric
+
+    def expose(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+import pytest
+
+from src.core._shared.metrics import instrumented
+from src.core._shared.metrics.instrumented import use_case_calls, use_case_duration, use_case_errors
+
+
+class NotFound(Exception):
+    pass
+
+
+@dataclass
+class FakeUseCase:
+    fail: bool = False
+
+    @instrumented
+    def execute(self, value: int) -> int:
+        if self.fail:
+            raise NotFound(f"{value} not found")
+        return value * 2
+
+
+class TestInstrumented:
+    def test_counts_and_times_successful_calls(self):
+        calls = use_case_calls.value(use_case="FakeUseCase")
+        observations = use_case_duration.count(use_case="FakeUseCase")
+
+        assert FakeUseCase().execute(2) == 4
+
+        assert use_case_calls.value(use_case="FakeUseCase") == calls + 1
+        assert use_case_duration.count(use_case="FakeUseCase") == observations + 1
+
+    def test_counts_errors_by_exception_type_and_reraises(self):
+        errors = use_case_errors.value(use_case="FakeUseCase", exception="NotFound")
+        calls = use_case_calls.value(use_case="FakeUseCase")
+
+        with pytest.raises(NotFound, match="2 not found"):
+            FakeUseCase(fail=True).execute(2)
+
+        assert use_case_errors.value(use_case="FakeUseCase", exception="NotFound") == errors + 1
+        assert use_case_calls.value(use_case="FakeUseCase") == calls + 1
+
+    def test_keeps_execute_metadata(self):
+        assert FakeUseCase.execute.__name__ == "execute"
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from src.core._shared.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_counter_counts_per_label_set(self):
+        counter = MetricsRegistry().counter("calls_total", "Calls.")
+
+        counter.inc(use_case="GetCategory")
+        counter.inc(use_case="GetCategory")
+        counter.inc(use_case="ListCategory")
+
+        assert counter.value(use_case="GetCategory") == 2
+        assert counter.value(use_case="ListCategory") == 1
+        assert counter.value(use_case="DeleteCategory") == 0
+
+    def test_registering_a_name_twice_returns_the_same_metric(self):
+        registry = MetricsRegistry()
+
+        assert registry.counter("calls_total", "Calls.") is registry.counter("calls_total", "Calls.")
+
+        with pytest.raises(ValueError, match="metric calls_total is already registered as a counter"):
+            registry.histogram("calls_total", "Calls.")
+
+    def test_expose_renders_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter("calls_total", "Calls.").inc(use_case='Get"Category')
+        histogram = registry.histogram("duration_seconds", "Duration.", buckets=(0.1, 1.0))
+        histogram.observe(0.05, use_case="GetCategory")
+        histogram.observe(0.5, use_case="GetCategory")
+        histogram.observe(3, use_case="GetCategory")
+
+        assert registry.expose() == "\n".join([
+            "# HELP calls_total Calls.",
+            "# TYPE calls_total counter",
+            'calls_total{use_case="Get\\"Category"} 1',
+            "# HELP duration_seconds Duration.",
+            "# TYPE duration_seconds histogram",
+            'duration_seconds_bucket{use_case="GetCategory",le="0.1"} 1',
+            'duration_seconds_bucket{use_case="GetCategory",le="1.0"} 2',
+            'duration_seconds_bucket{use_case="GetCategory",le="+Inf"} 3',
+            'duration_seconds_sum{use_case="GetCategory"} 3.55',
+            'duration_seconds_count{use_case="GetCategory"} 3',
+        ]) + "\n"
+
+    def test_counter_is_thread_safe(self):
+        counter = MetricsRegistry().counter("calls_total", "Calls.")
+
+        def work():
+            for _ in range(1000):
+                counter.inc(use_case="GetCategory")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value(use_case="GetCategory") == 8000
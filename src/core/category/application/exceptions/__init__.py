@@ -1,2 +1,5 @@
 from .category_not_found import CategoryNotFound
+from .category_version_conflict import CategoryVersionConflict
 from .invalid_category import InvalidCategory
+from .invalid_category_batch import InvalidCategoryBatch
+from .invalid_cursor import InvalidCursor
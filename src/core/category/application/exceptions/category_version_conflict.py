@@ -0,0 +1,2 @@
+class CategoryVersionConflict(Exception):
+    pass
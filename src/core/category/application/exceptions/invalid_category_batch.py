@@ -0,0 +1,7 @@
+from .invalid_category import InvalidCategory
+
+
+class InvalidCategoryBatch(InvalidCategory):
+    def __init__(self, errors: dict[int, str]):
+        super().__init__(f"{len(errors)} invalid categories in batch")
+        self.errors = errors
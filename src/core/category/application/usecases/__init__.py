@@ -1,5 +1,27 @@
+from .bulk_create_category import BulkCreateCategory, BulkCreateCategoryRequest, BulkCreateCategoryResponse
+from .bulk_delete_category import BulkDeleteCategory, BulkDeleteCategoryRequest
+from .bulk_update_category import BulkUpdateCategory, BulkUpdateCategoryItem, BulkUpdateCategoryRequest
 from .create_category import CreateCategory, CreateCategoryRequest, CreateCategoryResponse
 from .delete_category import DeleteCategory, DeleteCategoryRequest
 from .get_category import GetCategory, GetCategoryRequest, GetCategoryResponse
-from .list_category import ListCategory, ListCategoryResponse
+from .get_category_revision import GetCategoryRevision, GetCategoryRevisionResponse
+from .get_category_version import (
+    GetCategoryVersion,
+    GetCategoryVersionRequest,
+    GetCategoryVersionResponse
+)
+from .list_category import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    ListCategory,
+    ListCategoryRequest,
+    ListCategoryResponse,
+    ListCategoryResponseMeta
+)
+from .stream_category import (
+    DEFAULT_CHUNK_SIZE,
+    StreamCategory,
+    StreamCategoryRequest,
+    StreamCategoryResponse
+)
 from .update_category import UpdateCategory, UpdateCategoryRequest
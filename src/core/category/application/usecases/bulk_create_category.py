@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import Category, CategoryRepository
+from ..exceptions import InvalidCategoryBatch
+from .create_category import CreateCategoryRequest
+
+
+@dataclass
+class BulkCreateCategoryRequest:
+    items: list[CreateCategoryRequest]
+
+@dataclass
+class BulkCreateCategoryResponse:
+    ids: list[UUID]
+
+@dataclass
+class BulkCreateCategory:
+    repository: CategoryRepository
+
+    @instrumented
+    def execute(self, request: BulkCreateCategoryRequest) -> BulkCreateCategoryResponse:
+        categories, errors = [], {}
+
+        for index, item in enumerate(request.items):
+            try:
+                categories.append(Category(
+                    name=item.name,
+                    description=item.description,
+                    is_active=item.is_active
+                ))
+            except ValueError as e:
+                errors[index] = str(e)
+
+        if errors:
+            raise InvalidCategoryBatch(errors)
+
+        self.repository.save_many(categories)
+        return BulkCreateCategoryResponse(ids=[category.id for category in categories])
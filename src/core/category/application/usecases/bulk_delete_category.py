@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import CategoryRepository
+from ..exceptions import InvalidCategoryBatch
+
+
+@dataclass
+class BulkDeleteCategoryRequest:
+    ids: list[UUID]
+
+@dataclass
+class BulkDeleteCategory:
+    repository: CategoryRepository
+
+    @instrumented
+    def execute(self, request: BulkDeleteCategoryRequest) -> None:
+        ids = list(dict.fromkeys(request.ids))
+
+        # delete_many deletes all categories or none, like update_many.
+        if self.repository.delete_many(ids) != len(ids):
+            existing = self.repository.exists_many(ids)
+            raise InvalidCategoryBatch({
+                index: f"Category with id {id} not found"
+                for index, id in enumerate(request.ids) if id not in existing
+            })
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import Category, CategoryRepository
+from ..exceptions import InvalidCategoryBatch
+
+
+@dataclass
+class BulkUpdateCategoryItem:
+    id: UUID
+    name: str
+    description: str
+    is_active: bool
+
+@dataclass
+class BulkUpdateCategoryRequest:
+    items: list[BulkUpdateCategoryItem]
+
+@dataclass
+class BulkUpdateCategory:
+    repository: CategoryRepository
+
+    @instrumented
+    def execute(self, request: BulkUpdateCategoryRequest) -> None:
+        categories, errors, seen_ids = [], {}, set()
+
+        for index, item in enumerate(request.items):
+            if item.id in seen_ids:
+                errors[index] = f"Category with id {item.id} is duplicated in batch"
+                continue
+            seen_ids.add(item.id)
+
+            try:
+                categories.append(Category(
+                    id=item.id,
+                    name=item.name,
+                    description=item.description,
+                    is_active=item.is_active
+                ))
+            except ValueError as e:
+                errors[index] = str(e)
+
+        if errors:
+            raise InvalidCategoryBatch(errors)
+
+        # update_many writes all categories or none, so a short count means
+        # some id is unknown and nothing was written.
+        if self.repository.update_many(categories) != len(categories):
+            existing = self.repository.exists_many(category.id for category in categories)
+            raise InvalidCategoryBatch({
+                index: f"Category with id {category.id} not found"
+                for index, category in enumerate(categories) if category.id not in existing
+            })
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.core._shared.metrics import instrumented
 from src.core.category.domain import Category, CategoryRepository
 from ..exceptions import InvalidCategory
 
@@ -19,6 +20,7 @@ class CreateCategoryResponse:
 class CreateCategory:
     repository: CategoryRepository
 
+    @instrumented
     def execute(self, request: CreateCategoryRequest) -> CreateCategoryResponse:
         try:
             category = Category(
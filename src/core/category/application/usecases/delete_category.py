@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.core._shared.metrics import instrumented
 from src.core.category.domain import CategoryRepository
 from ..exceptions import CategoryNotFound
 
@@ -12,10 +13,9 @@ class DeleteCategoryRequest:
 class DeleteCategory:
     repository: CategoryRepository
 
+    @instrumented
     def execute(self, request: DeleteCategoryRequest) -> None:
-        category = self.repository.get_by_id(request.id)
+        deleted = self.repository.delete(request.id)
 
-        if category is None:
+        if deleted == 0:
             raise CategoryNotFound(f"Category with id {request.id} not found")
-
-        self.repository.delete(category.id)
\ No newline at end of file
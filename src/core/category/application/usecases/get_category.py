@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.core._shared.metrics import instrumented
 from src.core.category.domain import CategoryRepository
 from ..exceptions import CategoryNotFound
 
@@ -15,11 +16,14 @@ class GetCategoryResponse:
     name: str
     description: str
     is_active: bool
+    version: int
+    genre_count: int = 0
 
 @dataclass
 class GetCategory:
     repository: CategoryRepository
 
+    @instrumented
     def execute(self, request: GetCategoryRequest) -> GetCategoryResponse:
         category = self.repository.get_by_id(request.id)
 
@@ -30,5 +34,7 @@ class GetCategory:
             id=category.id,
             name=category.name,
             description=category.description,
-            is_active=category.is_active
+            is_active=category.is_active,
+            version=category.version,
+            genre_count=category.genre_count
         )
\ No newline at end of file
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import CategoryRepository
+
+
+@dataclass
+class GetCategoryRevisionResponse:
+    revision: str
+
+@dataclass
+class GetCategoryRevision:
+    repository: CategoryRepository
+
+    @instrumented
+    def execute(self) -> GetCategoryRevisionResponse:
+        return GetCategoryRevisionResponse(revision=self.repository.get_revision())
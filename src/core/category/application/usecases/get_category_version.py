@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import CategoryRepository
+from ..exceptions import CategoryNotFound
+
+
+@dataclass
+class GetCategoryVersionRequest:
+    id: UUID
+
+@dataclass
+class GetCategoryVersionResponse:
+    version: int
+
+@dataclass
+class GetCategoryVersion:
+    repository: CategoryRepository
+
+    @instrumented
+    def execute(self, request: GetCategoryVersionRequest) -> GetCategoryVersionResponse:
+        version = self.repository.get_version(request.id)
+
+        if version is None:
+            raise CategoryNotFound(f"Category with id {request.id} not found")
+
+        return GetCategoryVersionResponse(version=version)
@@ -1,25 +1,65 @@
 from dataclasses import dataclass
 
-from src.core.category.domain import Category, CategoryRepository
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import (
+    CategoryFilter,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort
+)
+from ..exceptions import InvalidCursor
 
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+@dataclass
+class ListCategoryRequest:
+    cursor: str | None = None
+    page_size: int = DEFAULT_PAGE_SIZE
+    is_active: bool | None = None
+    name_prefix: str | None = None
+    name_contains: str | None = None
+    sort: CategorySort = CategorySort.ID
+
+@dataclass
+class ListCategoryResponseMeta:
+    next_cursor: str | None
+    page_size: int
+
 @dataclass
 class ListCategoryResponse:
-    data: list[Category]
+    data: list[CategoryProjection]
+    meta: ListCategoryResponseMeta
 
 @dataclass
 class ListCategory:
     repository: CategoryRepository
 
-    def execute(self) -> ListCategoryResponse:
-        categories = self.repository.list()
+    @instrumented
+    def execute(self, request: ListCategoryRequest | None = None) -> ListCategoryResponse:
+        request = request or ListCategoryRequest()
+        page_size = min(max(request.page_size, 1), MAX_PAGE_SIZE)
+        sort = CategorySort(request.sort)
+
+        try:
+            page = self.repository.list_page(
+                cursor=request.cursor,
+                page_size=page_size,
+                filters=CategoryFilter(
+                    is_active=request.is_active,
+                    name_prefix=request.name_prefix,
+                    name_contains=request.name_contains
+                ),
+                sort=sort
+            )
+        except ValueError as e:
+            raise InvalidCursor(e)
 
-        return ListCategoryResponse(data=[
-            Category(
-                id=category.id,
-                name=category.name,
-                description=category.description,
-                is_active=category.is_active
+        return ListCategoryResponse(
+            data=page.data,
+            meta=ListCategoryResponseMeta(
+                next_cursor=page.next_cursor,
+                page_size=page_size
             )
-            for category in categories
-        ])
\ No newline at end of file
+        )
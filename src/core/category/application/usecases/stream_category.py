@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import (
+    CategoryFilter,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort
+)
+
+
+DEFAULT_CHUNK_SIZE = 2000
+
+@dataclass
+class StreamCategoryRequest:
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    is_active: bool | None = None
+    name_prefix: str | None = None
+    name_contains: str | None = None
+    sort: CategorySort = CategorySort.ID
+
+@dataclass
+class StreamCategoryResponse:
+    data: Iterator[CategoryProjection]
+
+@dataclass
+class StreamCategory:
+    repository: CategoryRepository
+
+    @instrumented
+    def execute(self, request: StreamCategoryRequest | None = None) -> StreamCategoryResponse:
+        request = request or StreamCategoryRequest()
+        return StreamCategoryResponse(
+            data=self.repository.iter_all(
+                chunk_size=max(request.chunk_size, 1),
+                filters=CategoryFilter(
+                    is_active=request.is_active,
+                    name_prefix=request.name_prefix,
+                    name_contains=request.name_contains
+                ),
+                sort=CategorySort(request.sort)
+            )
+        )
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.core.category.domain import CategoryRepository
-from ..exceptions import CategoryNotFound, InvalidCategory
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import Category, CategoryRepository
+from ..exceptions import CategoryNotFound, CategoryVersionConflict, InvalidCategory
 
 
 @dataclass
@@ -11,45 +12,49 @@ class UpdateCategoryRequest:
     name: str | None = None
     description: str | None = None
     is_active: bool | None = None
+    version: int | None = None
 
 
 @dataclass
 class UpdateCategory:
     repository: CategoryRepository
 
+    @instrumented
     def execute(self, request: UpdateCategoryRequest) -> None:
         """
-            - Busca categoria pelo ID
-            - Atualiza categoria com os valores passados
-            - Ativar/Desativar categoria
-            - Salva categoria
+            - Valida os valores passados com as regras de Category
+            - Atualiza somente os campos informados, em uma única query
+            - Com version, a escrita só acontece se a versão não mudou
+            - Nenhuma linha afetada significa categoria inexistente ou conflito
         """
-        category = self.repository.get_by_id(request.id)
+        fields = {}
 
-        if category is None:
-            raise CategoryNotFound(f"Category with id {request.id} not found")
+        if request.name is not None:
+            try:
+                Category.validate_name(request.name)
+            except ValueError as e:
+                raise InvalidCategory(e)
 
-        try:
-            current_name = category.name
-            current_description = category.description
+            fields["name"] = request.name
 
-            if request.name is not None:
-                current_name = request.name
+        if request.description is not None:
+            fields["description"] = request.description
 
-            if request.description is not None:
-                current_description = request.description
+        if request.is_active is not None:
+            fields["is_active"] = request.is_active
 
-            if request.is_active is True:
-                category.activate()
+        updated = self.repository.update_fields(
+            request.id,
+            fields,
+            expected_version=request.version
+        )
 
-            if request.is_active is False:
-                category.deactivate()
+        if updated == 1:
+            return
 
-            category.update_category(
-                name=current_name,
-                description=current_description
+        if request.version is not None and self.repository.get_by_id(request.id) is not None:
+            raise CategoryVersionConflict(
+                f"Category with id {request.id} is not at version {request.version}"
             )
-        except ValueError as e:
-            raise InvalidCategory(e)
 
-        self.repository.update(category)
\ No newline at end of file
+        raise CategoryNotFound(f"Category with id {request.id} not found")
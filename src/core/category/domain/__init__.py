@@ -1,3 +1,6 @@
 from .category import Category
+from .category_projection import CategoryProjection
+from .category_query import CategoryFilter, CategorySort
+from .category_page import CategoryPage, decode_cursor, encode_cursor, sort_key
 from .category_repository import CategoryRepository
 
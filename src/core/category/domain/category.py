@@ -8,15 +8,21 @@ class Category:
     description: str = ""
     is_active: bool = True
     id: UUID = field(default_factory=uuid4)
+    version: int = 1
+    genre_count: int = 0
 
     def __post_init__(self):
         self.validate()
 
     def validate(self):
-        if not self.name:
+        self.validate_name(self.name)
+
+    @staticmethod
+    def validate_name(name):
+        if not name:
             raise ValueError("name can not be empty or null")
 
-        if len(self.name) > 255:
+        if len(name) > 255:
             raise ValueError("name can not be longer than 255 caracteres")
 
     def __str__(self) -> str:
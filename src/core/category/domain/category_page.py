@@ -0,0 +1,48 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from .category_projection import CategoryProjection
+from .category_query import CategorySort
+
+
+@dataclass
+class CategoryPage:
+    data: list[CategoryProjection] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def sort_key(category: CategoryProjection, sort: CategorySort = CategorySort.ID) -> tuple:
+    if sort is CategorySort.NAME:
+        return (category.name, category.id)
+
+    return (category.id,)
+
+
+def encode_cursor(category: CategoryProjection, sort: CategorySort = CategorySort.ID) -> str:
+    payload = {"sort": sort.value, "id": str(category.id)}
+    if sort is CategorySort.NAME:
+        payload["name"] = category.name
+
+    data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: CategorySort = CategorySort.ID) -> tuple:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        if payload["sort"] != sort.value:
+            raise ValueError("cursor was created for another sort")
+
+        id = UUID(payload["id"])
+        if sort is CategorySort.NAME:
+            if not isinstance(payload["name"], str):
+                raise ValueError("cursor name must be a string")
+            return (payload["name"], id)
+
+        return (id,)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        raise ValueError(f"invalid cursor: {cursor}")
@@ -0,0 +1,28 @@
+from typing import NamedTuple
+from uuid import UUID
+
+from .category import Category
+
+
+class CategoryProjection(NamedTuple):
+    """
+    Read-only view of a stored category, used on the listing path.
+
+    It is built straight from storage rows, so unlike Category it is never
+    re-validated and costs a single tuple per row.
+    """
+    id: UUID
+    name: str
+    description: str
+    is_active: bool
+    genre_count: int = 0
+
+    @classmethod
+    def from_category(cls, category: Category) -> "CategoryProjection":
+        return cls(
+            id=category.id,
+            name=category.name,
+            description=category.description,
+            is_active=category.is_active,
+            genre_count=category.genre_count
+        )
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class CategorySort(StrEnum):
+    ID = "id"
+    NAME = "name"
+
+
+@dataclass(frozen=True)
+class CategoryFilter:
+    is_active: bool | None = None
+    name_prefix: str | None = None
+    name_contains: str | None = None
+
+    def is_empty(self) -> bool:
+        return self.is_active is None and not self.name_prefix and not self.name_contains
+
@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator
 from uuid import UUID
 
 from .category import Category
+from .category_page import CategoryPage
+from .category_projection import CategoryProjection
+from .category_query import CategoryFilter, CategorySort
 
 
 class CategoryRepository(ABC):
+    """
+    update_many and delete_many write every given category or none of them:
+    when any id is missing nothing is written and they return 0.
+    """
 
     @abstractmethod
     def save(self, category: Category) -> None:
@@ -15,13 +23,69 @@ class CategoryRepository(ABC):
         raise NotImplementedError('Should implement method: get_by_id')
 
     @abstractmethod
-    def update(self, category: Category) -> None:
+    def get_version(self, id: UUID) -> int | None:
+        raise NotImplementedError('Should implement method: get_version')
+
+    @abstractmethod
+    def get_by_ids(self, ids: Iterable[UUID]) -> list[Category]:
+        raise NotImplementedError('Should implement method: get_by_ids')
+
+    @abstractmethod
+    def exists_many(self, ids: Iterable[UUID]) -> set[UUID]:
+        raise NotImplementedError('Should implement method: exists_many')
+
+    @abstractmethod
+    def update(self, category: Category) -> int:
         raise NotImplementedError('Should implement method: update')
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    def update_fields(
+        self,
+        id: UUID,
+        fields: dict[str, Any],
+        expected_version: int | None = None
+    ) -> int:
+        raise NotImplementedError('Should implement method: update_fields')
+
+    @abstractmethod
+    def delete(self, id: UUID) -> int:
         raise NotImplementedError('Should implement method: delete')
 
+    @abstractmethod
+    def save_many(self, categories: list[Category]) -> None:
+        raise NotImplementedError('Should implement method: save_many')
+
+    @abstractmethod
+    def update_many(self, categories: list[Category]) -> int:
+        raise NotImplementedError('Should implement method: update_many')
+
+    @abstractmethod
+    def delete_many(self, ids: list[UUID]) -> int:
+        raise NotImplementedError('Should implement method: delete_many')
+
     @abstractmethod
     def list(self) -> list[Category]:
-        raise NotImplementedError('Should implement method: list')
\ No newline at end of file
+        raise NotImplementedError('Should implement method: list')
+
+    @abstractmethod
+    def list_page(
+        self,
+        cursor: str | None,
+        page_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> CategoryPage:
+        raise NotImplementedError('Should implement method: list_page')
+
+    @abstractmethod
+    def iter_all(
+        self,
+        chunk_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> Iterator[CategoryProjection]:
+        raise NotImplementedError('Should implement method: iter_all')
+
+    @abstractmethod
+    def get_revision(self) -> str:
+        raise NotImplementedError('Should implement method: get_revision')
@@ -0,0 +1,3 @@
+from .cached_category_repository import CacheStats, CachedCategoryRepository
+from .in_memory_category_repository import InMemoryCategoryRepository
+from .observed_category_repository import ObservedCategoryRepository
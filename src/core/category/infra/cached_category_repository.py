@@ -0,0 +1,216 @@
+import threading
+import time
+from collections import OrderedDict
+from copy import copy
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Iterable, Iterator
+from uuid import UUID
+
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryPage,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort
+)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class CachedCategoryRepository(CategoryRepository):
+    """
+    Read-through cache for get_by_id on top of any CategoryRepository.
+    get_version answers from a cached entry when there is one.
+
+    Entries live in a bounded LRU and expire after `ttl` seconds. Every write
+    going through this instance invalidates the ids it touches, and other
+    writers in the process call `invalidate`; writes made by other processes
+    are only picked up once the entry expires.
+    """
+    repository: CategoryRepository
+    max_size: int = 1024
+    ttl: float = 60.0
+    clock: Callable[[], float] = time.monotonic
+    _stats: CacheStats = field(default_factory=CacheStats, init=False, repr=False)
+    _entries: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+    _generation: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def get_by_id(self, id: UUID) -> Category | None:
+        with self._lock:
+            entry = self._entries.get(id)
+            if entry is not None:
+                category, expires_at = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(id)
+                    self._stats.hits += 1
+                    return copy(category)
+
+                del self._entries[id]
+                self._stats.expirations += 1
+
+            self._stats.misses += 1
+            generation = self._generation
+
+        category = self.repository.get_by_id(id)
+        if category is None:
+            return None
+
+        with self._lock:
+            # A write invalidated the cache while we were reading, so the row
+            # we got may already be stale: hand it out but do not keep it.
+            if generation == self._generation:
+                self._store(category)
+
+        return category
+
+    def get_by_ids(self, ids: Iterable[UUID]) -> list[Category]:
+        categories, missing = [], []
+        with self._lock:
+            now = self.clock()
+            for id in set(ids):
+                entry = self._entries.get(id)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(id)
+                    self._stats.hits += 1
+                    categories.append(copy(entry[0]))
+                else:
+                    self._stats.misses += 1
+                    missing.append(id)
+            generation = self._generation
+
+        if not missing:
+            return categories
+
+        fetched = self.repository.get_by_ids(missing)
+        with self._lock:
+            if generation == self._generation:
+                for category in fetched:
+                    self._store(category)
+
+        return categories + fetched
+
+    def exists_many(self, ids: Iterable[UUID]) -> set[UUID]:
+        ids = set(ids)
+        with self._lock:
+            now = self.clock()
+            cached = {id for id in ids if (entry := self._entries.get(id)) is not None and entry[1] > now}
+
+        if cached == ids:
+            return cached
+
+        return cached | self.repository.exists_many(ids - cached)
+
+    def _store(self, category: Category) -> None:
+        self._entries[category.id] = (copy(category), self.clock() + self.ttl)
+        self._entries.move_to_end(category.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def get_version(self, id: UUID) -> int | None:
+        with self._lock:
+            entry = self._entries.get(id)
+            if entry is not None and entry[1] > self.clock():
+                self._stats.hits += 1
+                return entry[0].version
+
+        return self.repository.get_version(id)
+
+    def get_revision(self) -> str:
+        return self.repository.get_revision()
+
+    def save(self, category: Category) -> None:
+        self.repository.save(category)
+        self.invalidate([category.id])
+
+    def update(self, category: Category) -> int:
+        updated = self.repository.update(category)
+        self.invalidate([category.id])
+        return updated
+
+    def update_fields(
+        self,
+        id: UUID,
+        fields: dict[str, Any],
+        expected_version: int | None = None
+    ) -> int:
+        updated = self.repository.update_fields(id, fields, expected_version)
+        self.invalidate([id])
+        return updated
+
+    def delete(self, id: UUID) -> int:
+        deleted = self.repository.delete(id)
+        self.invalidate([id])
+        return deleted
+
+    def save_many(self, categories: list[Category]) -> None:
+        self.repository.save_many(categories)
+        self.invalidate([category.id for category in categories])
+
+    def update_many(self, categories: list[Category]) -> int:
+        updated = self.repository.update_many(categories)
+        self.invalidate([category.id for category in categories])
+        return updated
+
+    def delete_many(self, ids: list[UUID]) -> int:
+        deleted = self.repository.delete_many(ids)
+        self.invalidate(ids)
+        return deleted
+
+    def invalidate(self, ids: Iterable[UUID]) -> None:
+        """For writes to category rows that bypass this instance."""
+        with self._lock:
+            self._generation += 1
+            for id in ids:
+                self._entries.pop(id, None)
+
+    def list(self) -> list[Category]:
+        return self.repository.list()
+
+    def list_page(
+        self,
+        cursor: str | None,
+        page_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> CategoryPage:
+        return self.repository.list_page(
+            cursor=cursor,
+            page_size=page_size,
+            filters=filters,
+            sort=sort
+        )
+
+    def iter_all(
+        self,
+        chunk_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> Iterator[CategoryProjection]:
+        return self.repository.iter_all(
+            chunk_size=chunk_size,
+            filters=filters,
+            sort=sort
+        )
@@ -0,0 +1,289 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from copy import copy
+from dataclasses import replace
+from itertools import islice
+from typing import Any, Iterable, Iterator
+from uuid import UUID
+
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryPage,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort,
+    decode_cursor,
+    encode_cursor
+)
+
+
+class InMemoryCategoryRepository(CategoryRepository):
+    """
+    CategoryRepository kept entirely in process memory.
+
+    Besides the id hash index it keeps ids and (name, id) pairs sorted (for
+    keyset pages and name prefixes), both overall and per is_active value,
+    and secondary indexes on name and is_active, so lookups never scan the
+    whole collection. Categories are
+    copied on the way in and out. Every write bumps a revision counter.
+    """
+
+    bulk_load_threshold = 256
+
+    def __init__(self, categories: list[Category] | None = None):
+        self._lock = threading.RLock()
+        self._by_id: dict[UUID, Category] = {}
+        self._sorted_ids: list[UUID] = []
+        self._sorted_names: list[tuple[str, UUID]] = []
+        self._by_name: dict[str, set[UUID]] = {}
+        self._by_is_active: dict[bool, set[UUID]] = {True: set(), False: set()}
+        self._sorted_ids_by_is_active: dict[bool, list[UUID]] = {True: [], False: []}
+        self._sorted_names_by_is_active: dict[bool, list[tuple[str, UUID]]] = {True: [], False: []}
+        self._revision = 0
+
+        if categories:
+            self.save_many(categories)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def save(self, category: Category) -> None:
+        self.save_many([category])
+
+    def get_by_id(self, id: UUID) -> Category | None:
+        category = self._by_id.get(id)
+        return copy(category) if category is not None else None
+
+    def get_version(self, id: UUID) -> int | None:
+        category = self._by_id.get(id)
+        return category.version if category is not None else None
+
+    def get_by_ids(self, ids: Iterable[UUID]) -> list[Category]:
+        with self._lock:
+            return [copy(self._by_id[id]) for id in set(ids) if id in self._by_id]
+
+    def exists_many(self, ids: Iterable[UUID]) -> set[UUID]:
+        with self._lock:
+            return {id for id in ids if id in self._by_id}
+
+    def get_revision(self) -> str:
+        return str(self._revision)
+
+    def update(self, category: Category) -> int:
+        with self._lock:
+            if category.id not in self._by_id:
+                return 0
+
+            self.update_many([category])
+            return 1
+
+    def update_fields(
+        self,
+        id: UUID,
+        fields: dict[str, Any],
+        expected_version: int | None = None
+    ) -> int:
+        with self._lock:
+            current = self._by_id.get(id)
+            if current is None:
+                return 0
+
+            if expected_version is not None and current.version != expected_version:
+                return 0
+
+            if fields:
+                self._unindex(current)
+                self._index(replace(current, **fields, version=current.version + 1))
+                self._revision += 1
+            return 1
+
+    def delete(self, id: UUID) -> int:
+        with self._lock:
+            if id not in self._by_id:
+                return 0
+
+            self.delete_many([id])
+            return 1
+
+    def save_many(self, categories: list[Category]) -> None:
+        with self._lock:
+            ids = [category.id for category in categories]
+            if len(set(ids)) != len(ids) or any(id in self._by_id for id in ids):
+                raise ValueError("Category with the same id already exists")
+
+            if len(categories) < self.bulk_load_threshold:
+                for category in categories:
+                    self._index(copy(category))
+                    insort(self._sorted_ids, category.id)
+            else:
+                # Inserting one by one shifts the sorted lists for every row;
+                # appending and sorting once keeps large loads O(n log n).
+                for category in categories:
+                    self._index(copy(category), keep_sorted=False)
+                self._sorted_ids.extend(ids)
+                for sorted_list in (
+                    self._sorted_ids,
+                    self._sorted_names,
+                    *self._sorted_ids_by_is_active.values(),
+                    *self._sorted_names_by_is_active.values()
+                ):
+                    sorted_list.sort()
+            self._revision += 1
+
+    def update_many(self, categories: list[Category]) -> int:
+        with self._lock:
+            if any(category.id not in self._by_id for category in categories):
+                return 0
+
+            for category in categories:
+                current = self._by_id[category.id]
+                self._unindex(current)
+                # genre_count belongs to the genre side; callers never set it.
+                self._index(replace(category, version=current.version + 1, genre_count=current.genre_count))
+            self._revision += 1
+        return len(categories)
+
+    def delete_many(self, ids: list[UUID]) -> int:
+        ids = list(dict.fromkeys(ids))
+        with self._lock:
+            if any(id not in self._by_id for id in ids):
+                return 0
+
+            for id in ids:
+                self._unindex(self._by_id.pop(id))
+                del self._sorted_ids[bisect_right(self._sorted_ids, id) - 1]
+            self._revision += 1
+        return len(ids)
+
+    def find_by_name(self, name: str) -> list[Category]:
+        with self._lock:
+            return self._get_many(sorted(self._by_name.get(name, ())))
+
+    def find_by_is_active(self, is_active: bool) -> list[Category]:
+        with self._lock:
+            return self._get_many(self._sorted_ids_by_is_active[is_active])
+
+    def _index(self, category: Category, keep_sorted: bool = True) -> None:
+        self._by_id[category.id] = category
+        self._by_name.setdefault(category.name, set()).add(category.id)
+        self._by_is_active[category.is_active].add(category.id)
+        key = (category.name, category.id)
+        if keep_sorted:
+            insort(self._sorted_names, key)
+            insort(self._sorted_names_by_is_active[category.is_active], key)
+            insort(self._sorted_ids_by_is_active[category.is_active], category.id)
+        else:
+            self._sorted_names.append(key)
+            self._sorted_names_by_is_active[category.is_active].append(key)
+            self._sorted_ids_by_is_active[category.is_active].append(category.id)
+
+    def _unindex(self, category: Category) -> None:
+        ids_with_name = self._by_name[category.name]
+        ids_with_name.discard(category.id)
+        if not ids_with_name:
+            del self._by_name[category.name]
+        self._by_is_active[category.is_active].discard(category.id)
+        key = (category.name, category.id)
+        del self._sorted_names[bisect_left(self._sorted_names, key)]
+        names = self._sorted_names_by_is_active[category.is_active]
+        del names[bisect_left(names, key)]
+        ids = self._sorted_ids_by_is_active[category.is_active]
+        del ids[bisect_left(ids, category.id)]
+
+    def _get_many(self, ids) -> list[Category]:
+        return [copy(self._by_id[id]) for id in ids]
+
+    def _ordered_ids(self, sort: CategorySort, after: tuple | None, limit: int) -> list[UUID]:
+        if sort is CategorySort.NAME:
+            start = bisect_right(self._sorted_names, after) if after is not None else 0
+            return [id for _, id in self._sorted_names[start:start + limit]]
+
+        start = bisect_right(self._sorted_ids, after[0]) if after is not None else 0
+        return self._sorted_ids[start:start + limit]
+
+    def _walk(self, filters: CategoryFilter, sort: CategorySort, after: tuple | None) -> Iterator[UUID]:
+        # Follows the sort order from the cursor and tests each id against
+        # the filters, so a page stops after page_size + 1 matches. An
+        # is_active filter walks that value's own sorted list, and with a
+        # name prefix and name order only the prefix range is visited.
+        prefix = filters.name_prefix
+        if sort is CategorySort.NAME:
+            names = (
+                self._sorted_names if filters.is_active is None
+                else self._sorted_names_by_is_active[filters.is_active]
+            )
+            position = bisect_right(names, after) if after is not None else 0
+            if prefix:
+                position = max(position, bisect_left(names, (prefix,)))
+            for position in range(position, len(names)):
+                name, id = names[position]
+                if prefix and not name.startswith(prefix):
+                    return
+                if self._matches(id, filters):
+                    yield id
+            return
+
+        ids = self._sorted_ids if filters.is_active is None else self._sorted_ids_by_is_active[filters.is_active]
+        position = bisect_right(ids, after[0]) if after is not None else 0
+        for position in range(position, len(ids)):
+            id = ids[position]
+            if self._matches(id, filters):
+                yield id
+
+    def _matches(self, id: UUID, filters: CategoryFilter) -> bool:
+        if filters.is_active is not None and id not in self._by_is_active[filters.is_active]:
+            return False
+
+        name = self._by_id[id].name
+        if filters.name_prefix and not name.startswith(filters.name_prefix):
+            return False
+
+        return not filters.name_contains or filters.name_contains.lower() in name.lower()
+
+    def list(self) -> list[Category]:
+        with self._lock:
+            return self._get_many(self._by_id)
+
+    def list_page(
+        self,
+        cursor: str | None,
+        page_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> CategoryPage:
+        after = decode_cursor(cursor, sort) if cursor is not None else None
+
+        filters = filters or CategoryFilter()
+        with self._lock:
+            if filters.is_empty():
+                ids = self._ordered_ids(sort, after, page_size + 1)
+            else:
+                ids = list(islice(self._walk(filters, sort, after), page_size + 1))
+
+            categories = [CategoryProjection.from_category(self._by_id[id]) for id in ids]
+
+        if len(categories) <= page_size:
+            return CategoryPage(data=categories)
+
+        categories = categories[:page_size]
+        return CategoryPage(data=categories, next_cursor=encode_cursor(categories[-1], sort))
+
+    def iter_all(
+        self,
+        chunk_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> Iterator[CategoryProjection]:
+        filters = filters or CategoryFilter()
+        with self._lock:
+            ids = list(self._walk(filters, sort, None))
+
+        for start in range(0, len(ids), chunk_size):
+            with self._lock:
+                chunk = [
+                    self._by_id[id] for id in ids[start:start + chunk_size]
+                    if id in self._by_id and self._matches(id, filters)
+                ]
+
+            yield from map(CategoryProjection.from_category, chunk)
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+from uuid import UUID
+
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryPage,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort
+)
+
+
+@dataclass
+class ObservedCategoryRepository(CategoryRepository):
+    """
+    Calls `on_write` after every write that goes through it and changed, or
+    may have changed, a row. Reads are passed through untouched. The callback
+    runs in the writer's thread, so it should only schedule work.
+    """
+    repository: CategoryRepository
+    on_write: Callable[[], None]
+
+    def get_by_id(self, id: UUID) -> Category | None:
+        return self.repository.get_by_id(id)
+
+    def get_version(self, id: UUID) -> int | None:
+        return self.repository.get_version(id)
+
+    def get_by_ids(self, ids: Iterable[UUID]) -> list[Category]:
+        return self.repository.get_by_ids(ids)
+
+    def exists_many(self, ids: Iterable[UUID]) -> set[UUID]:
+        return self.repository.exists_many(ids)
+
+    def get_revision(self) -> str:
+        return self.repository.get_revision()
+
+    def save(self, category: Category) -> None:
+        self.repository.save(category)
+        self.on_write()
+
+    def update(self, category: Category) -> int:
+        updated = self.repository.update(category)
+        if updated:
+            self.on_write()
+        return updated
+
+    def update_fields(
+        self,
+        id: UUID,
+        fields: dict[str, Any],
+        expected_version: int | None = None
+    ) -> int:
+        updated = self.repository.update_fields(id, fields, expected_version)
+        if updated:
+            self.on_write()
+        return updated
+
+    def delete(self, id: UUID) -> int:
+        deleted = self.repository.delete(id)
+        if deleted:
+            self.on_write()
+        return deleted
+
+    def save_many(self, categories: list[Category]) -> None:
+        self.repository.save_many(categories)
+        self.on_write()
+
+    def update_many(self, categories: list[Category]) -> int:
+        updated = self.repository.update_many(categories)
+        if updated:
+            self.on_write()
+        return updated
+
+    def delete_many(self, ids: list[UUID]) -> int:
+        deleted = self.repository.delete_many(ids)
+        if deleted:
+            self.on_write()
+        return deleted
+
+    def list(self) -> list[Category]:
+        return self.repository.list()
+
+    def list_page(
+        self,
+        cursor: str | None,
+        page_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> CategoryPage:
+        return self.repository.list_page(
+            cursor=cursor,
+            page_size=page_size,
+            filters=filters,
+            sort=sort
+        )
+
+    def iter_all(
+        self,
+        chunk_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> Iterator[CategoryProjection]:
+        return self.repository.iter_all(
+            chunk_size=chunk_size,
+            filters=filters,
+            sort=sort
+        )
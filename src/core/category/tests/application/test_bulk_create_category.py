@@ -0,0 +1,62 @@
+from unittest.mock import create_autospec
+
+from faker import Faker
+import pytest
+
+from src.core.category.application.exceptions import InvalidCategory, InvalidCategoryBatch
+from src.core.category.application.usecases import (
+    BulkCreateCategory,
+    BulkCreateCategoryRequest,
+    BulkCreateCategoryResponse,
+    CreateCategoryRequest
+)
+from src.core.category.domain import CategoryRepository
+
+
+class TestBulkCreateCategory:
+    faker = Faker()
+
+    @pytest.fixture
+    def mock_repository(self) -> CategoryRepository:
+        return create_autospec(CategoryRepository, instance=True)
+
+    def test_create_categories_with_a_single_save_many_call(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        use_case = BulkCreateCategory(repository=mock_repository)
+        request = BulkCreateCategoryRequest(items=[
+            CreateCategoryRequest(name=self.faker.word(), description=self.faker.sentence()),
+            CreateCategoryRequest(name=self.faker.word(), is_active=False),
+        ])
+
+        response = use_case.execute(request)
+
+        assert isinstance(response, BulkCreateCategoryResponse)
+        mock_repository.save_many.assert_called_once()
+        saved = mock_repository.save_many.call_args.args[0]
+        assert [category.id for category in saved] == response.ids
+        assert [category.name for category in saved] == [item.name for item in request.items]
+        assert [category.is_active for category in saved] == [True, False]
+        mock_repository.save.assert_not_called()
+
+    def test_report_every_invalid_item_by_index(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        use_case = BulkCreateCategory(repository=mock_repository)
+        request = BulkCreateCategoryRequest(items=[
+            CreateCategoryRequest(name=""),
+            CreateCategoryRequest(name=self.faker.word()),
+            CreateCategoryRequest(name="a" * 256),
+        ])
+
+        with pytest.raises(InvalidCategoryBatch) as exc_info:
+            use_case.execute(request)
+
+        assert isinstance(exc_info.value, InvalidCategory)
+        assert exc_info.value.errors == {
+            0: "name can not be empty or null",
+            2: "name can not be longer than 255 caracteres",
+        }
+        mock_repository.save_many.assert_not_called()
@@ -0,0 +1,47 @@
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.application.exceptions import InvalidCategoryBatch
+from src.core.category.application.usecases import (
+    BulkDeleteCategory,
+    BulkDeleteCategoryRequest
+)
+from src.core.category.domain import CategoryRepository
+
+
+class TestBulkDeleteCategory:
+    @pytest.fixture
+    def mock_repository(self) -> CategoryRepository:
+        return create_autospec(CategoryRepository, instance=True)
+
+    def test_delete_categories_with_a_single_delete_many_call(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        ids = [uuid4(), uuid4()]
+        mock_repository.delete_many.return_value = len(ids)
+        use_case = BulkDeleteCategory(repository=mock_repository)
+
+        use_case.execute(BulkDeleteCategoryRequest(ids=ids + ids[:1]))
+
+        mock_repository.delete_many.assert_called_once_with(ids)
+        mock_repository.delete.assert_not_called()
+
+    def test_report_unknown_ids_by_index_when_nothing_was_deleted(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        known, unknown = uuid4(), uuid4()
+        mock_repository.delete_many.return_value = 0
+        mock_repository.exists_many.return_value = {known}
+        use_case = BulkDeleteCategory(repository=mock_repository)
+
+        with pytest.raises(InvalidCategoryBatch) as exc_info:
+            use_case.execute(BulkDeleteCategoryRequest(ids=[unknown, known, unknown]))
+
+        assert exc_info.value.errors == {
+            0: f"Category with id {unknown} not found",
+            2: f"Category with id {unknown} not found",
+        }
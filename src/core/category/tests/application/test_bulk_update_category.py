@@ -0,0 +1,89 @@
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+from faker import Faker
+import pytest
+
+from src.core.category.application.exceptions import InvalidCategoryBatch
+from src.core.category.application.usecases import (
+    BulkUpdateCategory,
+    BulkUpdateCategoryItem,
+    BulkUpdateCategoryRequest
+)
+from src.core.category.domain import Category, CategoryRepository
+
+
+class TestBulkUpdateCategory:
+    faker = Faker()
+
+    @pytest.fixture
+    def mock_repository(self) -> CategoryRepository:
+        return create_autospec(CategoryRepository, instance=True)
+
+    def test_update_categories_with_a_single_update_many_call(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        items = [
+            BulkUpdateCategoryItem(
+                id=uuid4(),
+                name=self.faker.word(),
+                description=self.faker.sentence(),
+                is_active=self.faker.boolean()
+            ) for _ in range(3)
+        ]
+        mock_repository.update_many.return_value = len(items)
+        use_case = BulkUpdateCategory(repository=mock_repository)
+
+        use_case.execute(BulkUpdateCategoryRequest(items=items))
+
+        mock_repository.update_many.assert_called_once_with([
+            Category(
+                id=item.id,
+                name=item.name,
+                description=item.description,
+                is_active=item.is_active
+            ) for item in items
+        ])
+        mock_repository.update.assert_not_called()
+        mock_repository.exists_many.assert_not_called()
+
+    def test_report_invalid_and_duplicated_items_by_index(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        id = uuid4()
+        use_case = BulkUpdateCategory(repository=mock_repository)
+        request = BulkUpdateCategoryRequest(items=[
+            BulkUpdateCategoryItem(id=id, name="Movie", description="", is_active=True),
+            BulkUpdateCategoryItem(id=uuid4(), name="", description="", is_active=True),
+            BulkUpdateCategoryItem(id=id, name="Series", description="", is_active=True),
+        ])
+
+        with pytest.raises(InvalidCategoryBatch) as exc_info:
+            use_case.execute(request)
+
+        assert exc_info.value.errors == {
+            1: "name can not be empty or null",
+            2: f"Category with id {id} is duplicated in batch",
+        }
+        mock_repository.update_many.assert_not_called()
+
+    def test_report_unknown_ids_by_index_when_nothing_was_written(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        known, unknown = uuid4(), uuid4()
+        mock_repository.update_many.return_value = 0
+        mock_repository.exists_many.return_value = {known}
+        use_case = BulkUpdateCategory(repository=mock_repository)
+        request = BulkUpdateCategoryRequest(items=[
+            BulkUpdateCategoryItem(id=known, name="Movie", description="", is_active=True),
+            BulkUpdateCategoryItem(id=unknown, name="Series", description="", is_active=True),
+        ])
+
+        with pytest.raises(InvalidCategoryBatch) as exc_info:
+            use_case.execute(request)
+
+        assert exc_info.value.errors == {1: f"Category with id {unknown} not found"}
+        mock_repository.update_many.assert_called_once()
@@ -0,0 +1,42 @@
+from src.core.category.application.usecases import (
+    CreateCategory,
+    CreateCategoryRequest,
+    DeleteCategory,
+    DeleteCategoryRequest,
+    GetCategory,
+    GetCategoryRequest,
+    GetCategoryResponse,
+    ListCategory,
+    ListCategoryRequest,
+    UpdateCategory,
+    UpdateCategoryRequest
+)
+from src.core.category.infra import InMemoryCategoryRepository
+
+
+class TestCategoryUseCasesWithInMemoryRepository:
+    def test_create_update_list_and_delete_category(self):
+        repository = InMemoryCategoryRepository()
+
+        created = CreateCategory(repository).execute(
+            CreateCategoryRequest(name="Movie", description="Movie description")
+        )
+        UpdateCategory(repository).execute(
+            UpdateCategoryRequest(id=created.id, name="Series", is_active=False)
+        )
+
+        assert GetCategory(repository).execute(GetCategoryRequest(id=created.id)) == GetCategoryResponse(
+            id=created.id,
+            name="Series",
+            description="Movie description",
+            is_active=False,
+            version=2
+        )
+        assert [
+            category.id
+            for category in ListCategory(repository).execute(ListCategoryRequest()).data
+        ] == [created.id]
+
+        DeleteCategory(repository).execute(DeleteCategoryRequest(id=created.id))
+
+        assert ListCategory(repository).execute().data == []
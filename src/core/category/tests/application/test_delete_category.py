@@ -4,10 +4,7 @@ from uuid import uuid4
 from faker import Faker
 import pytest
 
-from src.core.category.application.exceptions import (
-    CategoryNotFound,
-    InvalidCategory
-)
+from src.core.category.application.exceptions import CategoryNotFound
 from src.core.category.application.usecases import (
     DeleteCategory,
     DeleteCategoryRequest
@@ -30,51 +27,41 @@ class TestDeleteCategory:
         )
 
     @pytest.fixture
-    def mock_repository(self, category: Category) -> CategoryRepository:
+    def mock_repository(self) -> CategoryRepository:
         repository = create_autospec(CategoryRepository, instance=True)
-        repository.get_by_id.return_value = category
+        repository.delete.return_value = 1
         return repository
 
-    def test_should_DeleteCategory_call_repository_with_get_by_id_method(
+    def test_delete_category_from_repository_with_delete_method(
         self,
         mock_repository: CategoryRepository,
         category: Category
     ):
-        use_case = DeleteCategory(repository=mock_repository)
-        request = DeleteCategoryRequest(id=category.id)
-
-        use_case.execute(request)
-
-        assert mock_repository.get_by_id.called is True
-
-    def test_when_category_does_not_exist_then_raise_exception(self):
-        mock_repository = create_autospec(CategoryRepository)
-        mock_repository.get_by_id.return_value = None
-        use_case = DeleteCategory(repository=mock_repository)
-        request = DeleteCategoryRequest(id=uuid4())
-
-        with pytest.raises(CategoryNotFound) as exc_info:
-            use_case.execute(request)
+        use_case = DeleteCategory(mock_repository)
+        use_case.execute(DeleteCategoryRequest(id=category.id))
 
-        assert str(exc_info.value) == f"Category with id {request.id} not found"
+        mock_repository.delete.assert_called_once_with(category.id)
 
-    def test_delete_category_from_repository_with_delete_method(
+    def test_should_DeleteCategory_not_read_category_before_deleting(
         self,
         mock_repository: CategoryRepository,
         category: Category
     ):
-        use_case = DeleteCategory(mock_repository)
+        use_case = DeleteCategory(repository=mock_repository)
+
         use_case.execute(DeleteCategoryRequest(id=category.id))
 
-        mock_repository.delete.assert_called_once_with(category.id)
+        mock_repository.get_by_id.assert_not_called()
 
-    def test_should_DeleteCategory_not_call_repository_with_delete_method_if_raise_exception(self):
-        mock_repository = create_autospec(CategoryRepository)
-        mock_repository.get_by_id.return_value = None
+    def test_when_no_category_was_deleted_then_raise_exception(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        mock_repository.delete.return_value = 0
         use_case = DeleteCategory(repository=mock_repository)
         request = DeleteCategoryRequest(id=uuid4())
 
-        with pytest.raises(CategoryNotFound):
+        with pytest.raises(CategoryNotFound) as exc_info:
             use_case.execute(request)
 
-        mock_repository.delete.assert_not_called()
\ No newline at end of file
+        assert str(exc_info.value) == f"Category with id {request.id} not found"
@@ -0,0 +1,51 @@
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.application.exceptions import CategoryNotFound
+from src.core.category.application.usecases import (
+    GetCategoryRevision,
+    GetCategoryRevisionResponse,
+    GetCategoryVersion,
+    GetCategoryVersionRequest,
+    GetCategoryVersionResponse
+)
+from src.core.category.domain import CategoryRepository
+
+
+class TestGetCategoryVersion:
+    @pytest.fixture
+    def mock_repository(self) -> CategoryRepository:
+        return create_autospec(CategoryRepository, instance=True)
+
+    def test_return_version_without_loading_category(self, mock_repository: CategoryRepository):
+        id = uuid4()
+        mock_repository.get_version.return_value = 3
+        use_case = GetCategoryVersion(repository=mock_repository)
+
+        response = use_case.execute(GetCategoryVersionRequest(id=id))
+
+        assert response == GetCategoryVersionResponse(version=3)
+        mock_repository.get_version.assert_called_once_with(id)
+        mock_repository.get_by_id.assert_not_called()
+
+    def test_raise_CategoryNotFound_when_category_does_not_exist(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        id = uuid4()
+        mock_repository.get_version.return_value = None
+        use_case = GetCategoryVersion(repository=mock_repository)
+
+        with pytest.raises(CategoryNotFound, match=f"Category with id {id} not found"):
+            use_case.execute(GetCategoryVersionRequest(id=id))
+
+
+class TestGetCategoryRevision:
+    def test_return_repository_revision(self):
+        mock_repository = create_autospec(CategoryRepository, instance=True)
+        mock_repository.get_revision.return_value = "5-1700000000000000"
+        use_case = GetCategoryRevision(repository=mock_repository)
+
+        assert use_case.execute() == GetCategoryRevisionResponse(revision="5-1700000000000000")
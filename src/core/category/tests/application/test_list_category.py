@@ -4,11 +4,23 @@ from uuid import uuid4
 from faker import Faker
 import pytest
 
+from src.core.category.application.exceptions import InvalidCursor
 from src.core.category.application.usecases import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
     ListCategory,
-    ListCategoryResponse
+    ListCategoryRequest,
+    ListCategoryResponse,
+    ListCategoryResponseMeta
+)
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryPage,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort
 )
-from src.core.category.domain import Category, CategoryRepository
 
 
 class TestListCategory:
@@ -24,10 +36,12 @@ class TestListCategory:
 
     @pytest.fixture
     def mock_repository(self) -> CategoryRepository:
-        return create_autospec(CategoryRepository, instance=True)
+        repository = create_autospec(CategoryRepository, instance=True)
+        repository.list_page.return_value = CategoryPage()
+        return repository
 
 
-    def test_should_ListCategory_call_repository_with_list_method(
+    def test_should_ListCategory_call_repository_with_list_page_method(
         self,
         mock_repository: CategoryRepository
     ):
@@ -35,18 +49,25 @@ class TestListCategory:
 
         use_case.execute()
 
-        assert mock_repository.list.called is True
+        mock_repository.list_page.assert_called_once_with(
+            cursor=None,
+            page_size=DEFAULT_PAGE_SIZE,
+            filters=CategoryFilter(),
+            sort=CategorySort.ID
+        )
 
     def test_should_ListCategory_return_an_empty_list(
         self,
         mock_repository: CategoryRepository
     ):
-        mock_repository.list.return_value = []
         use_case = ListCategory(repository=mock_repository)
 
         response = use_case.execute()
 
-        assert response.data == []
+        assert response == ListCategoryResponse(
+            data=[],
+            meta=ListCategoryResponseMeta(next_cursor=None, page_size=DEFAULT_PAGE_SIZE)
+        )
 
     def test_should_ListCategory_return_list_of_Category(
         self,
@@ -54,7 +75,7 @@ class TestListCategory:
         category: Category
     ):
         list_categories = [category]
-        mock_repository.list.return_value = list_categories
+        mock_repository.list_page.return_value = CategoryPage(data=list_categories)
         use_case = ListCategory(repository=mock_repository)
 
         response = use_case.execute()
@@ -73,9 +94,89 @@ class TestListCategory:
             is_active=self.faker.boolean()
         )
         list_categories =[category, other_category]
-        mock_repository.list.return_value = list_categories
+        mock_repository.list_page.return_value = CategoryPage(data=list_categories)
         use_case = ListCategory(repository=mock_repository)
 
         response = use_case.execute()
 
         assert response.data == list_categories
+
+    def test_should_ListCategory_forward_cursor_and_return_next_cursor(
+        self,
+        mock_repository: CategoryRepository,
+        category: Category
+    ):
+        mock_repository.list_page.return_value = CategoryPage(
+            data=[category],
+            next_cursor="next"
+        )
+        use_case = ListCategory(repository=mock_repository)
+
+        response = use_case.execute(ListCategoryRequest(cursor="current", page_size=1))
+
+        mock_repository.list_page.assert_called_once_with(
+            cursor="current",
+            page_size=1,
+            filters=CategoryFilter(),
+            sort=CategorySort.ID
+        )
+        assert response.meta == ListCategoryResponseMeta(next_cursor="next", page_size=1)
+
+    def test_should_ListCategory_limit_page_size(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        use_case = ListCategory(repository=mock_repository)
+
+        response = use_case.execute(ListCategoryRequest(page_size=MAX_PAGE_SIZE + 1))
+
+        mock_repository.list_page.assert_called_once_with(
+            cursor=None,
+            page_size=MAX_PAGE_SIZE,
+            filters=CategoryFilter(),
+            sort=CategorySort.ID
+        )
+        assert response.meta.page_size == MAX_PAGE_SIZE
+
+    def test_should_ListCategory_raise_InvalidCursor_when_repository_rejects_cursor(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        mock_repository.list_page.side_effect = ValueError("invalid cursor: foo")
+        use_case = ListCategory(repository=mock_repository)
+
+        with pytest.raises(InvalidCursor, match="invalid cursor: foo"):
+            use_case.execute(ListCategoryRequest(cursor="foo"))
+
+    def test_should_ListCategory_pass_projections_through_without_copying(
+        self,
+        mock_repository: CategoryRepository,
+        category: Category
+    ):
+        projections = [CategoryProjection.from_category(category)]
+        mock_repository.list_page.return_value = CategoryPage(data=projections)
+        use_case = ListCategory(repository=mock_repository)
+
+        response = use_case.execute()
+
+        assert response.data is projections
+
+    def test_should_ListCategory_forward_filters_and_sort_to_repository(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        use_case = ListCategory(repository=mock_repository)
+
+        use_case.execute(ListCategoryRequest(
+            is_active=True,
+            name_prefix="Mov",
+            name_contains="ie",
+            sort="name"
+        ))
+
+        mock_repository.list_page.assert_called_once_with(
+            cursor=None,
+            page_size=DEFAULT_PAGE_SIZE,
+            filters=CategoryFilter(is_active=True, name_prefix="Mov", name_contains="ie"),
+            sort=CategorySort.NAME
+        )
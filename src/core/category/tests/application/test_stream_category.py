@@ -0,0 +1,67 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core.category.application.usecases import (
+    DEFAULT_CHUNK_SIZE,
+    StreamCategory,
+    StreamCategoryRequest
+)
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort
+)
+
+
+class TestStreamCategory:
+    @pytest.fixture
+    def mock_repository(self) -> CategoryRepository:
+        return create_autospec(CategoryRepository, instance=True)
+
+    def test_should_StreamCategory_return_repository_iterator_untouched(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        rows = iter([CategoryProjection.from_category(Category(name="Movie"))])
+        mock_repository.iter_all.return_value = rows
+        use_case = StreamCategory(repository=mock_repository)
+
+        response = use_case.execute()
+
+        mock_repository.iter_all.assert_called_once_with(
+            chunk_size=DEFAULT_CHUNK_SIZE,
+            filters=CategoryFilter(),
+            sort=CategorySort.ID
+        )
+        assert response.data is rows
+
+    def test_should_StreamCategory_forward_chunk_size(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        use_case = StreamCategory(repository=mock_repository)
+
+        use_case.execute(StreamCategoryRequest(chunk_size=10))
+
+        mock_repository.iter_all.assert_called_once_with(
+            chunk_size=10,
+            filters=CategoryFilter(),
+            sort=CategorySort.ID
+        )
+
+    def test_should_StreamCategory_forward_filters_and_sort(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        use_case = StreamCategory(repository=mock_repository)
+
+        use_case.execute(StreamCategoryRequest(is_active=True, name_prefix="Mo", sort="name"))
+
+        mock_repository.iter_all.assert_called_once_with(
+            chunk_size=DEFAULT_CHUNK_SIZE,
+            filters=CategoryFilter(is_active=True, name_prefix="Mo"),
+            sort=CategorySort.NAME
+        )
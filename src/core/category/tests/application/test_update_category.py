@@ -4,7 +4,11 @@ from uuid import uuid4
 from faker import Faker
 import pytest
 
-from src.core.category.application.exceptions import CategoryNotFound, InvalidCategory
+from src.core.category.application.exceptions import (
+    CategoryNotFound,
+    CategoryVersionConflict,
+    InvalidCategory
+)
 from src.core.category.application.usecases import UpdateCategory, UpdateCategoryRequest
 from src.core.category.domain import Category, CategoryRepository
 
@@ -24,26 +28,29 @@ class TestUpdateCategory:
         )
 
     @pytest.fixture
-    def mock_repository(self, category: Category) -> CategoryRepository:
+    def mock_repository(self) -> CategoryRepository:
         repository = create_autospec(CategoryRepository, instance=True)
-        repository.get_by_id.return_value = category
+        repository.update_fields.return_value = 1
         return repository
 
-    def test_should_UpdateCategory_call_repository_with_get_id_by_method(
+    def test_should_UpdateCategory_not_read_category_before_updating(
         self,
         category: Category,
         mock_repository: CategoryRepository
     ):
         use_case = UpdateCategory(repository=mock_repository)
-        request = UpdateCategoryRequest(id=category.id)
+        request = UpdateCategoryRequest(id=category.id, name=self.faker.word())
 
         use_case.execute(request)
 
-        assert mock_repository.get_by_id.called is True
+        mock_repository.get_by_id.assert_not_called()
+        mock_repository.update.assert_not_called()
 
-    def test_should_UpdateCategory_raise_exception_when_category_not_found(self):
-        mock_repository = create_autospec(CategoryRepository)
-        mock_repository.get_by_id.return_value = None
+    def test_should_UpdateCategory_raise_exception_when_category_not_found(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        mock_repository.update_fields.return_value = 0
         use_case = UpdateCategory(repository=mock_repository)
         request = UpdateCategoryRequest(id=uuid4())
 
@@ -63,7 +70,11 @@ class TestUpdateCategory:
 
         use_case.execute(request)
 
-        assert category.name == updated_name
+        mock_repository.update_fields.assert_called_once_with(
+            category.id,
+            {"name": updated_name},
+            expected_version=None
+        )
 
     def test_should_UpdateCategory_raises_exception_when_name_is_invalid(
         self,
@@ -76,6 +87,17 @@ class TestUpdateCategory:
         with pytest.raises(InvalidCategory, match="name can not be empty or null"):
             use_case.execute(request)
 
+    def test_should_UpdateCategory_raises_exception_when_name_is_too_long(
+        self,
+        category: Category,
+        mock_repository: CategoryRepository
+    ):
+        use_case = UpdateCategory(repository=mock_repository)
+        request = UpdateCategoryRequest(id=category.id, name="a" * 256)
+
+        with pytest.raises(InvalidCategory, match="name can not be longer than 255 caracteres"):
+            use_case.execute(request)
+
     def test_should_UpdateCategory_updates_description(
         self,
         category: Category,
@@ -87,7 +109,11 @@ class TestUpdateCategory:
 
         use_case.execute(request)
 
-        assert category.description == updated_description
+        mock_repository.update_fields.assert_called_once_with(
+            category.id,
+            {"description": updated_description},
+            expected_version=None
+        )
 
     def test_should_UpdateCategory_updates_name_and_description(
         self,
@@ -105,22 +131,27 @@ class TestUpdateCategory:
 
         use_case.execute(request)
 
-        assert category.name == updated_name
-        assert category.description == updated_description
+        mock_repository.update_fields.assert_called_once_with(
+            category.id,
+            {"name": updated_name, "description": updated_description},
+            expected_version=None
+        )
 
     def test_should_UpdateCategory_activate_category(
         self,
         category: Category,
         mock_repository: CategoryRepository
     ):
-        category.is_active = False
-
         use_case = UpdateCategory(repository=mock_repository)
         request = UpdateCategoryRequest(id=category.id, is_active=True)
 
         use_case.execute(request)
 
-        assert category.is_active is True
+        mock_repository.update_fields.assert_called_once_with(
+            category.id,
+            {"is_active": True},
+            expected_version=None
+        )
 
     def test_should_UpdateCategory_deactivate_category(
         self,
@@ -132,29 +163,64 @@ class TestUpdateCategory:
 
         use_case.execute(request)
 
-        assert category.is_active is False
+        mock_repository.update_fields.assert_called_once_with(
+            category.id,
+            {"is_active": False},
+            expected_version=None
+        )
 
-    def test_should_UpdateCategory_call_repository_with_update_method(
+    def test_should_UpdateCategory_not_call_repository_with_update_fields_method_if_raise_exception(
         self,
         category: Category,
         mock_repository: CategoryRepository
     ):
         use_case = UpdateCategory(repository=mock_repository)
-        request = UpdateCategoryRequest(id=uuid4())
+        request = UpdateCategoryRequest(id=category.id, name="")
+
+        with pytest.raises(InvalidCategory, match="name can not be empty or null"):
+            use_case.execute(request)
+
+        mock_repository.update_fields.assert_not_called()
+
+    def test_should_UpdateCategory_forward_expected_version(
+        self,
+        category: Category,
+        mock_repository: CategoryRepository
+    ):
+        use_case = UpdateCategory(repository=mock_repository)
+        request = UpdateCategoryRequest(id=category.id, name="Series", version=3)
 
         use_case.execute(request)
 
-        mock_repository.update.assert_called_once_with(category)
+        mock_repository.update_fields.assert_called_once_with(
+            category.id,
+            {"name": "Series"},
+            expected_version=3
+        )
+        mock_repository.get_by_id.assert_not_called()
 
-    def test_should_UpdateCategory_not_call_repository_with_update_method_if_raise_exception(
+    def test_should_UpdateCategory_raise_conflict_when_version_changed(
         self,
         category: Category,
         mock_repository: CategoryRepository
     ):
+        mock_repository.update_fields.return_value = 0
+        mock_repository.get_by_id.return_value = category
         use_case = UpdateCategory(repository=mock_repository)
-        request = UpdateCategoryRequest(id=category.id, name="")
+        request = UpdateCategoryRequest(id=category.id, name="Series", version=3)
 
-        with pytest.raises(InvalidCategory, match="name can not be empty or null"):
+        with pytest.raises(CategoryVersionConflict) as exc_info:
             use_case.execute(request)
 
-        mock_repository.update.assert_not_called()
\ No newline at end of file
+        assert str(exc_info.value) == f"Category with id {category.id} is not at version 3"
+
+    def test_should_UpdateCategory_raise_not_found_when_versioned_category_does_not_exist(
+        self,
+        mock_repository: CategoryRepository
+    ):
+        mock_repository.update_fields.return_value = 0
+        mock_repository.get_by_id.return_value = None
+        use_case = UpdateCategory(repository=mock_repository)
+
+        with pytest.raises(CategoryNotFound):
+            use_case.execute(UpdateCategoryRequest(id=uuid4(), name="Series", version=3))
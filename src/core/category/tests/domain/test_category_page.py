@@ -0,0 +1,44 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.domain import (
+    Category,
+    CategorySort,
+    decode_cursor,
+    encode_cursor,
+    sort_key
+)
+
+
+class TestCursor:
+    def test_encoded_cursor_is_decoded_to_category_id(self):
+        category = Category(id=uuid4(), name="Movie")
+
+        cursor = encode_cursor(category)
+
+        assert decode_cursor(cursor) == (category.id,)
+
+    def test_encoded_name_cursor_is_decoded_to_name_and_id(self):
+        category = Category(id=uuid4(), name="Ação")
+
+        cursor = encode_cursor(category, CategorySort.NAME)
+
+        assert decode_cursor(cursor, CategorySort.NAME) == ("Ação", category.id)
+        assert decode_cursor(cursor, CategorySort.NAME) == sort_key(category, CategorySort.NAME)
+
+    def test_encoded_cursor_is_opaque(self):
+        category = Category(id=uuid4(), name="Movie")
+
+        assert str(category.id) not in encode_cursor(category)
+
+    def test_cursor_can_not_be_reused_with_another_sort(self):
+        category = Category(id=uuid4(), name="Movie")
+
+        with pytest.raises(ValueError, match="invalid cursor"):
+            decode_cursor(encode_cursor(category, CategorySort.NAME), CategorySort.ID)
+
+    @pytest.mark.parametrize("cursor", ["", "invalid", "e30", "eyJpZCI6ICJ4In0"])
+    def test_decode_invalid_cursor_raises_ValueError(self, cursor: str):
+        with pytest.raises(ValueError, match="invalid cursor"):
+            decode_cursor(cursor)
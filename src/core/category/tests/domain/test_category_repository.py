@@ -67,3 +67,80 @@ class TestCategoryRepository:
     ):
         with pytest.raises(NotImplementedError, match='Should implement method: list'):
             category_repository.list()
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_list_page_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: list_page'):
+            category_repository.list_page(cursor=None, page_size=10)
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_save_many_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository,
+        category: Category
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: save_many'):
+            category_repository.save_many([category])
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_update_many_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository,
+        category: Category
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: update_many'):
+            category_repository.update_many([category])
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_delete_many_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository,
+        category: Category
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: delete_many'):
+            category_repository.delete_many([category.id])
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_iter_all_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: iter_all'):
+            category_repository.iter_all(chunk_size=10)
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_update_fields_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository,
+        category: Category
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: update_fields'):
+            category_repository.update_fields(category.id, {"name": category.name})
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_get_version_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository,
+        category: Category
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: get_version'):
+            category_repository.get_version(category.id)
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_get_revision_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: get_revision'):
+            category_repository.get_revision()
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_get_by_ids_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository,
+        category: Category
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: get_by_ids'):
+            category_repository.get_by_ids([category.id])
+
+    def test_should_CategoryRepository_raise_a_NotImplementedError_if_exists_many_method_is_not_implemented(
+        self,
+        category_repository: CategoryRepository,
+        category: Category
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: exists_many'):
+            category_repository.exists_many([category.id])
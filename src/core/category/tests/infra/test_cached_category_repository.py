@@ -0,0 +1,271 @@
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+from faker import Faker
+import pytest
+
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryPage,
+    CategoryRepository,
+    CategorySort
+)
+from src.core.category.infra import CacheStats, CachedCategoryRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachedCategoryRepository:
+    faker = Faker()
+
+    @pytest.fixture
+    def category(self) -> Category:
+        return Category(
+            name=self.faker.word(),
+            description=self.faker.sentence(),
+            is_active=self.faker.boolean()
+        )
+
+    @pytest.fixture
+    def repository(self, category: Category) -> CategoryRepository:
+        repository = create_autospec(CategoryRepository, instance=True)
+        repository.get_by_id.return_value = category
+        return repository
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def cached_repository(
+        self,
+        repository: CategoryRepository,
+        clock: FakeClock
+    ) -> CachedCategoryRepository:
+        return CachedCategoryRepository(repository=repository, max_size=2, ttl=10, clock=clock)
+
+    def test_get_by_id_reads_through_and_then_serves_from_cache(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category
+    ):
+        assert cached_repository.get_by_id(category.id) == category
+        assert cached_repository.get_by_id(category.id) == category
+
+        repository.get_by_id.assert_called_once_with(category.id)
+        assert cached_repository.stats == CacheStats(hits=1, misses=1)
+
+    def test_cached_category_is_not_shared_with_callers(
+        self,
+        cached_repository: CachedCategoryRepository,
+        category: Category
+    ):
+        name = category.name
+        cached_repository.get_by_id(category.id)
+
+        cached_repository.get_by_id(category.id).update_category(name="changed", description="")
+
+        assert cached_repository.get_by_id(category.id).name == name
+
+    def test_missing_category_is_not_cached(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository
+    ):
+        repository.get_by_id.return_value = None
+        id = uuid4()
+
+        assert cached_repository.get_by_id(id) is None
+        assert cached_repository.get_by_id(id) is None
+
+        assert repository.get_by_id.call_count == 2
+        assert len(cached_repository) == 0
+
+    def test_entry_expires_after_ttl(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        clock: FakeClock,
+        category: Category
+    ):
+        cached_repository.get_by_id(category.id)
+        clock.now = 10
+
+        cached_repository.get_by_id(category.id)
+
+        assert repository.get_by_id.call_count == 2
+        assert cached_repository.stats == CacheStats(misses=2, expirations=1)
+
+    def test_least_recently_used_entry_is_evicted(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository
+    ):
+        first, second, third = (Category(name=self.faker.word()) for _ in range(3))
+        repository.get_by_id.side_effect = lambda id: {
+            first.id: first, second.id: second, third.id: third
+        }[id]
+
+        cached_repository.get_by_id(first.id)
+        cached_repository.get_by_id(second.id)
+        cached_repository.get_by_id(first.id)
+        cached_repository.get_by_id(third.id)
+        cached_repository.get_by_id(first.id)
+        cached_repository.get_by_id(second.id)
+
+        assert [call.args[0] for call in repository.get_by_id.call_args_list] == [
+            first.id, second.id, third.id, second.id
+        ]
+        assert cached_repository.stats.evictions == 2
+        assert len(cached_repository) == 2
+
+    @pytest.mark.parametrize("method, argument", [
+        ("save", lambda category: category),
+        ("update", lambda category: category),
+        ("update_fields", lambda category: (category.id, {"name": "Series"}, None)),
+        ("delete", lambda category: category.id),
+        ("save_many", lambda category: [category]),
+        ("update_many", lambda category: [category]),
+        ("delete_many", lambda category: [category.id]),
+    ])
+    def test_writes_are_delegated_and_invalidate_cached_entry(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category,
+        method: str,
+        argument
+    ):
+        cached_repository.get_by_id(category.id)
+
+        arguments = argument(category)
+        arguments = arguments if isinstance(arguments, tuple) else (arguments,)
+
+        getattr(cached_repository, method)(*arguments)
+        cached_repository.get_by_id(category.id)
+
+        getattr(repository, method).assert_called_once_with(*arguments)
+        assert repository.get_by_id.call_count == 2
+
+    def test_invalidate_drops_entries_written_elsewhere(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category
+    ):
+        cached_repository.get_by_id(category.id)
+
+        cached_repository.invalidate({category.id})
+        cached_repository.get_by_id(category.id)
+
+        assert repository.get_by_id.call_count == 2
+
+    def test_entry_read_during_a_write_is_not_cached(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category
+    ):
+        def read_while_writing(id):
+            cached_repository.update(category)
+            return category
+
+        repository.get_by_id.side_effect = read_while_writing
+
+        cached_repository.get_by_id(category.id)
+
+        assert len(cached_repository) == 0
+
+    def test_list_methods_are_delegated(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category
+    ):
+        repository.list.return_value = [category]
+        repository.list_page.return_value = CategoryPage(data=[category])
+
+        assert cached_repository.list() == [category]
+        assert cached_repository.list_page(cursor=None, page_size=1) == CategoryPage(data=[category])
+
+    def test_iter_all_is_delegated(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository
+    ):
+        rows = iter([])
+        repository.iter_all.return_value = rows
+
+        assert cached_repository.iter_all(chunk_size=10, filters=CategoryFilter(is_active=True)) is rows
+        repository.iter_all.assert_called_once_with(
+            chunk_size=10,
+            filters=CategoryFilter(is_active=True),
+            sort=CategorySort.ID
+        )
+
+    def test_get_version_is_answered_from_a_cached_entry(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category
+    ):
+        repository.get_version.return_value = category.version
+
+        assert cached_repository.get_version(category.id) == category.version
+        repository.get_version.assert_called_once_with(category.id)
+
+        cached_repository.get_by_id(category.id)
+        repository.get_version.reset_mock()
+
+        assert cached_repository.get_version(category.id) == category.version
+        repository.get_version.assert_not_called()
+
+    def test_get_revision_is_delegated(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository
+    ):
+        repository.get_revision.return_value = "7"
+
+        assert cached_repository.get_revision() == "7"
+
+    def test_get_by_ids_fetches_only_misses_in_one_call(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category
+    ):
+        other, missing = Category(name="Series"), uuid4()
+        repository.get_by_ids.return_value = [other]
+        cached_repository.get_by_id(category.id)
+
+        found = cached_repository.get_by_ids([category.id, other.id, missing])
+
+        assert sorted(found, key=lambda found: found.id) == sorted([category, other], key=lambda found: found.id)
+        assert set(repository.get_by_ids.call_args.args[0]) == {other.id, missing}
+        assert cached_repository.get_by_ids([other.id]) == [other]
+        repository.get_by_ids.assert_called_once()
+
+    def test_exists_many_asks_repository_only_for_uncached_ids(
+        self,
+        cached_repository: CachedCategoryRepository,
+        repository: CategoryRepository,
+        category: Category
+    ):
+        missing = uuid4()
+        repository.exists_many.return_value = set()
+        cached_repository.get_by_id(category.id)
+
+        assert cached_repository.exists_many([category.id]) == {category.id}
+        repository.exists_many.assert_not_called()
+
+        assert cached_repository.exists_many([category.id, missing]) == {category.id}
+        repository.exists_many.assert_called_once_with({missing})
@@ -0,0 +1,366 @@
+from uuid import uuid4
+
+from faker import Faker
+import pytest
+
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryProjection,
+    CategorySort
+)
+from src.core.category.infra import InMemoryCategoryRepository
+
+
+class TestInMemoryCategoryRepository:
+    faker = Faker()
+
+    @pytest.fixture
+    def categories(self) -> list[Category]:
+        return [
+            Category(
+                name=self.faker.word(),
+                description=self.faker.sentence(),
+                is_active=self.faker.boolean()
+            ) for _ in range(5)
+        ]
+
+    @pytest.fixture
+    def repository(self, categories: list[Category]) -> InMemoryCategoryRepository:
+        return InMemoryCategoryRepository(categories)
+
+    def test_save_and_get_by_id(self):
+        repository = InMemoryCategoryRepository()
+        category = Category(name="Movie")
+
+        repository.save(category)
+
+        assert repository.get_by_id(category.id) == category
+        assert repository.get_by_id(uuid4()) is None
+        assert len(repository) == 1
+
+    def test_save_rejects_duplicated_id(self, repository: InMemoryCategoryRepository, categories):
+        with pytest.raises(ValueError, match="already exists"):
+            repository.save(categories[0])
+
+        assert len(repository) == 5
+
+    def test_stored_category_is_not_shared_with_callers(self):
+        category = Category(name="Movie")
+        repository = InMemoryCategoryRepository([category])
+
+        category.update_category(name="Series", description="")
+        repository.get_by_id(category.id).deactivate()
+
+        stored = repository.get_by_id(category.id)
+        assert stored.name == "Movie"
+        assert stored.is_active is True
+
+    def test_list_returns_categories_in_insertion_order(
+        self,
+        repository: InMemoryCategoryRepository,
+        categories: list[Category]
+    ):
+        assert repository.list() == categories
+
+    def test_update_reindexes_name_and_is_active(self):
+        category = Category(name="Movie", is_active=True)
+        repository = InMemoryCategoryRepository([category])
+
+        category.update_category(name="Series", description="")
+        category.deactivate()
+        repository.update(category)
+
+        assert repository.find_by_name("Movie") == []
+        assert repository.find_by_name("Series") == [category]
+        assert repository.find_by_is_active(True) == []
+        assert repository.find_by_is_active(False) == [category]
+
+    def test_update_ignores_missing_category(self, repository: InMemoryCategoryRepository):
+        repository.update(Category(name="Movie"))
+
+        assert len(repository) == 5
+
+    def test_delete_removes_category_from_every_index(
+        self,
+        repository: InMemoryCategoryRepository,
+        categories: list[Category]
+    ):
+        deleted = categories[2]
+
+        repository.delete(deleted.id)
+        repository.delete(uuid4())
+
+        assert repository.get_by_id(deleted.id) is None
+        assert deleted not in repository.find_by_name(deleted.name)
+        assert deleted not in repository.find_by_is_active(deleted.is_active)
+        assert repository.list_page(cursor=None, page_size=10).data == sorted(
+            map(CategoryProjection.from_category, categories[:2] + categories[3:])
+        )
+
+    def test_find_by_name_returns_every_category_with_that_name(self):
+        movie, other_movie, series = Category(name="Movie"), Category(name="Movie"), Category(name="Series")
+        repository = InMemoryCategoryRepository([movie, other_movie, series])
+
+        assert repository.find_by_name("Movie") == sorted(
+            [movie, other_movie], key=lambda category: category.id
+        )
+
+    def test_bulk_operations(self, categories: list[Category]):
+        repository = InMemoryCategoryRepository()
+
+        repository.save_many(categories)
+        for category in categories:
+            category.deactivate()
+        assert repository.update_many(categories + [Category(name="Unknown")]) == 0
+        assert repository.update_many(categories) == len(categories)
+        assert repository.delete_many([categories[0].id, uuid4()]) == 0
+        assert repository.delete_many([category.id for category in categories[:2]]) == 2
+
+        assert repository.list() == categories[2:]
+        assert repository.find_by_is_active(False) == sorted(
+            categories[2:], key=lambda category: category.id
+        )
+
+    def test_list_page_walks_through_all_pages_with_cursor(
+        self,
+        repository: InMemoryCategoryRepository,
+        categories: list[Category]
+    ):
+        listed, cursor = [], None
+
+        while True:
+            page = repository.list_page(cursor=cursor, page_size=2)
+            listed.extend(page.data)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert listed == sorted(map(CategoryProjection.from_category, categories))
+
+    def test_list_page_raises_ValueError_when_cursor_is_invalid(
+        self,
+        repository: InMemoryCategoryRepository
+    ):
+        with pytest.raises(ValueError, match="invalid cursor"):
+            repository.list_page(cursor="invalid", page_size=2)
+
+    def test_iter_all_yields_every_category_in_id_order(
+        self,
+        repository: InMemoryCategoryRepository,
+        categories: list[Category]
+    ):
+        assert list(repository.iter_all(chunk_size=2)) == sorted(
+            map(CategoryProjection.from_category, categories)
+        )
+
+    def test_iter_all_skips_categories_deleted_while_iterating(
+        self,
+        repository: InMemoryCategoryRepository,
+        categories: list[Category]
+    ):
+        ordered = sorted(categories, key=lambda category: category.id)
+        rows = repository.iter_all(chunk_size=2)
+
+        first = next(rows)
+        repository.delete(ordered[-1].id)
+
+        assert [first, *rows] == list(map(CategoryProjection.from_category, ordered[:-1]))
+
+
+class TestInMemoryCategoryRepositoryFiltersAndSort:
+    @pytest.fixture
+    def repository(self) -> InMemoryCategoryRepository:
+        return InMemoryCategoryRepository([
+            Category(name="Movie", is_active=True),
+            Category(name="Movies", is_active=False),
+            Category(name="Documentary", is_active=True),
+            Category(name="Mockumentary", is_active=True),
+            Category(name="movie night", is_active=True),
+        ])
+
+    def walk(self, repository: InMemoryCategoryRepository, **kwargs) -> list[str]:
+        listed, cursor = [], None
+        while True:
+            page = repository.list_page(cursor=cursor, page_size=2, **kwargs)
+            listed.extend(category.name for category in page.data)
+            cursor = page.next_cursor
+            if cursor is None:
+                return listed
+
+    def test_sort_by_name(self, repository: InMemoryCategoryRepository):
+        assert self.walk(repository, sort=CategorySort.NAME) == [
+            "Documentary", "Mockumentary", "Movie", "Movies", "movie night"
+        ]
+
+    def test_sort_by_name_follows_renames(self, repository: InMemoryCategoryRepository):
+        category = repository.find_by_name("Documentary")[0]
+        category.update_category(name="zoo", description="")
+        repository.update(category)
+
+        assert self.walk(repository, sort=CategorySort.NAME)[-1] == "zoo"
+
+    @pytest.mark.parametrize("filters, expected", [
+        (CategoryFilter(is_active=False), ["Movies"]),
+        (CategoryFilter(name_prefix="Movie"), ["Movie", "Movies"]),
+        (CategoryFilter(name_contains="MENTARY"), ["Documentary", "Mockumentary"]),
+        (CategoryFilter(is_active=True, name_prefix="Mo"), ["Mockumentary", "Movie"]),
+        (CategoryFilter(name_prefix="Zebra"), []),
+    ])
+    def test_filters(
+        self,
+        repository: InMemoryCategoryRepository,
+        filters: CategoryFilter,
+        expected: list[str]
+    ):
+        assert self.walk(repository, filters=filters, sort=CategorySort.NAME) == expected
+
+    def test_filters_with_id_sort(self, repository: InMemoryCategoryRepository):
+        listed = repository.list_page(
+            cursor=None,
+            page_size=10,
+            filters=CategoryFilter(is_active=True)
+        ).data
+
+        assert [category.id for category in listed] == sorted(category.id for category in listed)
+        assert len(listed) == 4
+
+    def test_filtered_page_stops_after_page_size_plus_one_matches(self, monkeypatch):
+        repository = InMemoryCategoryRepository([Category(name=f"Category {i}") for i in range(1000)])
+        checked = []
+        matches = repository._matches
+        monkeypatch.setattr(repository, "_matches", lambda id, filters: checked.append(id) or matches(id, filters))
+
+        page = repository.list_page(cursor=None, page_size=2, filters=CategoryFilter(is_active=True))
+
+        assert len(page.data) == 2
+        assert len(checked) == 3
+
+    @pytest.mark.parametrize("sort", [CategorySort.ID, CategorySort.NAME])
+    def test_rare_is_active_value_is_paged_without_visiting_the_others(self, sort: CategorySort, monkeypatch):
+        categories = [Category(name=f"Category {i:04}", is_active=i % 100 != 0) for i in range(1000)]
+        repository = InMemoryCategoryRepository(categories)
+        repository.update_fields(categories[1].id, {"is_active": False})
+        checked = []
+        matches = repository._matches
+        monkeypatch.setattr(repository, "_matches", lambda id, filters: checked.append(id) or matches(id, filters))
+
+        page = repository.list_page(cursor=None, page_size=5, filters=CategoryFilter(is_active=False), sort=sort)
+        rest = repository.list_page(
+            cursor=page.next_cursor,
+            page_size=10,
+            filters=CategoryFilter(is_active=False),
+            sort=sort
+        )
+
+        inactive = [category for index, category in enumerate(categories) if index == 1 or not category.is_active]
+        if sort is CategorySort.ID:
+            inactive.sort(key=lambda category: category.id)
+        assert [category.id for category in page.data + rest.data] == [category.id for category in inactive]
+        assert len(checked) == 6 + 6
+
+    def test_iter_all_applies_filters_and_sort(self, repository: InMemoryCategoryRepository):
+        streamed = repository.iter_all(
+            chunk_size=1,
+            filters=CategoryFilter(is_active=True, name_prefix="Mo"),
+            sort=CategorySort.NAME
+        )
+
+        assert [category.name for category in streamed] == ["Mockumentary", "Movie"]
+
+
+class TestInMemoryCategoryRepositoryAffectedRows:
+    def test_update_fields_reindexes_and_returns_affected_rows(self):
+        category = Category(name="Movie")
+        repository = InMemoryCategoryRepository([category])
+
+        assert repository.update_fields(category.id, {"name": "Series", "is_active": False}) == 1
+        assert repository.update_fields(uuid4(), {"name": "Series"}) == 0
+
+        assert repository.find_by_name("Series") == [
+            Category(id=category.id, name="Series", is_active=False)
+        ]
+        assert repository.find_by_name("Movie") == []
+        assert repository.find_by_is_active(True) == []
+
+    def test_update_and_delete_return_affected_rows(self):
+        category = Category(name="Movie")
+        repository = InMemoryCategoryRepository([category])
+
+        assert repository.update(category) == 1
+        assert repository.update(Category(name="Series")) == 0
+        assert repository.delete(category.id) == 1
+        assert repository.delete(category.id) == 0
+
+
+class TestInMemoryCategoryRepositoryVersions:
+    def test_get_version_follows_updates(self):
+        category = Category(name="Movie")
+        repository = InMemoryCategoryRepository([category])
+
+        assert repository.get_version(category.id) == 1
+        repository.update_fields(category.id, {"name": "Series"})
+        assert repository.get_version(category.id) == 2
+        assert repository.get_version(uuid4()) is None
+
+    def test_revision_changes_on_every_write(self):
+        category = Category(name="Movie")
+        repository = InMemoryCategoryRepository()
+        revisions = [repository.get_revision()]
+
+        repository.save(category)
+        revisions.append(repository.get_revision())
+        repository.update_fields(category.id, {"name": "Series"})
+        revisions.append(repository.get_revision())
+        repository.delete(category.id)
+        revisions.append(repository.get_revision())
+
+        assert len(set(revisions)) == 4
+
+    def test_revision_does_not_change_on_reads(self):
+        repository = InMemoryCategoryRepository([Category(name="Movie")])
+        revision = repository.get_revision()
+
+        repository.list()
+        repository.list_page(cursor=None, page_size=10)
+
+        assert repository.get_revision() == revision
+
+    def test_bulk_load_keeps_indexes_sorted(self):
+        repository = InMemoryCategoryRepository([Category(name="Zoo"), Category(name="Action")])
+        categories = [Category(name=f"Category {index % 7}", is_active=index % 3 > 0) for index in range(300)]
+
+        repository.save_many(categories)
+
+        assert repository._sorted_ids == sorted(repository._by_id)
+        assert repository._sorted_names == sorted(
+            (category.name, category.id) for category in repository.list()
+        )
+        for is_active in (True, False):
+            stored = repository.find_by_is_active(is_active)
+            assert repository._sorted_ids_by_is_active[is_active] == sorted(category.id for category in stored)
+            assert repository._sorted_names_by_is_active[is_active] == sorted(
+                (category.name, category.id) for category in stored
+            )
+        assert len(repository.find_by_name("Category 3")) == 43
+
+    def test_updates_keep_the_stored_genre_count(self):
+        category = Category(name="Movie", genre_count=3)
+        repository = InMemoryCategoryRepository([category])
+
+        repository.update_many([Category(id=category.id, name="Series")])
+        repository.update(Category(id=category.id, name="Documentary"))
+
+        assert repository.get_by_id(category.id).genre_count == 3
+
+    def test_get_by_ids_and_exists_many_skip_missing_ids(self):
+        movie, series = Category(name="Movie"), Category(name="Series")
+        repository = InMemoryCategoryRepository([movie, series])
+        missing = uuid4()
+
+        found = repository.get_by_ids([movie.id, missing])
+        found[0].update_category(name="Documentary", description="")
+
+        assert found == [movie]
+        assert repository.get_by_id(movie.id).name == "Movie"
+        assert repository.exists_many([movie.id, series.id, missing]) == {movie.id, series.id}
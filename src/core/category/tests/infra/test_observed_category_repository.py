@@ -0,0 +1,81 @@
+from unittest.mock import Mock, create_autospec
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.domain import Category, CategoryRepository, CategorySort
+from src.core.category.infra import ObservedCategoryRepository
+
+
+class TestObservedCategoryRepository:
+    @pytest.fixture
+    def repository(self) -> CategoryRepository:
+        return create_autospec(CategoryRepository, instance=True)
+
+    @pytest.fixture
+    def on_write(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture
+    def observed_repository(self, repository: CategoryRepository, on_write: Mock) -> ObservedCategoryRepository:
+        return ObservedCategoryRepository(repository=repository, on_write=on_write)
+
+    @pytest.mark.parametrize("method, args", [
+        ("save", (Category(name="Movie"),)),
+        ("save_many", ([Category(name="Movie")],)),
+    ])
+    def test_notify_after_write(
+        self,
+        observed_repository: ObservedCategoryRepository,
+        repository: CategoryRepository,
+        on_write: Mock,
+        method: str,
+        args: tuple
+    ):
+        getattr(observed_repository, method)(*args)
+
+        getattr(repository, method).assert_called_once_with(*args)
+        on_write.assert_called_once_with()
+
+    @pytest.mark.parametrize("method, args", [
+        ("update", (Category(name="Movie"),)),
+        ("update_many", ([Category(name="Movie")],)),
+        ("delete_many", ([uuid4()],)),
+        ("update_fields", (uuid4(), {"name": "Series"}, 1)),
+        ("delete", (uuid4(),)),
+    ])
+    def test_notify_only_when_rows_were_affected(
+        self,
+        observed_repository: ObservedCategoryRepository,
+        repository: CategoryRepository,
+        on_write: Mock,
+        method: str,
+        args: tuple
+    ):
+        getattr(repository, method).return_value = 0
+        assert getattr(observed_repository, method)(*args) == 0
+        on_write.assert_not_called()
+
+        getattr(repository, method).return_value = 1
+        assert getattr(observed_repository, method)(*args) == 1
+        on_write.assert_called_once_with()
+
+    def test_reads_do_not_notify(
+        self,
+        observed_repository: ObservedCategoryRepository,
+        repository: CategoryRepository,
+        on_write: Mock
+    ):
+        id = uuid4()
+        repository.get_by_id.return_value = None
+
+        assert observed_repository.get_by_id(id) is None
+        observed_repository.list()
+        observed_repository.iter_all(chunk_size=10)
+        observed_repository.get_revision()
+        observed_repository.get_by_ids([id])
+        observed_repository.exists_many([id])
+
+        repository.exists_many.assert_called_once_with([id])
+        repository.iter_all.assert_called_once_with(chunk_size=10, filters=None, sort=CategorySort.ID)
+        on_write.assert_not_called()
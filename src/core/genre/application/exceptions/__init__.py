@@ -0,0 +1,3 @@
+from .genre_not_found import GenreNotFound
+from .invalid_genre import InvalidGenre
+from .related_categories_not_found import RelatedCategoriesNotFound
@@ -0,0 +1,2 @@
+class GenreNotFound(Exception):
+    pass
@@ -0,0 +1,6 @@
+from .create_genre import CreateGenre, CreateGenreRequest, CreateGenreResponse
+from .delete_genre import DeleteGenre, DeleteGenreRequest
+from .get_genre import GetGenre, GetGenreRequest, GetGenreResponse
+from .list_genre import ListGenre, ListGenreRequest, ListGenreResponse
+from .update_genre import UpdateGenre, UpdateGenreRequest
+from .stream_genre import StreamGenre, StreamGenreRequest, StreamGenreResponse
@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import CategoryRepository
+from src.core.genre.domain import Genre, GenreRepository
+from ..exceptions import InvalidGenre, RelatedCategoriesNotFound
+
+
+@dataclass
+class CreateGenreRequest:
+    name: str
+    is_active: bool = True
+    categories: set[UUID] = field(default_factory=set)
+
+@dataclass
+class CreateGenreResponse:
+    id: UUID
+
+@dataclass
+class CreateGenre:
+    repository: GenreRepository
+    category_repository: CategoryRepository
+
+    @instrumented
+    def execute(self, request: CreateGenreRequest) -> CreateGenreResponse:
+        categories = set(request.categories)
+        missing = categories - self.category_repository.exists_many(categories)
+        if missing:
+            raise RelatedCategoriesNotFound(
+                f"Categories with provided IDs not found: {', '.join(sorted(map(str, missing)))}"
+            )
+
+        try:
+            genre = Genre(
+                name=request.name,
+                is_active=request.is_active,
+                categories=set(request.categories)
+            )
+        except ValueError as e:
+            raise InvalidGenre(e)
+
+        self.repository.save(genre)
+        return CreateGenreResponse(genre.id)
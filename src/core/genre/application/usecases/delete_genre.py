@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.genre.domain import GenreRepository
+from ..exceptions import GenreNotFound
+
+@dataclass
+class DeleteGenreRequest:
+    id: UUID
+
+@dataclass
+class DeleteGenre:
+    repository: GenreRepository
+
+    @instrumented
+    def execute(self, request: DeleteGenreRequest) -> None:
+        deleted = self.repository.delete(request.id)
+
+        if deleted == 0:
+            raise GenreNotFound(f"Genre with id {request.id} not found")
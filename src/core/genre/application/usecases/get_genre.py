@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.genre.domain import GenreRepository
+from ..exceptions import GenreNotFound
+
+
+@dataclass
+class GetGenreRequest:
+    id: UUID
+
+@dataclass
+class GetGenreResponse:
+    id: UUID
+    name: str
+    is_active: bool
+    categories: set[UUID]
+
+@dataclass
+class GetGenre:
+    repository: GenreRepository
+
+    @instrumented
+    def execute(self, request: GetGenreRequest) -> GetGenreResponse:
+        genre = self.repository.get_by_id(request.id)
+
+        if genre is None:
+            raise GenreNotFound(f"Genre with id {request.id} not found")
+
+        return GetGenreResponse(
+            id=genre.id,
+            name=genre.name,
+            is_active=genre.is_active,
+            categories=genre.categories
+        )
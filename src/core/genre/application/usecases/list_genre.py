@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.genre.domain import GenreRepository
+from .get_genre import GetGenreResponse
+
+
+@dataclass
+class ListGenreRequest:
+    categories: set[UUID] = field(default_factory=set)
+    match_all: bool = False
+
+@dataclass
+class ListGenreResponse:
+    data: list[GetGenreResponse]
+
+@dataclass
+class ListGenre:
+    repository: GenreRepository
+
+    @instrumented
+    def execute(self, request: ListGenreRequest | None = None) -> ListGenreResponse:
+        request = request or ListGenreRequest()
+        if request.categories:
+            genres = self.repository.list_by_category(request.categories, match_all=request.match_all)
+        else:
+            genres = self.repository.list()
+
+        return ListGenreResponse(data=[
+            GetGenreResponse(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories=genre.categories
+            ) for genre in genres
+        ])
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core._shared.metrics import instrumented
+from src.core.genre.domain import GenreProjection, GenreRepository
+
+
+DEFAULT_CHUNK_SIZE = 2000
+
+@dataclass
+class StreamGenreRequest:
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+
+@dataclass
+class StreamGenreResponse:
+    data: Iterator[GenreProjection]
+
+@dataclass
+class StreamGenre:
+    repository: GenreRepository
+
+    @instrumented
+    def execute(self, request: StreamGenreRequest | None = None) -> StreamGenreResponse:
+        request = request or StreamGenreRequest()
+        return StreamGenreResponse(
+            data=self.repository.iter_all(chunk_size=max(request.chunk_size, 1))
+        )
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.metrics import instrumented
+from src.core.category.domain import CategoryRepository
+from src.core.genre.domain import GenreRepository
+from ..exceptions import GenreNotFound, InvalidGenre, RelatedCategoriesNotFound
+
+
+@dataclass
+class UpdateGenreRequest:
+    id: UUID
+    name: str | None = None
+    is_active: bool | None = None
+    categories: set[UUID] | None = None
+
+@dataclass
+class UpdateGenre:
+    repository: GenreRepository
+    category_repository: CategoryRepository
+
+    @instrumented
+    def execute(self, request: UpdateGenreRequest) -> None:
+        genre = self.repository.get_by_id(request.id)
+        if genre is None:
+            raise GenreNotFound(f"Genre with id {request.id} not found")
+
+        try:
+            if request.name is not None:
+                genre.change_name(request.name)
+
+            if request.is_active is True:
+                genre.activate()
+            elif request.is_active is False:
+                genre.deactivate()
+        except ValueError as e:
+            raise InvalidGenre(e)
+
+        if request.categories is not None:
+            categories = set(request.categories)
+            missing = categories - self.category_repository.exists_many(categories)
+            if missing:
+                raise RelatedCategoriesNotFound(
+                    f"Categories with provided IDs not found: {', '.join(sorted(map(str, missing)))}"
+                )
+
+            genre.replace_categories(categories)
+
+        self.repository.update(genre)
@@ -1 +1,3 @@
 from .genre import Genre
+from .genre_projection import GenreProjection
+from .genre_repository import GenreRepository
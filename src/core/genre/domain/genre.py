@@ -1,5 +1,6 @@
 from uuid import UUID, uuid4
 from dataclasses import dataclass, field
+from typing import Iterable
 
 
 @dataclass
@@ -8,6 +9,7 @@ class Genre:
     is_active: bool = True
     categories: set[UUID] = field(default_factory=set)
     id: UUID = field(default_factory=uuid4)
+    _persisted_categories: frozenset[UUID] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         self.validate()
@@ -49,10 +51,43 @@ class Genre:
         self.is_active = False
         self.validate()
 
+    @property
+    def persisted_categories(self) -> frozenset[UUID] | None:
+        """
+        Category ids as last loaded or written by a repository, or None for
+        a genre that has not been through one yet.
+        """
+        return self._persisted_categories
+
+    @property
+    def added_categories(self) -> set[UUID]:
+        return self.categories - (self._persisted_categories or frozenset())
+
+    @property
+    def removed_categories(self) -> set[UUID]:
+        return (self._persisted_categories or frozenset()) - self.categories
+
+    def clear_category_changes(self):
+        self._persisted_categories = frozenset(self.categories)
+
     def add_category(self, category_id: UUID):
-        self.categories.add(category_id)
-        self.validate()
+        self.add_categories([category_id])
 
     def remove_category(self, category_id: UUID):
-        self.categories.remove(category_id)
+        if category_id not in self.categories:
+            raise KeyError(category_id)
+
+        self.remove_categories([category_id])
+
+    def add_categories(self, category_ids: Iterable[UUID]):
+        self.categories |= set(category_ids)
+        self.validate()
+
+    def remove_categories(self, category_ids: Iterable[UUID]):
+        """Ids the genre does not have are ignored."""
+        self.categories -= set(category_ids)
+        self.validate()
+
+    def replace_categories(self, category_ids: Iterable[UUID]):
+        self.categories = set(category_ids)
         self.validate()
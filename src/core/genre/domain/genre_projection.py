@@ -0,0 +1,24 @@
+from typing import NamedTuple
+from uuid import UUID
+
+from .genre import Genre
+
+
+class GenreProjection(NamedTuple):
+    """
+    Read-only view of a stored genre and its category ids (sorted), used on
+    the export path. Built straight from storage rows, never re-validated.
+    """
+    id: UUID
+    name: str
+    is_active: bool
+    categories: tuple[UUID, ...] = ()
+
+    @classmethod
+    def from_genre(cls, genre: Genre) -> "GenreProjection":
+        return cls(
+            id=genre.id,
+            name=genre.name,
+            is_active=genre.is_active,
+            categories=tuple(sorted(genre.categories))
+        )
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+from uuid import UUID
+
+from .genre import Genre
+from .genre_projection import GenreProjection
+
+
+class GenreRepository(ABC):
+
+    @abstractmethod
+    def save(self, genre: Genre) -> None:
+        raise NotImplementedError('Should implement method: save')
+
+    @abstractmethod
+    def get_by_id(self, id: UUID) -> Genre | None:
+        raise NotImplementedError('Should implement method: get_by_id')
+
+    @abstractmethod
+    def update(self, genre: Genre) -> int:
+        raise NotImplementedError('Should implement method: update')
+
+    @abstractmethod
+    def delete(self, id: UUID) -> int:
+        raise NotImplementedError('Should implement method: delete')
+
+    @abstractmethod
+    def list_by_category(self, category_ids: set[UUID], match_all: bool = False) -> list[Genre]:
+        raise NotImplementedError('Should implement method: list_by_category')
+
+    @abstractmethod
+    def find_unused_categories(self, category_ids: Iterable[UUID]) -> set[UUID]:
+        raise NotImplementedError('Should implement method: find_unused_categories')
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int) -> Iterator[GenreProjection]:
+        raise NotImplementedError('Should implement method: iter_all')
+
+    @abstractmethod
+    def list(self) -> list[Genre]:
+        raise NotImplementedError('Should implement method: list')
@@ -0,0 +1 @@
+from .in_memory_genre_repository import InMemoryGenreRepository
@@ -0,0 +1,92 @@
+from collections import defaultdict
+from copy import copy
+from typing import Iterable, Iterator
+from uuid import UUID
+
+from src.core.genre.domain import Genre, GenreProjection, GenreRepository
+
+
+class InMemoryGenreRepository(GenreRepository):
+    """
+    GenreRepository kept in process memory. Genres are copied on the way in
+    and out, category sets included, so callers never share state with it.
+    Written genres have their category changes cleared, as if persisted.
+    A category -> genre ids index answers the by-category queries.
+    """
+
+    def __init__(self, genres: list[Genre] | None = None):
+        self._by_id: dict[UUID, Genre] = {}
+        self._by_category: defaultdict[UUID, set[UUID]] = defaultdict(set)
+
+        for genre in genres or []:
+            self.save(genre)
+
+    def save(self, genre: Genre) -> None:
+        self._store(genre)
+        genre.clear_category_changes()
+
+    def get_by_id(self, id: UUID) -> Genre | None:
+        genre = self._by_id.get(id)
+        return _copy(genre) if genre is not None else None
+
+    def update(self, genre: Genre) -> int:
+        if genre.id not in self._by_id:
+            return 0
+
+        self._store(genre)
+        genre.clear_category_changes()
+        return 1
+
+    def delete(self, id: UUID) -> int:
+        genre = self._by_id.pop(id, None)
+        if genre is None:
+            return 0
+
+        self._unindex(genre)
+        return 1
+
+    def list_by_category(self, category_ids: set[UUID], match_all: bool = False) -> list[Genre]:
+        matches = [self._by_category.get(category_id, set()) for category_id in category_ids]
+        if not matches:
+            return []
+
+        genre_ids = set.intersection(*matches) if match_all else set.union(*matches)
+        return self._sorted(self._by_id[id] for id in genre_ids)
+
+    def find_unused_categories(self, category_ids: Iterable[UUID]) -> set[UUID]:
+        return {category_id for category_id in category_ids if not self._by_category.get(category_id)}
+
+    def iter_all(self, chunk_size: int) -> Iterator[GenreProjection]:
+        ids = sorted(self._by_id)
+        for start in range(0, len(ids), chunk_size):
+            chunk = [self._by_id.get(id) for id in ids[start:start + chunk_size]]
+            yield from (GenreProjection.from_genre(genre) for genre in chunk if genre is not None)
+
+    def _store(self, genre: Genre) -> None:
+        previous = self._by_id.get(genre.id)
+        if previous is not None:
+            self._unindex(previous)
+
+        stored = self._by_id[genre.id] = _copy(genre)
+        for category_id in stored.categories:
+            self._by_category[category_id].add(stored.id)
+
+    def _unindex(self, genre: Genre) -> None:
+        for category_id in genre.categories:
+            genre_ids = self._by_category[category_id]
+            genre_ids.discard(genre.id)
+            if not genre_ids:
+                del self._by_category[category_id]
+
+    def _sorted(self, genres: Iterable[Genre]) -> list[Genre]:
+        return [_copy(genre) for genre in sorted(genres, key=lambda genre: (genre.name, genre.id))]
+
+    def list(self) -> list[Genre]:
+        return self._sorted(self._by_id.values())
+
+
+def _copy(genre: Genre) -> Genre:
+    duplicate = copy(genre)
+    duplicate.categories = set(genre.categories)
+    duplicate.clear_category_changes()
+    return duplicate
@@ -0,0 +1,60 @@
+from unittest.mock import create_autospec
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.category.domain import Category, CategoryRepository
+from src.core.category.infra import InMemoryCategoryRepository
+from src.core.genre.application.exceptions import InvalidGenre, RelatedCategoriesNotFound
+from src.core.genre.application.usecases import CreateGenre, CreateGenreRequest
+from src.core.genre.domain import GenreRepository
+
+
+class TestCreateGenre:
+    @pytest.fixture
+    def movie(self) -> Category:
+        return Category(name="Movie")
+
+    @pytest.fixture
+    def category_repository(self, movie: Category) -> CategoryRepository:
+        return InMemoryCategoryRepository([movie])
+
+    @pytest.fixture
+    def mock_repository(self) -> GenreRepository:
+        return create_autospec(GenreRepository, instance=True)
+
+    def test_create_genre_with_existing_categories(
+        self,
+        mock_repository: GenreRepository,
+        category_repository: CategoryRepository,
+        movie: Category
+    ):
+        use_case = CreateGenre(repository=mock_repository, category_repository=category_repository)
+
+        response = use_case.execute(CreateGenreRequest(name="Drama", categories={movie.id}))
+
+        assert isinstance(response.id, UUID)
+        genre = mock_repository.save.call_args.args[0]
+        assert (genre.id, genre.name, genre.is_active, genre.categories) == (response.id, "Drama", True, {movie.id})
+
+    def test_reject_unknown_categories(
+        self,
+        mock_repository: GenreRepository,
+        category_repository: CategoryRepository,
+        movie: Category
+    ):
+        missing = uuid4()
+        use_case = CreateGenre(repository=mock_repository, category_repository=category_repository)
+
+        with pytest.raises(RelatedCategoriesNotFound, match=str(missing)):
+            use_case.execute(CreateGenreRequest(name="Drama", categories={movie.id, missing}))
+
+        mock_repository.save.assert_not_called()
+
+    def test_reject_invalid_genre(self, mock_repository: GenreRepository, category_repository: CategoryRepository):
+        use_case = CreateGenre(repository=mock_repository, category_repository=category_repository)
+
+        with pytest.raises(InvalidGenre, match="name can not be empty or null"):
+            use_case.execute(CreateGenreRequest(name=""))
+
+        mock_repository.save.assert_not_called()
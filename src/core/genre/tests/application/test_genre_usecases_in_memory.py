@@ -0,0 +1,62 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.domain import Category
+from src.core.category.infra import InMemoryCategoryRepository
+from src.core.genre.application.exceptions import GenreNotFound
+from src.core.genre.application.usecases import (
+    CreateGenre,
+    CreateGenreRequest,
+    DeleteGenre,
+    DeleteGenreRequest,
+    GetGenre,
+    GetGenreRequest,
+    GetGenreResponse,
+    ListGenre,
+    ListGenreRequest
+)
+from src.core.genre.domain import Genre
+from src.core.genre.infra import InMemoryGenreRepository
+
+
+class TestGenreUseCasesWithInMemoryRepository:
+    def test_create_get_list_and_delete_genre(self):
+        movie = Category(name="Movie")
+        repository = InMemoryGenreRepository()
+        category_repository = InMemoryCategoryRepository([movie])
+
+        created = CreateGenre(repository, category_repository).execute(
+            CreateGenreRequest(name="Drama", categories={movie.id})
+        )
+        CreateGenre(repository, category_repository).execute(CreateGenreRequest(name="Action"))
+
+        assert GetGenre(repository).execute(GetGenreRequest(id=created.id)) == GetGenreResponse(
+            id=created.id,
+            name="Drama",
+            is_active=True,
+            categories={movie.id}
+        )
+        assert [genre.name for genre in ListGenre(repository).execute().data] == ["Action", "Drama"]
+
+        DeleteGenre(repository).execute(DeleteGenreRequest(id=created.id))
+
+        with pytest.raises(GenreNotFound):
+            GetGenre(repository).execute(GetGenreRequest(id=created.id))
+        with pytest.raises(GenreNotFound):
+            DeleteGenre(repository).execute(DeleteGenreRequest(id=uuid4()))
+
+    def test_list_genres_by_category(self):
+        movie, series = uuid4(), uuid4()
+        repository = InMemoryGenreRepository([
+            Genre(name="Drama", categories={movie, series}),
+            Genre(name="Action", categories={movie}),
+            Genre(name="Comedy"),
+        ])
+
+        def names(request: ListGenreRequest) -> list[str]:
+            return [genre.name for genre in ListGenre(repository).execute(request).data]
+
+        assert names(ListGenreRequest(categories={movie, series})) == ["Action", "Drama"]
+        assert names(ListGenreRequest(categories={movie, series}, match_all=True)) == ["Drama"]
+        assert names(ListGenreRequest()) == ["Action", "Comedy", "Drama"]
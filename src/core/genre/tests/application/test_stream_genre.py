@@ -0,0 +1,24 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core.genre.application.usecases import StreamGenre, StreamGenreRequest
+from src.core.genre.domain import Genre, GenreProjection, GenreRepository
+
+
+class TestStreamGenre:
+    @pytest.fixture
+    def mock_repository(self) -> GenreRepository:
+        return create_autospec(GenreRepository, instance=True)
+
+    def test_should_StreamGenre_return_repository_iterator_untouched(
+        self,
+        mock_repository: GenreRepository
+    ):
+        rows = iter([GenreProjection.from_genre(Genre(name="Drama"))])
+        mock_repository.iter_all.return_value = rows
+
+        response = StreamGenre(repository=mock_repository).execute(StreamGenreRequest(chunk_size=0))
+
+        mock_repository.iter_all.assert_called_once_with(chunk_size=1)
+        assert response.data is rows
@@ -0,0 +1,53 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.domain import Category
+from src.core.category.infra import InMemoryCategoryRepository
+from src.core.genre.application.exceptions import GenreNotFound, InvalidGenre, RelatedCategoriesNotFound
+from src.core.genre.application.usecases import UpdateGenre, UpdateGenreRequest
+from src.core.genre.domain import Genre
+from src.core.genre.infra import InMemoryGenreRepository
+
+
+class TestUpdateGenre:
+    @pytest.fixture
+    def movie(self) -> Category:
+        return Category(name="Movie")
+
+    @pytest.fixture
+    def genre(self, movie: Category) -> Genre:
+        return Genre(name="Drama", categories={movie.id})
+
+    @pytest.fixture
+    def use_case(self, genre: Genre, movie: Category) -> UpdateGenre:
+        return UpdateGenre(
+            repository=InMemoryGenreRepository([genre]),
+            category_repository=InMemoryCategoryRepository([movie])
+        )
+
+    def test_update_only_the_given_fields(self, use_case: UpdateGenre, genre: Genre, movie: Category):
+        use_case.execute(UpdateGenreRequest(id=genre.id, is_active=False))
+
+        updated = use_case.repository.get_by_id(genre.id)
+        assert (updated.name, updated.is_active, updated.categories) == ("Drama", False, {movie.id})
+
+    def test_replace_categories(self, use_case: UpdateGenre, genre: Genre):
+        use_case.execute(UpdateGenreRequest(id=genre.id, name="Comedy", categories=set()))
+
+        updated = use_case.repository.get_by_id(genre.id)
+        assert (updated.name, updated.categories) == ("Comedy", set())
+
+    def test_reject_unknown_categories(self, use_case: UpdateGenre, genre: Genre, movie: Category):
+        with pytest.raises(RelatedCategoriesNotFound):
+            use_case.execute(UpdateGenreRequest(id=genre.id, categories={movie.id, uuid4()}))
+
+        assert use_case.repository.get_by_id(genre.id).categories == {movie.id}
+
+    def test_reject_invalid_name(self, use_case: UpdateGenre, genre: Genre):
+        with pytest.raises(InvalidGenre):
+            use_case.execute(UpdateGenreRequest(id=genre.id, name=""))
+
+    def test_raise_when_genre_does_not_exist(self, use_case: UpdateGenre):
+        with pytest.raises(GenreNotFound):
+            use_case.execute(UpdateGenreRequest(id=uuid4(), name="Comedy"))
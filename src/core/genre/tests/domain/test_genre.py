@@ -203,4 +203,53 @@ class TestRemoveCategory:
 
         assert self.category_id in genre.categories
         genre.remove_category(self.category_id)
-        assert self.category_id not in genre.categories
\ No newline at end of file
+        assert self.category_id not in genre.categories
+
+
+class TestBulkCategoryChanges:
+    def test_add_and_remove_many_categories(self):
+        first, second, third = uuid4(), uuid4(), uuid4()
+        genre = Genre(name="Drama", categories={first})
+
+        genre.add_categories([second, third])
+        genre.remove_categories([first, uuid4()])
+
+        assert genre.categories == {second, third}
+
+    def test_replace_categories(self):
+        genre = Genre(name="Drama", categories={uuid4()})
+        categories = {uuid4(), uuid4()}
+
+        genre.replace_categories(categories)
+
+        assert genre.categories == categories
+
+    def test_remove_category_that_is_not_in_genre_raises_KeyError(self):
+        with pytest.raises(KeyError):
+            Genre(name="Drama").remove_category(uuid4())
+
+    def test_new_genre_has_no_persisted_categories(self):
+        category_id = uuid4()
+        genre = Genre(name="Drama", categories={category_id})
+
+        assert genre.persisted_categories is None
+        assert genre.added_categories == {category_id}
+        assert genre.removed_categories == set()
+
+    def test_track_changes_since_last_clear(self):
+        kept, removed, added = uuid4(), uuid4(), uuid4()
+        genre = Genre(name="Drama", categories={kept, removed})
+        genre.clear_category_changes()
+
+        genre.add_categories([added, kept])
+        genre.remove_category(removed)
+
+        assert genre.persisted_categories == {kept, removed}
+        assert genre.added_categories == {added}
+        assert genre.removed_categories == {removed}
+
+        genre.replace_categories([kept, removed])
+        assert (genre.added_categories, genre.removed_categories) == (set(), set())
+
+        genre.clear_category_changes()
+        assert genre.persisted_categories == {kept, removed}
@@ -0,0 +1,79 @@
+from inspect import isabstract
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.genre.domain import Genre, GenreRepository
+
+
+class TestGenreRepository:
+    @pytest.fixture
+    def genre(self) -> Genre:
+        return Genre(name="Drama")
+
+    @pytest.fixture
+    @patch.multiple(GenreRepository, __abstractmethods__=set())
+    def genre_repository(self) -> GenreRepository:
+        return GenreRepository()
+
+    def test_should_GenreRepository_is_an_abstract_class(self):
+        assert isabstract(GenreRepository)
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_save_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository,
+        genre: Genre
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: save'):
+            genre_repository.save(genre)
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_get_by_id_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: get_by_id'):
+            genre_repository.get_by_id(uuid4())
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_update_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository,
+        genre: Genre
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: update'):
+            genre_repository.update(genre)
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_delete_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: delete'):
+            genre_repository.delete(uuid4())
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_list_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: list'):
+            genre_repository.list()
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_list_by_category_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: list_by_category'):
+            genre_repository.list_by_category({uuid4()})
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_find_unused_categories_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: find_unused_categories'):
+            genre_repository.find_unused_categories([uuid4()])
+
+    def test_should_GenreRepository_raise_a_NotImplementedError_if_iter_all_method_is_not_implemented(
+        self,
+        genre_repository: GenreRepository
+    ):
+        with pytest.raises(NotImplementedError, match='Should implement method: iter_all'):
+            genre_repository.iter_all(chunk_size=10)
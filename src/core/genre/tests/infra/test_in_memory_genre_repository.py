@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+from src.core.genre.domain import Genre, GenreProjection
+from src.core.genre.infra import InMemoryGenreRepository
+
+
+class TestInMemoryGenreRepository:
+    def test_save_and_get_by_id_copy_the_genre(self):
+        genre = Genre(name="Drama", categories={uuid4()})
+        repository = InMemoryGenreRepository()
+
+        repository.save(genre)
+        genre.categories.add(uuid4())
+        stored = repository.get_by_id(genre.id)
+        stored.categories.clear()
+
+        assert len(repository.get_by_id(genre.id).categories) == 1
+
+    def test_get_by_id_returns_none_for_unknown_id(self):
+        assert InMemoryGenreRepository().get_by_id(uuid4()) is None
+
+    def test_update_and_delete_return_affected_rows(self):
+        genre = Genre(name="Drama")
+        repository = InMemoryGenreRepository([genre])
+
+        genre.change_name("Comedy")
+        assert repository.update(genre) == 1
+        assert repository.get_by_id(genre.id).name == "Comedy"
+        assert repository.update(Genre(name="Missing")) == 0
+
+        assert repository.delete(genre.id) == 1
+        assert repository.delete(genre.id) == 0
+
+    def test_iter_all_yields_projections_in_id_order(self):
+        first, second = uuid4(), uuid4()
+        genres = [Genre(name="Drama", categories={second, first}), Genre(name="Action"), Genre(name="Comedy")]
+        repository = InMemoryGenreRepository(genres)
+
+        assert list(repository.iter_all(chunk_size=2)) == sorted(
+            GenreProjection(id=genre.id, name=genre.name, is_active=True, categories=tuple(sorted(genre.categories)))
+            for genre in genres
+        )
+
+    def test_list_is_sorted_by_name(self):
+        drama, action = Genre(name="Drama"), Genre(name="Action")
+        repository = InMemoryGenreRepository([drama, action])
+
+        assert [genre.name for genre in repository.list()] == ["Action", "Drama"]
+
+    def test_written_and_loaded_genres_have_no_pending_category_changes(self):
+        genre = Genre(name="Drama", categories={uuid4()})
+        repository = InMemoryGenreRepository()
+
+        repository.save(genre)
+        stored = repository.get_by_id(genre.id)
+
+        assert genre.persisted_categories == genre.categories
+        assert stored.persisted_categories == stored.categories
+        stored.add_category(uuid4())
+        repository.update(stored)
+        assert stored.added_categories == set()
+
+    def test_list_by_category_follows_updates_and_deletes(self):
+        movie, series = uuid4(), uuid4()
+        drama = Genre(name="Drama", categories={movie, series})
+        action = Genre(name="Action", categories={movie})
+        repository = InMemoryGenreRepository([drama, action])
+
+        assert repository.list_by_category({movie}) == [action, drama]
+        assert repository.list_by_category({movie, series}, match_all=True) == [drama]
+        assert repository.list_by_category(set()) == []
+
+        drama.remove_category(movie)
+        repository.update(drama)
+        repository.delete(action.id)
+
+        assert repository.list_by_category({movie}) == []
+        assert repository.list_by_category({series}) == [drama]
+        assert repository.find_unused_categories([movie, series]) == {movie}
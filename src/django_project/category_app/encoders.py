@@ -0,0 +1,39 @@
+"""
+JSON writers for the category response shapes.
+
+They produce exactly the bytes JSONRenderer produces for the matching
+serializers (compact separators, non-ASCII kept as is), but format each
+row with a single string template instead of walking a serializer tree.
+"""
+from json.encoder import encode_basestring
+
+from src.core.category.application.usecases import GetCategoryResponse, ListCategoryResponse
+from src.core.category.domain import CategoryProjection
+
+
+def encode_category(category: CategoryProjection | GetCategoryResponse) -> str:
+    return '{"id":"%s","name":%s,"description":%s,"is_active":%s,"genre_count":%d}' % (
+        category.id,
+        encode_basestring(str(category.name)),
+        encode_basestring(str(category.description)),
+        "true" if category.is_active else "false",
+        category.genre_count
+    )
+
+
+def encode_list_category_response(response: ListCategoryResponse) -> bytes:
+    next_cursor = response.meta.next_cursor
+    return _to_bytes('{"data":[%s],"meta":{"next_cursor":%s,"page_size":%d}}' % (
+        ",".join(map(encode_category, response.data)),
+        "null" if next_cursor is None else encode_basestring(str(next_cursor)),
+        response.meta.page_size
+    ))
+
+
+def encode_get_category_response(response: GetCategoryResponse) -> bytes:
+    return _to_bytes('{"data":%s}' % encode_category(response))
+
+
+def _to_bytes(content: str) -> bytes:
+    # Same escaping JSONRenderer applies so the output stays valid JavaScript.
+    return content.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
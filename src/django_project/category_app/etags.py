@@ -0,0 +1,47 @@
+import zlib
+
+
+def category_etag(version: int, media_type: str) -> str:
+    # JSON, indented JSON and the browsable API are different bytes for the
+    # same version, so each gets its own strong tag; If-Match only reads the
+    # version in front of the suffix.
+    return f'"{version}-{_media_type_tag(media_type)}"'
+
+
+def parse_if_match(header: str | None) -> int | None:
+    if header is None or header.strip() == "*":
+        return None
+
+    value = header.strip()
+    if value.startswith("W/"):
+        raise ValueError("weak entity tags cannot be used with If-Match")
+
+    if len(value) < 3 or value[0] != '"' or value[-1] != '"':
+        raise ValueError(f"invalid entity tag: {header}")
+
+    version, _, suffix = value[1:-1].partition("-")
+    if not version.isdigit() or (suffix and not _is_media_type_tag(suffix)):
+        raise ValueError(f"invalid entity tag: {header}")
+
+    return int(version)
+
+
+def category_list_etag(revision: str, media_type: str) -> str:
+    return f'"list-{revision}-{_media_type_tag(media_type)}"'
+
+
+def _media_type_tag(media_type: str) -> str:
+    return f"{zlib.crc32(media_type.encode()):08x}"
+
+
+def _is_media_type_tag(value: str) -> bool:
+    return len(value) == 8 and all(char in "0123456789abcdef" for char in value)
+
+
+def if_none_match_matches(header: str | None, etag: str) -> bool:
+    # If-None-Match uses the weak comparison: W/ prefixes are ignored.
+    if header is None:
+        return False
+
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
@@ -0,0 +1,123 @@
+import csv
+import zlib
+from io import StringIO
+from json.encoder import encode_basestring
+from typing import Iterable, Iterator
+
+from src.core.category.domain import CategoryProjection
+from src.core.genre.domain import GenreProjection
+from .importing import CSV, FORMATS, NDJSON
+
+
+CONTENT_TYPES = {CSV: "text/csv; charset=utf-8", NDJSON: "application/x-ndjson"}
+CSV_HEADER = ("id", "name", "description", "is_active")
+GENRE_CSV_HEADER = ("id", "name", "is_active", "categories")
+FLUSH_SIZE = 64 * 1024
+
+
+def export_categories(
+    categories: Iterable[CategoryProjection],
+    format: str,
+    compress: bool = False
+) -> Iterator[bytes]:
+    """
+    Encode categories as CSV or NDJSON, yielding about FLUSH_SIZE bytes at
+    a time. With compress the chunks form one gzip member, compressed as it
+    is written. Only the current chunk is ever held in memory.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unknown format {format!r}, expected one of {', '.join(FORMATS)}")
+
+    if format == CSV:
+        chunks = _csv_chunks(CSV_HEADER, (
+            (category.id, category.name, category.description, _boolean(category.is_active))
+            for category in categories
+        ))
+    else:
+        chunks = _ndjson_chunks(_ndjson_record(category) for category in categories)
+
+    return _gzipped(chunks) if compress else chunks
+
+
+def export_genres(
+    genres: Iterable[GenreProjection],
+    format: str,
+    compress: bool = False
+) -> Iterator[bytes]:
+    """
+    Encode genres with their category ids like export_categories. CSV puts
+    the category ids in one space-separated column; NDJSON as a list.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unknown format {format!r}, expected one of {', '.join(FORMATS)}")
+
+    if format == CSV:
+        chunks = _csv_chunks(GENRE_CSV_HEADER, (
+            (genre.id, genre.name, _boolean(genre.is_active), " ".join(map(str, genre.categories)))
+            for genre in genres
+        ))
+    else:
+        chunks = _ndjson_chunks(_ndjson_genre_record(genre) for genre in genres)
+
+    return _gzipped(chunks) if compress else chunks
+
+
+def _ndjson_chunks(records: Iterable[str]) -> Iterator[bytes]:
+    lines, size = [], 0
+    for line in records:
+        lines.append(line)
+        size += len(line) + 1
+        if size >= FLUSH_SIZE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines, size = [], 0
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def _ndjson_record(category: CategoryProjection) -> str:
+    # The fields import_categories reads back; derived ones such as
+    # genre_count are left out.
+    return '{"id":"%s","name":%s,"description":%s,"is_active":%s}' % (
+        category.id,
+        encode_basestring(str(category.name)),
+        encode_basestring(str(category.description)),
+        _boolean(category.is_active)
+    )
+
+
+def _ndjson_genre_record(genre: GenreProjection) -> str:
+    return '{"id":"%s","name":%s,"is_active":%s,"categories":[%s]}' % (
+        genre.id,
+        encode_basestring(str(genre.name)),
+        _boolean(genre.is_active),
+        ",".join(f'"{category_id}"' for category_id in genre.categories)
+    )
+
+
+def _boolean(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _csv_chunks(header: tuple[str, ...], rows: Iterable[tuple]) -> Iterator[bytes]:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= FLUSH_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _gzipped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+
+    yield compressor.flush()
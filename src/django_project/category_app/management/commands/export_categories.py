@@ -0,0 +1,78 @@
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.core.category.application.usecases import StreamCategory, StreamCategoryRequest
+from src.core.genre.application.usecases import StreamGenre, StreamGenreRequest
+from django_project.category_app.exporting import export_categories, export_genres
+from django_project.category_app.importing import FORMATS, NDJSON, format_from_name
+from django_project.category_app.repository import DjangoORMCategoryRepository
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+CATEGORIES, GENRES = "categories", "genres"
+
+
+class Command(BaseCommand):
+    help = (
+        "Export every category, or every genre with its category ids, as "
+        "NDJSON or CSV, optionally gzip-compressed. "
+        "Rows are read in --chunk-size chunks from a server-side cursor and "
+        "written as they arrive, so memory stays flat whatever the table size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--entity", choices=(CATEGORIES, GENRES), default=CATEGORIES)
+        parser.add_argument("--output", "-o", type=Path, help="file to write; defaults to stdout")
+        parser.add_argument("--format", choices=FORMATS, help="defaults to the output extension, then ndjson")
+        parser.add_argument("--gzip", action="store_true", help="compress; implied by a .gz output")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(
+        self,
+        *args,
+        entity: str,
+        output: Path | None,
+        format: str | None,
+        gzip: bool,
+        chunk_size: int,
+        **options
+    ):
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be >= 1")
+
+        compress = gzip or (output is not None and output.suffix == ".gz")
+        if format is None and output is not None:
+            format = format_from_name(output.name.removesuffix(".gz"))
+        format = format or NDJSON
+
+        if entity == GENRES:
+            rows = StreamGenre(repository=DjangoORMGenreRepository()).execute(
+                StreamGenreRequest(chunk_size=chunk_size)
+            ).data
+            chunks = export_genres(rows, format, compress=compress)
+        else:
+            rows = StreamCategory(repository=DjangoORMCategoryRepository()).execute(
+                StreamCategoryRequest(chunk_size=chunk_size)
+            ).data
+            chunks = export_categories(rows, format, compress=compress)
+
+        started = time.perf_counter()
+        written = 0
+        file = output.open("wb") if output is not None else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                file.write(chunk)
+                written += len(chunk)
+        finally:
+            if output is not None:
+                file.close()
+            else:
+                file.flush()
+
+        if output is not None:
+            self.stdout.write(self.style.SUCCESS(
+                f"Wrote {written:,} bytes to {output} in {time.perf_counter() - started:.1f}s"
+            ))
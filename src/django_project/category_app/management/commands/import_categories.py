@@ -0,0 +1,94 @@
+import os
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_project.category_app.importing import (
+    FORMATS,
+    Checkpoint,
+    CategoryImporter,
+    format_from_name,
+    iter_records
+)
+from django_project.category_app.repository import DjangoORMCategoryRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Import categories from a CSV (id, name, description, is_active) or "
+        "NDJSON file. The file is read as a stream and validated in --workers "
+        "processes; each --batch-size batch is inserted in one transaction. "
+        "Progress is kept in a checkpoint file so a failed import resumes "
+        "where it stopped, and invalid rows are written to a reject file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--format", choices=FORMATS, help="defaults to the file extension")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--checkpoint", type=Path, help="defaults to PATH.checkpoint")
+        parser.add_argument("--rejects", type=Path, help="defaults to PATH.rejects.ndjson")
+        parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+
+    def handle(
+        self,
+        *args,
+        path: Path,
+        format: str | None,
+        batch_size: int,
+        workers: int,
+        checkpoint: Path | None,
+        rejects: Path | None,
+        restart: bool,
+        **options
+    ):
+        if batch_size < 1 or workers < 1:
+            raise CommandError("--batch-size and --workers must be >= 1")
+        if not path.is_file():
+            raise CommandError(f"{path} does not exist")
+
+        format = format or format_from_name(path.name)
+        if format not in FORMATS:
+            raise CommandError(f"cannot tell the format of {path}, pass --format")
+
+        checkpoint_path = checkpoint or path.with_name(path.name + ".checkpoint")
+        rejects_path = rejects or path.with_name(path.name + ".rejects.ndjson")
+
+        progress = None if restart else Checkpoint.load(checkpoint_path)
+        if progress is None:
+            progress = Checkpoint()
+            rejects_path.write_text("")
+        else:
+            self.stdout.write(f"Resuming after record {progress.records}")
+            rejects_path.touch()
+
+        started = time.perf_counter()
+        with path.open(newline="", encoding="utf-8") as file, rejects_path.open("r+", encoding="utf-8") as reject_file:
+            # Drop reject lines written after the last checkpoint; their
+            # batch is replayed and rejects them again.
+            reject_file.truncate(progress.rejects_offset)
+            reject_file.seek(progress.rejects_offset)
+
+            progress = CategoryImporter(
+                repository=DjangoORMCategoryRepository(),
+                batch_size=batch_size,
+                workers=workers
+            ).run(
+                iter_records(file, format),
+                checkpoint=progress,
+                checkpoint_path=checkpoint_path,
+                rejects=reject_file
+            )
+        elapsed = time.perf_counter() - started
+
+        checkpoint_path.unlink(missing_ok=True)
+        if not progress.rejected:
+            rejects_path.unlink(missing_ok=True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {progress.imported} categories, rejected {progress.rejected} in {elapsed:.1f}s"
+        ))
+        if progress.rejected:
+            self.stdout.write(self.style.WARNING(f"Rejected records were written to {rejects_path}"))
@@ -0,0 +1,196 @@
+import os
+import time
+from contextlib import contextmanager
+from functools import partial
+from multiprocessing import Pool
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from django_project.category_app.models import Category as CategoryModel
+from django_project.category_app.seeding import generate_category_rows, generate_genre_rows
+from django_project.genre_app.models import Genre as GenreModel, GenreCategory
+
+
+class Command(BaseCommand):
+    help = (
+        "Insert COUNT generated categories and --genres genres linked to "
+        "--categories-per-genre of them. The same --seed always produces "
+        "the same rows; generation runs in --workers processes while the "
+        "main process inserts one --batch-size transaction at a time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("count", type=int)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=50_000)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--genres", type=int, default=0)
+        parser.add_argument("--categories-per-genre", type=int, default=3)
+        parser.add_argument(
+            "--keep-indexes",
+            action="store_true",
+            help="insert with the secondary indexes in place instead of rebuilding them at the end"
+        )
+
+    def handle(
+        self,
+        *args,
+        count: int,
+        seed: int,
+        batch_size: int,
+        workers: int,
+        genres: int,
+        categories_per_genre: int,
+        keep_indexes: bool,
+        **options
+    ):
+        if count < 0 or genres < 0 or categories_per_genre < 0 or batch_size < 1 or workers < 1:
+            raise CommandError(
+                "count, --genres and --categories-per-genre must be >= 0, --batch-size and --workers >= 1"
+            )
+
+        native_uuid = connection.features.has_native_uuid_field
+        generate = partial(
+            _generate_chunk,
+            seed=seed,
+            native_uuid=native_uuid,
+            updated_at=connection.ops.adapt_datetimefield_value(timezone.now())
+        )
+        generate_genres = partial(
+            _generate_genre_chunk,
+            seed=seed,
+            native_uuid=native_uuid,
+            category_count=count,
+            categories_per_genre=categories_per_genre
+        )
+        # Links refer to categories by position; only kept when needed.
+        category_ids = [] if genres else None
+        linked = 0
+
+        started = time.perf_counter()
+        with _fast_sqlite_writes(), _indexes_rebuilt_after(enabled=not keep_indexes):
+            with Pool(workers) as pool:
+                for rows in pool.imap(generate, _chunks(count, batch_size)):
+                    with transaction.atomic(), connection.cursor() as cursor:
+                        cursor.executemany(_insert_sql(CategoryModel, CATEGORY_FIELDS), rows)
+                    if category_ids is not None:
+                        category_ids.extend(row[0] for row in rows)
+
+                for rows, links in pool.imap(generate_genres, _chunks(genres, batch_size)):
+                    with transaction.atomic(), connection.cursor() as cursor:
+                        cursor.executemany(_insert_sql(GenreModel, GENRE_FIELDS), rows)
+                        cursor.executemany(
+                            _insert_sql(GenreCategory, LINK_FIELDS),
+                            [(genre_id, category_ids[index]) for genre_id, index in links]
+                        )
+                    linked += len(links)
+
+        if linked:
+            _count_genres()
+        elapsed = time.perf_counter() - started
+
+        rows = count + genres + linked
+        self.stdout.write(self.style.SUCCESS(
+            f"Inserted {count} categories, {genres} genres and {linked} links in {elapsed:.1f}s "
+            f"({rows / elapsed if elapsed else 0:,.0f} rows/s)"
+        ))
+
+
+CATEGORY_FIELDS = ("id", "name", "description", "is_active", "version", "updated_at")
+GENRE_FIELDS = ("id", "name", "is_active")
+LINK_FIELDS = ("genre", "category")
+
+
+def _chunks(count: int, batch_size: int) -> list[tuple[int, int]]:
+    return [
+        (chunk, min(batch_size, count - start))
+        for chunk, start in enumerate(range(0, count, batch_size))
+    ]
+
+
+def _generate_chunk(chunk: tuple[int, int], seed: int, native_uuid: bool, updated_at) -> list[tuple]:
+    index, size = chunk
+    return generate_category_rows(seed, index, size, native_uuid=native_uuid, updated_at=updated_at)
+
+
+def _generate_genre_chunk(
+    chunk: tuple[int, int],
+    seed: int,
+    native_uuid: bool,
+    category_count: int,
+    categories_per_genre: int
+) -> tuple[list[tuple], list[tuple]]:
+    index, size = chunk
+    return generate_genre_rows(
+        seed,
+        index,
+        size,
+        native_uuid=native_uuid,
+        category_count=category_count,
+        categories_per_genre=categories_per_genre
+    )
+
+
+def _insert_sql(model, names: tuple[str, ...]) -> str:
+    fields = [model._meta.get_field(name) for name in names]
+    return "INSERT INTO {} ({}) VALUES ({})".format(
+        connection.ops.quote_name(model._meta.db_table),
+        ", ".join(connection.ops.quote_name(field.column) for field in fields),
+        ", ".join(["%s"] * len(fields))
+    )
+
+
+def _count_genres() -> None:
+    # Seeded categories start at zero, so one pass over the links sets every
+    # counter; versions stay at 1 since nothing was edited.
+    linked = GenreCategory.objects.filter(category_id=OuterRef("id")).order_by().values(
+        "category_id"
+    ).annotate(count=Count("genre_id")).values("count")
+    CategoryModel.objects.filter(id__in=GenreCategory.objects.values("category_id")).update(
+        genre_count=Coalesce(Subquery(linked), 0)
+    )
+
+
+@contextmanager
+def _indexes_rebuilt_after(enabled: bool):
+    # Keeping every secondary B-tree up to date row by row costs more than
+    # the inserts themselves; building each index once at the end is a sort.
+    if not enabled:
+        yield
+        return
+
+    indexes = [
+        (model, index)
+        for model in (CategoryModel, GenreModel, GenreCategory)
+        for index in model._meta.indexes
+    ]
+    with connection.schema_editor() as schema_editor:
+        for model, index in indexes:
+            schema_editor.remove_index(model, index)
+    try:
+        yield
+    finally:
+        with connection.schema_editor() as schema_editor:
+            for model, index in indexes:
+                schema_editor.add_index(model, index)
+
+
+@contextmanager
+def _fast_sqlite_writes():
+    if connection.vendor != "sqlite":
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        synchronous, = cursor.fetchone()
+        cursor.execute("PRAGMA synchronous = OFF")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA synchronous = {int(synchronous)}")
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0002_category_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
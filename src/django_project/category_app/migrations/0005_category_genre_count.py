@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0004_category_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='genre_count',
+            field=models.PositiveIntegerField(db_default=0, default=0),
+        ),
+    ]
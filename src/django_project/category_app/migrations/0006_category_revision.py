@@ -0,0 +1,75 @@
+# Generated by Django 5.0.6 on 2026-10-18 10:15
+
+from django.db import migrations, models
+
+
+# Deletes cannot move MAX(updated_at), so the database counts them. A
+# trigger keeps deleting a category one statement and also covers deletes
+# that bypass the repository. The upsert recreates the row after a flush.
+CREATE_TRIGGER = {
+    "sqlite": [
+        """
+        CREATE TRIGGER category_revision_on_delete AFTER DELETE ON category
+        BEGIN
+            INSERT INTO category_revision (id, deletes) VALUES (1, 1)
+            ON CONFLICT (id) DO UPDATE SET deletes = deletes + 1;
+        END
+        """,
+    ],
+    "postgresql": [
+        """
+        CREATE FUNCTION category_revision_on_delete() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO category_revision (id, deletes) VALUES (1, 1)
+            ON CONFLICT (id) DO UPDATE SET deletes = category_revision.deletes + 1;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER category_revision_on_delete AFTER DELETE ON category
+        FOR EACH STATEMENT EXECUTE FUNCTION category_revision_on_delete()
+        """,
+    ],
+}
+
+DROP_TRIGGER = {
+    "sqlite": ["DROP TRIGGER category_revision_on_delete"],
+    "postgresql": [
+        "DROP TRIGGER category_revision_on_delete ON category",
+        "DROP FUNCTION category_revision_on_delete()",
+    ],
+}
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor not in statements:
+            raise NotImplementedError(f"No category_revision trigger for {vendor}")
+
+        for statement in statements[vendor]:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0005_category_genre_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryRevision',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, primary_key=True, serialize=False)),
+                ('deletes', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'category_revision',
+            },
+        ),
+        migrations.RunPython(_run(CREATE_TRIGGER), _run(DROP_TRIGGER)),
+    ]
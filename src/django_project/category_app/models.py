@@ -7,9 +7,30 @@ class Category(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField()
     is_active = models.BooleanField(default=True)
+    version = models.PositiveIntegerField(default=1)
+    # Number of genres linked to the category, maintained by the genre
+    # repository in the same transaction as the links themselves.
+    genre_count = models.PositiveIntegerField(default=0, db_default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "category"
+        indexes = [
+            models.Index(fields=["name", "id"], name="category_name_id_idx"),
+            models.Index(fields=["is_active", "id"], name="category_active_id_idx"),
+            models.Index(fields=["is_active", "name", "id"], name="category_active_name_id_idx"),
+            models.Index(fields=["updated_at"], name="category_updated_at_idx"),
+        ]
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+class CategoryRevision(models.Model):
+    # Single row counting category deletes, bumped by a database trigger
+    # (see migration 0006). Inserts and updates move MAX(updated_at), which
+    # the updated_at index answers without a scan; deletes cannot.
+    id = models.PositiveSmallIntegerField(primary_key=True, default=1)
+    deletes = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "category_revision"
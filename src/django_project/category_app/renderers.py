@@ -0,0 +1,84 @@
+import json
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Iterable, Iterator
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.serializers import Serializer
+
+from src.core.category.application.usecases import GetCategoryResponse, ListCategoryResponse
+from src.core.category.domain import CategoryProjection
+from .encoders import encode_category, encode_get_category_response, encode_list_category_response
+
+
+class SerializableResponse(Mapping):
+    """
+    A use case response paired with the serializer that describes it.
+
+    CategoryJSONRenderer encodes `response` directly; everything else
+    (tests, the browsable API, indented JSON) sees it as the serializer's
+    data, which is only built on first access.
+    """
+
+    def __init__(self, response, serializer_class: type[Serializer]):
+        self.response = response
+        self.serializer_class = serializer_class
+
+    @cached_property
+    def data(self):
+        return self.serializer_class(instance=self.response).data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class CategoryJSONRenderer(JSONRenderer):
+    encoders = {
+        ListCategoryResponse: encode_list_category_response,
+        GetCategoryResponse: encode_get_category_response,
+    }
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        encode = self.encoders.get(type(data.response)) if isinstance(data, SerializableResponse) else None
+        indent = self.get_indent(accepted_media_type or "", renderer_context or {})
+
+        if encode is None or indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return encode(data.response)
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+    render_style = "binary"
+    lines_per_chunk = 500
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+
+        if isinstance(data, Mapping):
+            # SerializableResponse is a Mapping but not a dict.
+            data = dict(data)
+
+        return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+
+    def stream(self, categories: Iterable[CategoryProjection]) -> Iterator[bytes]:
+        lines = []
+        for category in categories:
+            lines.append(encode_category(category))
+
+            if len(lines) == self.lines_per_chunk:
+                yield ("\n".join(lines) + "\n").encode()
+                lines.clear()
+
+        if lines:
+            yield ("\n".join(lines) + "\n").encode()
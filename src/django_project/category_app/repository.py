@@ -1,20 +1,41 @@
 from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 from uuid import UUID
 
-from src.core.category.domain import Category, CategoryRepository
-from .models import Category as CategoryModel
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q, Subquery
+from django.utils import timezone
+
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryPage,
+    CategoryProjection,
+    CategoryRepository,
+    CategorySort,
+    decode_cursor,
+    encode_cursor
+)
+from src.core.category.infra import CachedCategoryRepository, ObservedCategoryRepository
+from .models import Category as CategoryModel, CategoryRevision
+from .snapshot import CategorySnapshot, SnapshotScheduler
 
 
 @dataclass
 class DjangoORMCategoryRepository(CategoryRepository):
     category_model: type[CategoryModel] = CategoryModel
+    batch_size: int = 500
 
     def save(self, category: Category) -> None:
         self.category_model.objects.create(
             id=category.id,
             name=category.name,
             description=category.description,
-            is_active=category.is_active
+            is_active=category.is_active,
+            version=category.version
         )
 
     def get_by_id(self, id: UUID) -> Category | None:
@@ -24,21 +45,143 @@ class DjangoORMCategoryRepository(CategoryRepository):
                 id=category.id,
                 name=category.name,
                 description=category.description,
-                is_active=category.is_active
+                is_active=category.is_active,
+                version=category.version,
+                genre_count=category.genre_count
             )
         except self.category_model.DoesNotExist:
             return None
 
-    def delete(self, id: UUID) -> None:
-        self.category_model.objects.filter(id=id).delete()
+    def get_version(self, id: UUID) -> int | None:
+        return self.category_model.objects.filter(id=id).values_list("version", flat=True).first()
+
+    def get_by_ids(self, ids: Iterable[UUID]) -> list[Category]:
+        ids = set(ids)
+        if not ids:
+            return []
+
+        rows = self.category_model.objects.filter(id__in=ids).values_list(
+            "id", "name", "description", "is_active", "version", "genre_count"
+        )
+        return [
+            Category(
+                id=id,
+                name=name,
+                description=description,
+                is_active=is_active,
+                version=version,
+                genre_count=genre_count
+            )
+            for id, name, description, is_active, version, genre_count in rows
+        ]
+
+    def exists_many(self, ids: Iterable[UUID]) -> set[UUID]:
+        ids = set(ids)
+        if not ids:
+            return set()
 
-    def update(self, category: Category) -> None:
-        self.category_model.objects.filter(id=category.id).update(
+        return set(self.category_model.objects.filter(id__in=ids).values_list("id", flat=True))
+
+    def get_revision(self) -> str:
+        # Inserts and updates move MAX(updated_at) forward; deletes bump
+        # category_revision.deletes from a database trigger, so they stay a
+        # single statement. The newest row comes off the updated_at index
+        # and the counter is one row, so no query scans the table.
+        deletes = CategoryRevision.objects.filter(id=1).values("deletes")
+        marker = self.category_model.objects.order_by("-updated_at").annotate(
+            deletes=Subquery(deletes)
+        ).values_list("deletes", "updated_at").first()
+        if marker is None:
+            return f"{deletes.values_list('deletes', flat=True).first() or 0}-0"
+
+        deletes, updated_at = marker
+        return f"{deletes or 0}-{int(updated_at.timestamp() * 1_000_000)}"
+
+    def delete(self, id: UUID) -> int:
+        _, deleted = self.category_model.objects.filter(id=id).delete()
+        return deleted.get(self.category_model._meta.label, 0)
+
+    def update(self, category: Category) -> int:
+        return self.category_model.objects.filter(id=category.id).update(
             name=category.name,
             description=category.description,
-            is_active=category.is_active
+            is_active=category.is_active,
+            version=F("version") + 1,
+            updated_at=timezone.now()
         )
 
+    def update_fields(
+        self,
+        id: UUID,
+        fields: dict[str, Any],
+        expected_version: int | None = None
+    ) -> int:
+        queryset = self.category_model.objects.filter(id=id)
+        if expected_version is not None:
+            # Compare-and-swap: the row is only written if nobody bumped the
+            # version since the caller read it.
+            queryset = queryset.filter(version=expected_version)
+
+        if not fields:
+            return int(queryset.exists())
+
+        return queryset.update(**fields, version=F("version") + 1, updated_at=timezone.now())
+
+    def save_many(self, categories: list[Category]) -> None:
+        with transaction.atomic():
+            self.category_model.objects.bulk_create(
+                [
+                    self.category_model(
+                        id=category.id,
+                        name=category.name,
+                        description=category.description,
+                        is_active=category.is_active,
+                        version=category.version
+                    ) for category in categories
+                ],
+                batch_size=self.batch_size
+            )
+
+    def update_many(self, categories: list[Category]) -> int:
+        updated_at = timezone.now()
+        with transaction.atomic():
+            updated = self.category_model.objects.bulk_update(
+                [
+                    self.category_model(
+                        id=category.id,
+                        name=category.name,
+                        description=category.description,
+                        is_active=category.is_active,
+                        version=F("version") + 1,
+                        updated_at=updated_at
+                    ) for category in categories
+                ],
+                fields=["name", "description", "is_active", "version", "updated_at"],
+                batch_size=self.batch_size
+            )
+            # All or nothing: a short count means some id is missing, so the
+            # rows that did match are rolled back with the rest.
+            if updated != len(categories):
+                transaction.set_rollback(True)
+                return 0
+
+        return updated
+
+    def delete_many(self, ids: list[UUID]) -> int:
+        ids = list(dict.fromkeys(ids))
+        deleted = 0
+        with transaction.atomic():
+            for start in range(0, len(ids), self.batch_size):
+                _, counts = self.category_model.objects.filter(
+                    id__in=ids[start:start + self.batch_size]
+                ).delete()
+                deleted += counts.get(self.category_model._meta.label, 0)
+            if deleted != len(ids):
+                transaction.set_rollback(True)
+                return 0
+
+        return deleted
+
     def list(self) -> list[Category]:
         categories = self.category_model.objects.all()
         return [
@@ -46,6 +189,152 @@ class DjangoORMCategoryRepository(CategoryRepository):
                 id=category.id,
                 name=category.name,
                 description=category.description,
-                is_active=category.is_active
+                is_active=category.is_active,
+                version=category.version,
+                genre_count=category.genre_count
             ) for category in categories
-        ]
\ No newline at end of file
+        ]
+
+    def list_page(
+        self,
+        cursor: str | None,
+        page_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> CategoryPage:
+        queryset = self._filter(filters or CategoryFilter())
+
+        if sort is CategorySort.NAME:
+            queryset = queryset.order_by("name", "id")
+            if cursor is not None:
+                name, id = decode_cursor(cursor, sort)
+                queryset = queryset.filter(Q(name__gt=name) | Q(name=name, id__gt=id))
+        else:
+            queryset = queryset.order_by("id")
+            if cursor is not None:
+                id, = decode_cursor(cursor, sort)
+                queryset = queryset.filter(id__gt=id)
+
+        rows = queryset.values_list(*CategoryProjection._fields)[:page_size + 1]
+        categories = list(map(CategoryProjection._make, rows))
+
+        if len(categories) <= page_size:
+            return CategoryPage(data=categories)
+
+        categories = categories[:page_size]
+        return CategoryPage(
+            data=categories,
+            next_cursor=encode_cursor(categories[-1], sort)
+        )
+
+    def iter_all(
+        self,
+        chunk_size: int,
+        filters: CategoryFilter | None = None,
+        sort: CategorySort = CategorySort.ID
+    ) -> Iterator[CategoryProjection]:
+        queryset = self._filter(filters or CategoryFilter())
+        ordering = ("name", "id") if sort is CategorySort.NAME else ("id",)
+        rows = queryset.order_by(*ordering).values_list(*CategoryProjection._fields)
+        return map(CategoryProjection._make, rows.iterator(chunk_size=chunk_size))
+
+    def _filter(self, filters: CategoryFilter):
+        queryset = self.category_model.objects.all()
+
+        if filters.is_active is not None:
+            queryset = queryset.filter(is_active=filters.is_active)
+
+        if filters.name_prefix:
+            # startswith alone compiles to LIKE, which B-tree indexes cannot
+            # serve for case-insensitive collations; the range makes the
+            # query an index range scan on (name, id).
+            queryset = queryset.filter(
+                name__gte=filters.name_prefix,
+                name__startswith=filters.name_prefix
+            )
+            upper_bound = _name_prefix_upper_bound(filters.name_prefix)
+            if upper_bound is not None:
+                queryset = queryset.filter(name__lt=upper_bound)
+
+        if filters.name_contains:
+            queryset = queryset.filter(name__icontains=filters.name_contains)
+
+        return queryset
+
+
+def _name_prefix_upper_bound(prefix: str) -> str | None:
+    stripped = prefix.rstrip(chr(0x10FFFF))
+    if not stripped:
+        return None
+
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+@cache
+def _cached_category_repository(max_size: int, ttl: float) -> CachedCategoryRepository:
+    return CachedCategoryRepository(
+        repository=DjangoORMCategoryRepository(),
+        max_size=max_size,
+        ttl=ttl
+    )
+
+
+def _category_cache() -> CachedCategoryRepository | None:
+    cache_settings = getattr(settings, "CATEGORY_REPOSITORY_CACHE", {})
+
+    if not cache_settings.get("ENABLED", False):
+        return None
+
+    return _cached_category_repository(
+        max_size=cache_settings.get("MAX_SIZE", 1024),
+        ttl=cache_settings.get("TTL", 60)
+    )
+
+
+def get_category_repository() -> CategoryRepository:
+    repository = _category_cache()
+    if repository is None:
+        repository = DjangoORMCategoryRepository()
+
+    snapshot = get_category_snapshot()
+    if snapshot is None:
+        return repository
+
+    scheduler = _snapshot_scheduler(snapshot.path, settings.CATEGORY_SNAPSHOT.get("DELAY", 1.0))
+    return ObservedCategoryRepository(repository=repository, on_write=scheduler.request)
+
+
+def get_category_snapshot() -> CategorySnapshot | None:
+    snapshot_settings = getattr(settings, "CATEGORY_SNAPSHOT", {})
+
+    if not snapshot_settings.get("ENABLED", False):
+        return None
+
+    return CategorySnapshot(path=Path(snapshot_settings["PATH"]), repository=DjangoORMCategoryRepository())
+
+
+def schedule_category_snapshot() -> None:
+    """For writes to category rows that bypass the category repository."""
+    snapshot = get_category_snapshot()
+    if snapshot is not None:
+        _snapshot_scheduler(snapshot.path, settings.CATEGORY_SNAPSHOT.get("DELAY", 1.0)).request()
+
+
+def notify_categories_changed(ids: Iterable[UUID]) -> None:
+    """
+    For writes to category rows that bypass the category repository: drops
+    the changed ids from this process's cache and schedules a snapshot.
+    """
+    cache = _category_cache()
+    if cache is not None:
+        cache.invalidate(ids)
+
+    schedule_category_snapshot()
+
+
+@cache
+def _snapshot_scheduler(path: Path, delay: float) -> SnapshotScheduler:
+    return SnapshotScheduler(
+        build=CategorySnapshot(path=path, repository=DjangoORMCategoryRepository()).build,
+        delay=delay
+    )
@@ -1,9 +1,18 @@
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema, extend_schema_view
 from .serializers import (
+    BulkCreateCategoryRequestSerializer,
+    BulkCreateCategoryResponseSerializer,
+    BulkDeleteCategoryRequestSerializer,
+    BulkUpdateCategoryRequestSerializer,
+    ListCategoryRequestSerializer,
     ListCategoryResponseSerializer,
     CreateCategoryRequestSerializer,
     CreateCategoryResponseSerializer,
     DeleteCategoryRequestSerializer,
+    ExportCategoryRequestSerializer,
+    ImportCategoryRequestSerializer,
+    ImportCategoryResponseSerializer,
     PartialUpdateCategoryRequestSerializer,
     RetrieveCategoryRequestSerializer,
     RetrieveCategoryResponseSerializer,
@@ -13,7 +22,19 @@ from .serializers import (
 category_viewset_schema = extend_schema_view(
     list=extend_schema(
         tags=['Category'],
-        responses={200: ListCategoryResponseSerializer},
+        parameters=[
+            ListCategoryRequestSerializer,
+            OpenApiParameter(
+                'If-None-Match',
+                OpenApiTypes.STR,
+                OpenApiParameter.HEADER,
+                description='ETag from a previous response; answered with 304 while it is current',
+            )
+        ],
+        responses={
+            200: ListCategoryResponseSerializer,
+            304: OpenApiResponse(description='No category changed since the ETag sent in If-None-Match'),
+        },
     ),
     create=extend_schema(
         tags=['Category'],
@@ -23,8 +44,17 @@ category_viewset_schema = extend_schema_view(
     retrieve=extend_schema(
         tags=['Category'],
         request=RetrieveCategoryRequestSerializer,
+        parameters=[
+            OpenApiParameter(
+                'If-None-Match',
+                OpenApiTypes.STR,
+                OpenApiParameter.HEADER,
+                description='ETag from a previous response; answered with 304 while it is current',
+            )
+        ],
         responses={
             200: RetrieveCategoryResponseSerializer,
+            304: OpenApiResponse(description='Category unchanged since the ETag sent in If-None-Match'),
             404: {
                 'description': 'Category not found',
                 'content': {
@@ -40,6 +70,14 @@ category_viewset_schema = extend_schema_view(
     update=extend_schema(
         tags=['Category'],
         request=UpdateCategoryRequestSerializer,
+        parameters=[
+            OpenApiParameter(
+                'If-Match',
+                OpenApiTypes.STR,
+                OpenApiParameter.HEADER,
+                description='ETag returned by retrieve; the update only applies at that version',
+            )
+        ],
         responses={
             204: None,
             404: {
@@ -51,12 +89,30 @@ category_viewset_schema = extend_schema_view(
                         }
                     }
                 }
+            },
+            409: {
+                'description': 'Category changed since the version sent in If-Match',
+                'content': {
+                    'application/json': {
+                        'example': {
+                            'detail': 'Category with id 3fa85f64-5717-4562-b3fc-2c963f66afa6 is not at version 2'
+                        }
+                    }
+                }
             }
         }
     ),
     partial_update=extend_schema(
         tags=['Category'],
         request=PartialUpdateCategoryRequestSerializer,
+        parameters=[
+            OpenApiParameter(
+                'If-Match',
+                OpenApiTypes.STR,
+                OpenApiParameter.HEADER,
+                description='ETag returned by retrieve; the update only applies at that version',
+            )
+        ],
         responses={
             204: None,
             404: {
@@ -68,6 +124,16 @@ category_viewset_schema = extend_schema_view(
                         }
                     }
                 }
+            },
+            409: {
+                'description': 'Category changed since the version sent in If-Match',
+                'content': {
+                    'application/json': {
+                        'example': {
+                            'detail': 'Category with id 3fa85f64-5717-4562-b3fc-2c963f66afa6 is not at version 2'
+                        }
+                    }
+                }
             }
         }
     ),
@@ -87,5 +153,92 @@ category_viewset_schema = extend_schema_view(
                 }
             }
         }
+    ),
+    bulk=[
+        extend_schema(
+            methods=['POST'],
+            tags=['Category'],
+            request=BulkCreateCategoryRequestSerializer,
+            responses={
+                201: BulkCreateCategoryResponseSerializer,
+                400: {
+                    'description': 'Per-item validation errors, in request order',
+                    'content': {
+                        'application/json': {
+                            'example': {
+                                'data': [{}, {'name': ['This field may not be blank.']}]
+                            }
+                        }
+                    }
+                }
+            }
+        ),
+        extend_schema(
+            methods=['PUT'],
+            tags=['Category'],
+            request=BulkUpdateCategoryRequestSerializer,
+            responses={
+                204: None,
+                400: {
+                    'description': 'Per-item validation errors, in request order',
+                    'content': {
+                        'application/json': {
+                            'example': {
+                                'data': [{}, {'name': ['This field may not be blank.']}]
+                            }
+                        }
+                    }
+                }
+            }
+        ),
+        extend_schema(
+            methods=['DELETE'],
+            tags=['Category'],
+            request=BulkDeleteCategoryRequestSerializer,
+            responses={
+                204: None,
+                400: {
+                    'description': 'Unknown ids by position; nothing is deleted',
+                    'content': {
+                        'application/json': {
+                            'example': {
+                                'ids': {'1': ['Category with id 9b2e4c1a-0d5f-4e43-9a57-2f7d1c3e8b60 not found']}
+                            }
+                        }
+                    }
+                }
+            }
+        )
+    ],
+    export=extend_schema(
+        tags=['Category'],
+        parameters=[ExportCategoryRequestSerializer],
+        responses={
+            (200, 'application/x-ndjson'): OpenApiResponse(
+                OpenApiTypes.STR,
+                description='Every category, one JSON object per line; gzip-encoded when Accept-Encoding allows it'
+            ),
+            (200, 'text/csv'): OpenApiResponse(
+                OpenApiTypes.STR,
+                description='Every category as CSV with an id,name,description,is_active header'
+            ),
+        }
+    ),
+    import_=extend_schema(
+        tags=['Category'],
+        request={'multipart/form-data': ImportCategoryRequestSerializer},
+        responses={
+            200: ImportCategoryResponseSerializer,
+            400: {
+                'description': 'No file, or a file that is not valid UTF-8 CSV or NDJSON',
+                'content': {
+                    'application/json': {
+                        'example': {
+                            'format': ['Cannot tell the format from the file name.']
+                        }
+                    }
+                }
+            }
+        }
     )
 )
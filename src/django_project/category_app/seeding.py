@@ -0,0 +1,84 @@
+import random
+from typing import Any
+from uuid import UUID
+
+from faker.providers.lorem.en_US import Provider as LoremProvider
+
+
+WORDS = [word for word in LoremProvider.word_list if len(word) > 2]
+
+_UUID4_CLEAR = ~((0xc000 << 48) | (0xf000 << 64))
+_UUID4_SET = (0x8000 << 48) | (0x4 << 76)
+
+
+def generate_category_rows(
+    seed: int,
+    chunk: int,
+    size: int,
+    native_uuid: bool,
+    updated_at: Any,
+    active_ratio: float = 0.8
+) -> list[tuple]:
+    """
+    Build `size` category rows (id, name, description, is_active, version,
+    updated_at), ready to be used as INSERT parameters.
+
+    Every chunk has its own RNG derived from (seed, chunk), so the rows do
+    not depend on how many processes generate them or in which order. Rows
+    come sorted by id, which keeps primary key inserts local.
+    """
+    rng = random.Random(f"{seed}:{chunk}")
+    choices, random_float, getrandbits = rng.choices, rng.random, rng.getrandbits
+    rows = []
+
+    for _ in range(size):
+        # Same bits as UUID(int=..., version=4), without building the object.
+        bits = getrandbits(128) & _UUID4_CLEAR | _UUID4_SET
+        rows.append((
+            UUID(int=bits) if native_uuid else f"{bits:032x}",
+            " ".join(choices(WORDS, k=1 + int(random_float() * 3))).title(),
+            " ".join(choices(WORDS, k=6 + int(random_float() * 9))).capitalize() + ".",
+            random_float() < active_ratio,
+            1,
+            updated_at
+        ))
+
+    rows.sort()
+    return rows
+
+
+def generate_genre_rows(
+    seed: int,
+    chunk: int,
+    size: int,
+    native_uuid: bool,
+    category_count: int,
+    categories_per_genre: int,
+    active_ratio: float = 0.8
+) -> tuple[list[tuple], list[tuple]]:
+    """
+    Build `size` genre rows (id, name, is_active) and their links as
+    (genre id, category index) pairs, the index pointing into the
+    `category_count` categories seeded by the same run.
+
+    Like categories, every chunk has its own RNG derived from (seed, chunk)
+    and rows come sorted by id.
+    """
+    rng = random.Random(f"{seed}:genres:{chunk}")
+    choices, random_float, getrandbits, sample = rng.choices, rng.random, rng.getrandbits, rng.sample
+    per_genre = min(categories_per_genre, category_count)
+    rows, links = [], []
+
+    for _ in range(size):
+        bits = getrandbits(128) & _UUID4_CLEAR | _UUID4_SET
+        id = UUID(int=bits) if native_uuid else f"{bits:032x}"
+        rows.append((
+            id,
+            " ".join(choices(WORDS, k=1 + int(random_float() * 2))).title(),
+            random_float() < active_ratio
+        ))
+        links.extend((id, index) for index in sample(range(category_count), per_genre))
+
+    rows.sort()
+    links.sort()
+    return rows, links
@@ -1,14 +1,52 @@
 from rest_framework import serializers
 
+from src.core.category.application.usecases import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.core.category.domain import CategorySort, decode_cursor
+
+
+MAX_BULK_SIZE = 1000
+MAX_IMPORT_REJECTS = 100
+
 
 class CategoryResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255)
     description = serializers.CharField()
     is_active = serializers.BooleanField()
+    genre_count = serializers.IntegerField(min_value=0)
+
+class ListCategoryRequestSerializer(serializers.Serializer):
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(
+        min_value=1,
+        max_value=MAX_PAGE_SIZE,
+        default=DEFAULT_PAGE_SIZE
+    )
+    is_active = serializers.BooleanField(required=False)
+    name_prefix = serializers.CharField(max_length=255, required=False)
+    name_contains = serializers.CharField(max_length=255, required=False)
+    sort = serializers.ChoiceField(
+        choices=[sort.value for sort in CategorySort],
+        default=CategorySort.ID.value
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        # Decoded here so a bad cursor is rejected before any 304 is sent.
+        if "cursor" in attrs:
+            try:
+                decode_cursor(attrs["cursor"], CategorySort(attrs["sort"]))
+            except ValueError as e:
+                raise serializers.ValidationError({"cursor": [str(e)]})
+
+        return attrs
+
+class ListCategoryResponseMetaSerializer(serializers.Serializer):
+    next_cursor = serializers.CharField(allow_null=True)
+    page_size = serializers.IntegerField()
 
 class ListCategoryResponseSerializer(serializers.Serializer):
     data = CategoryResponseSerializer(many=True)
+    meta = ListCategoryResponseMetaSerializer()
 
 class RetrieveCategoryRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -37,4 +75,43 @@ class PartialUpdateCategoryRequestSerializer(serializers.Serializer):
     is_active = serializers.BooleanField(required=False)
 
 class DeleteCategoryRequestSerializer(serializers.Serializer):
-    id = serializers.UUIDField()
\ No newline at end of file
+    id = serializers.UUIDField()
+
+class BulkCreateCategoryRequestSerializer(serializers.Serializer):
+    data = CreateCategoryRequestSerializer(many=True, allow_empty=False, max_length=MAX_BULK_SIZE)
+
+class BulkCreateCategoryResponseSerializer(serializers.Serializer):
+    data = CreateCategoryResponseSerializer(many=True)
+
+class BulkUpdateCategoryItemSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255, allow_blank=False)
+    description = serializers.CharField()
+    is_active = serializers.BooleanField()
+
+class BulkUpdateCategoryRequestSerializer(serializers.Serializer):
+    data = BulkUpdateCategoryItemSerializer(many=True, allow_empty=False, max_length=MAX_BULK_SIZE)
+
+class BulkDeleteCategoryRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=MAX_BULK_SIZE
+    )
+
+class ImportCategoryRequestSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=["csv", "ndjson"], required=False)
+
+class ExportCategoryRequestSerializer(serializers.Serializer):
+    output = serializers.ChoiceField(choices=["ndjson", "csv"], default="ndjson")
+
+class ImportCategoryRejectSerializer(serializers.Serializer):
+    record = serializers.IntegerField()
+    data = serializers.JSONField()
+    error = serializers.CharField()
+
+class ImportCategoryResponseSerializer(serializers.Serializer):
+    imported = serializers.IntegerField()
+    rejected = serializers.IntegerField()
+    rejects = ImportCategoryRejectSerializer(many=True, help_text=f"The first {MAX_IMPORT_REJECTS} rejected records")
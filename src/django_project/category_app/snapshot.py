@@ -0,0 +1,91 @@
+"""
+Precomputed snapshot of every active category, served as a file.
+
+The snapshot is the gzip-compressed `{"data": [...]}` body of a category
+list, rebuilt off the request path a short while after writes made through
+the category use cases. Serving it reads no rows and serializes nothing.
+"""
+import gzip
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from django.db import connections
+
+from src.core.category.application.usecases import StreamCategory, StreamCategoryRequest
+from src.core.category.domain import CategoryRepository
+from .encoders import _to_bytes, encode_category
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CategorySnapshot:
+    path: Path
+    repository: CategoryRepository
+    chunk_size: int = 2000
+
+    def etag(self, stat: os.stat_result) -> str:
+        return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    def build(self) -> None:
+        categories = StreamCategory(repository=self.repository).execute(
+            StreamCategoryRequest(chunk_size=self.chunk_size, is_active=True)
+        ).data
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(descriptor, "wb") as file, gzip.GzipFile(fileobj=file, mode="wb") as compressed:
+                compressed.write(b'{"data":[')
+                separator = b""
+                for category in categories:
+                    compressed.write(separator + _to_bytes(encode_category(category)))
+                    separator = b","
+                compressed.write(b"]}")
+            os.chmod(temporary, 0o644)
+            # Readers holding the previous file keep it; new readers get this one.
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+@dataclass
+class SnapshotScheduler:
+    """
+    Runs `build` in a background thread after `request`. Requests arriving
+    while a build waits `delay` seconds or runs are folded into one more
+    build, so a burst of writes costs at most two rebuilds.
+    """
+    build: Callable[[], None]
+    delay: float = 1.0
+    _pending: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _thread: threading.Thread | None = field(default=None, init=False, repr=False)
+
+    def request(self) -> None:
+        self._pending.set()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="category-snapshot", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._pending.wait()
+            if self.delay:
+                time.sleep(self.delay)
+            self._pending.clear()
+            try:
+                self.build()
+            except Exception:
+                logger.exception("Category snapshot rebuild failed")
+            finally:
+                connections.close_all()
@@ -0,0 +1,117 @@
+import csv
+import gzip
+import json
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+import pytest
+
+from src.core.category.domain import Category, CategoryProjection
+from src.core.genre.domain import Genre, GenreProjection
+from django_project.category_app.exporting import FLUSH_SIZE, export_categories, export_genres
+from django_project.category_app.repository import DjangoORMCategoryRepository
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+def projections(count: int) -> list[CategoryProjection]:
+    return [
+        CategoryProjection.from_category(Category(name=f"Category {index}", description="Ação, \"drama\"\n"))
+        for index in range(count)
+    ]
+
+
+class TestExportCategories:
+    def test_ndjson_has_one_object_per_line(self):
+        categories = projections(3)
+
+        content = b"".join(export_categories(categories, "ndjson")).decode()
+
+        assert [json.loads(line) for line in content.splitlines()] == [
+            {"id": str(item.id), "name": item.name, "description": item.description, "is_active": True}
+            for item in categories
+        ]
+
+    def test_csv_round_trips_quoted_fields(self):
+        categories = projections(2)
+
+        content = b"".join(export_categories(categories, "csv")).decode()
+
+        assert list(csv.DictReader(StringIO(content, newline=""))) == [
+            {"id": str(item.id), "name": item.name, "description": item.description, "is_active": "true"}
+            for item in categories
+        ]
+
+    def test_large_exports_are_yielded_in_bounded_chunks(self):
+        chunks = list(export_categories(iter(projections(5000)), "ndjson"))
+
+        assert len(chunks) > 1
+        assert max(len(chunk) for chunk in chunks) < 2 * FLUSH_SIZE
+
+    def test_gzip_output_decompresses_to_the_plain_output(self):
+        categories = projections(2000)
+
+        compressed = b"".join(export_categories(categories, "csv", compress=True))
+
+        assert gzip.decompress(compressed) == b"".join(export_categories(categories, "csv"))
+
+    def test_reject_unknown_format(self):
+        with pytest.raises(ValueError):
+            export_categories([], "xml")
+
+
+class TestExportGenres:
+    @pytest.fixture
+    def genres(self) -> list[GenreProjection]:
+        categories = {category.id for category in projections(2)}
+        return [
+            GenreProjection.from_genre(Genre(name="Drama, \"noir\"", categories=categories)),
+            GenreProjection.from_genre(Genre(name="Empty", is_active=False)),
+        ]
+
+    def test_ndjson_lists_category_ids(self, genres: list[GenreProjection]):
+        content = b"".join(export_genres(genres, "ndjson")).decode()
+
+        assert [json.loads(line) for line in content.splitlines()] == [
+            {"id": str(item.id), "name": item.name, "is_active": item.is_active, "categories": list(map(str, item.categories))}
+            for item in genres
+        ]
+
+    def test_csv_joins_category_ids_with_spaces(self, genres: list[GenreProjection]):
+        content = b"".join(export_genres(genres, "csv", compress=True))
+
+        assert list(csv.DictReader(StringIO(gzip.decompress(content).decode(), newline=""))) == [
+            {
+                "id": str(item.id),
+                "name": item.name,
+                "is_active": "true" if item.is_active else "false",
+                "categories": " ".join(map(str, item.categories))
+            }
+            for item in genres
+        ]
+
+
+@pytest.mark.django_db
+class TestExportCategoriesCommand:
+    def test_export_gzipped_csv_inferred_from_output_name(self, tmp_path: Path):
+        categories = [Category(name="Movie"), Category(name="Series", is_active=False)]
+        DjangoORMCategoryRepository().save_many(categories)
+        path = tmp_path / "catalog.csv.gz"
+
+        call_command("export_categories", "--output", str(path), "--chunk-size", "1", stdout=StringIO())
+
+        rows = list(csv.DictReader(StringIO(gzip.decompress(path.read_bytes()).decode(), newline="")))
+        assert sorted((row["name"], row["is_active"]) for row in rows) == [("Movie", "true"), ("Series", "false")]
+
+    def test_export_genres_entity(self, tmp_path: Path):
+        category = Category(name="Movie")
+        DjangoORMCategoryRepository().save(category)
+        genre = Genre(name="Drama", categories={category.id})
+        DjangoORMGenreRepository().save(genre)
+        path = tmp_path / "genres.ndjson"
+
+        call_command("export_categories", "--entity", "genres", "--output", str(path), stdout=StringIO())
+
+        assert [json.loads(line) for line in path.read_text().splitlines()] == [
+            {"id": str(genre.id), "name": "Drama", "is_active": True, "categories": [str(category.id)]}
+        ]
@@ -0,0 +1,131 @@
+import json
+from io import StringIO
+from pathlib import Path
+from uuid import uuid4
+
+from django.core.management import CommandError, call_command
+import pytest
+
+from src.core.category.domain import Category
+from src.core.category.infra import InMemoryCategoryRepository
+from django_project.category_app.importing import CategoryImporter, Checkpoint, iter_records
+from django_project.category_app.models import Category as CategoryModel
+from django_project.category_app.repository import DjangoORMCategoryRepository
+
+
+def run_import(path: Path, **options) -> str:
+    out = StringIO()
+    call_command("import_categories", str(path), stdout=out, **options)
+    return out.getvalue()
+
+
+def read_rejects(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.django_db
+class TestImportCategoriesCommand:
+    def test_import_csv(self, tmp_path: Path):
+        id = uuid4()
+        path = tmp_path / "catalog.csv"
+        path.write_text(
+            "id,name,description,is_active\n"
+            f"{id},Movie,\"Films, features\",true\n"
+            ",Series,,no\n"
+        )
+
+        output = run_import(path, workers=1)
+
+        assert "Imported 2 categories, rejected 0" in output
+        movie = CategoryModel.objects.get(id=id)
+        assert (movie.name, movie.description, movie.is_active) == ("Movie", "Films, features", True)
+        series = CategoryModel.objects.get(name="Series")
+        assert (series.description, series.is_active) == ("", False)
+        assert not (tmp_path / "catalog.csv.checkpoint").exists()
+        assert not (tmp_path / "catalog.csv.rejects.ndjson").exists()
+
+    def test_import_ndjson_in_worker_processes(self, tmp_path: Path):
+        path = tmp_path / "catalog.ndjson"
+        path.write_text("".join(
+            json.dumps({"name": f"Category {index}", "is_active": index % 2 == 0}) + "\n"
+            for index in range(25)
+        ))
+
+        run_import(path, batch_size=4, workers=2)
+
+        assert CategoryModel.objects.count() == 25
+        assert CategoryModel.objects.filter(is_active=True).count() == 13
+
+    def test_write_invalid_records_to_reject_file(self, tmp_path: Path):
+        existing = uuid4()
+        CategoryModel.objects.create(id=existing, name="Existing")
+        path = tmp_path / "catalog.ndjson"
+        path.write_text(
+            '{"name": "Valid"}\n'
+            '{"name": ""}\n'
+            'not json\n'
+            f'{{"id": "{existing}", "name": "Clash"}}\n'
+            '{"name": "Odd", "is_active": "maybe"}\n'
+        )
+
+        output = run_import(path, workers=1)
+
+        assert "Imported 1 categories, rejected 4" in output
+        rejects = read_rejects(tmp_path / "catalog.ndjson.rejects.ndjson")
+        assert [reject["record"] for reject in rejects] == [2, 3, 5, 4]
+        assert rejects[0]["error"] == "name can not be empty or null"
+        assert rejects[3]["error"] == f"Category with id {existing} already exists"
+        assert CategoryModel.objects.get(id=existing).name == "Existing"
+
+    def test_resume_from_checkpoint_after_failure(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "catalog.csv"
+        path.write_text("name\n" + "".join(f"Category {index}\n" for index in range(10)) + ",\n")
+        save_many = DjangoORMCategoryRepository.save_many
+        calls = []
+
+        def failing_save_many(self, categories):
+            calls.append(len(categories))
+            if len(calls) == 3:
+                raise RuntimeError("database went away")
+            save_many(self, categories)
+
+        monkeypatch.setattr(DjangoORMCategoryRepository, "save_many", failing_save_many)
+        with pytest.raises(RuntimeError):
+            run_import(path, batch_size=3, workers=1)
+
+        checkpoint = Checkpoint.load(tmp_path / "catalog.csv.checkpoint")
+        assert (checkpoint.records, checkpoint.imported) == (6, 6)
+
+        monkeypatch.setattr(DjangoORMCategoryRepository, "save_many", save_many)
+        output = run_import(path, batch_size=3, workers=1)
+
+        assert "Resuming after record 6" in output
+        assert "Imported 10 categories, rejected 1" in output
+        assert sorted(CategoryModel.objects.values_list("name", flat=True)) == sorted(
+            f"Category {index}" for index in range(10)
+        )
+        assert [reject["record"] for reject in read_rejects(tmp_path / "catalog.csv.rejects.ndjson")] == [11]
+        assert not (tmp_path / "catalog.csv.checkpoint").exists()
+
+    def test_reject_unknown_extension_without_format(self, tmp_path: Path):
+        path = tmp_path / "catalog.txt"
+        path.write_text("name\nMovie\n")
+
+        with pytest.raises(CommandError):
+            run_import(path)
+
+
+class TestCategoryImporter:
+    def test_import_through_any_category_repository(self):
+        existing = Category(name="Existing")
+        repository = InMemoryCategoryRepository([existing])
+        records = iter_records(StringIO(
+            f'{{"id": "{existing.id}", "name": "Clash"}}\n{{"name": "Movie"}}\n'
+        ), "ndjson")
+        rejects = []
+
+        checkpoint = CategoryImporter(repository=repository).run(records, on_reject=rejects.append)
+
+        assert (checkpoint.imported, checkpoint.rejected) == (1, 1)
+        assert rejects[0].error == f"Category with id {existing.id} already exists"
+        assert sorted(category.name for category in repository.list()) == ["Existing", "Movie"]
@@ -0,0 +1,128 @@
+import json
+from uuid import uuid4
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from src.core.category.application.usecases import (
+    GetCategoryResponse,
+    ListCategoryResponse,
+    ListCategoryResponseMeta
+)
+from src.core.category.domain import Category, CategoryProjection
+from django_project.category_app.renderers import (
+    CategoryJSONRenderer,
+    NDJSONRenderer,
+    SerializableResponse
+)
+from django_project.category_app.serializers import (
+    ListCategoryResponseSerializer,
+    RetrieveCategoryResponseSerializer
+)
+
+
+class TestNDJSONRenderer:
+    def test_stream_writes_one_json_document_per_line_in_chunks(self):
+        renderer = NDJSONRenderer()
+        renderer.lines_per_chunk = 2
+        categories = [
+            CategoryProjection.from_category(Category(name=f"Catégorie {index}"))
+            for index in range(3)
+        ]
+
+        chunks = list(renderer.stream(categories))
+
+        assert len(chunks) == 2
+        assert [json.loads(line) for line in b"".join(chunks).decode().splitlines()] == [
+            {
+                "id": str(category.id),
+                "name": category.name,
+                "description": category.description,
+                "is_active": category.is_active,
+                "genre_count": 0
+            } for category in categories
+        ]
+
+    def test_render_writes_single_line(self):
+        assert NDJSONRenderer().render({"detail": "Not found."}) == b'{"detail":"Not found."}\n'
+
+    def test_render_serializable_response_as_single_line(self):
+        response = GetCategoryResponse(id=uuid4(), name="Movie", description="", is_active=True, version=1)
+        data = SerializableResponse(response, RetrieveCategoryResponseSerializer)
+
+        assert NDJSONRenderer().render(data) == (
+            json.dumps(data.data, separators=(",", ":")) + "\n"
+        ).encode()
+
+
+class TestCategoryJSONRenderer:
+    names = ["Movie", "Catégorie", 'quo"te \\ back', "line\nbreak\ttab", "sep \u2028 \u2029", "emoji 🎬", "\x00\x1f"]
+
+    @pytest.fixture
+    def list_response(self) -> ListCategoryResponse:
+        return ListCategoryResponse(
+            data=[
+                CategoryProjection.from_category(
+                    Category(name=name, description=name[::-1], is_active=index % 2 == 0)
+                ) for index, name in enumerate(self.names)
+            ],
+            meta=ListCategoryResponseMeta(next_cursor="eyJzb3J0IjoiaWQifQ==", page_size=7)
+        )
+
+    def test_list_response_is_byte_identical_to_serializer_output(
+        self,
+        list_response: ListCategoryResponse
+    ):
+        expected = JSONRenderer().render(ListCategoryResponseSerializer(instance=list_response).data)
+
+        rendered = CategoryJSONRenderer().render(
+            SerializableResponse(list_response, ListCategoryResponseSerializer)
+        )
+
+        assert rendered == expected
+
+    def test_empty_last_page_is_byte_identical_to_serializer_output(self):
+        response = ListCategoryResponse(
+            data=[],
+            meta=ListCategoryResponseMeta(next_cursor=None, page_size=50)
+        )
+        expected = JSONRenderer().render(ListCategoryResponseSerializer(instance=response).data)
+
+        assert CategoryJSONRenderer().render(
+            SerializableResponse(response, ListCategoryResponseSerializer)
+        ) == expected
+
+    @pytest.mark.parametrize("name", names)
+    def test_get_response_is_byte_identical_to_serializer_output(self, name: str):
+        response = GetCategoryResponse(
+            id=uuid4(),
+            name=name,
+            description="",
+            is_active=True,
+            version=1
+        )
+        expected = JSONRenderer().render(RetrieveCategoryResponseSerializer(instance=response).data)
+
+        assert CategoryJSONRenderer().render(
+            SerializableResponse(response, RetrieveCategoryResponseSerializer)
+        ) == expected
+
+    def test_indented_output_falls_back_to_serializer(self, list_response: ListCategoryResponse):
+        expected = JSONRenderer().render(
+            ListCategoryResponseSerializer(instance=list_response).data,
+            "application/json; indent=2"
+        )
+
+        assert CategoryJSONRenderer().render(
+            SerializableResponse(list_response, ListCategoryResponseSerializer),
+            "application/json; indent=2"
+        ) == expected
+
+    def test_serializable_response_reads_like_serializer_data(
+        self,
+        list_response: ListCategoryResponse
+    ):
+        data = SerializableResponse(list_response, ListCategoryResponseSerializer)
+
+        assert data == ListCategoryResponseSerializer(instance=list_response).data
+        assert CategoryJSONRenderer().render({"detail": "Not found."}) == b'{"detail":"Not found."}'
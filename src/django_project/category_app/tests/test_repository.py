@@ -1,8 +1,21 @@
+from uuid import uuid4
+
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from faker import Faker
 import pytest
 
-from src.core.category.domain.category import Category
-from django_project.category_app.repository import DjangoORMCategoryRepository
+from src.core.category.domain import (
+    Category,
+    CategoryFilter,
+    CategoryProjection,
+    CategorySort
+)
+from src.core.category.infra import CachedCategoryRepository
+from django_project.category_app.repository import (
+    DjangoORMCategoryRepository,
+    get_category_repository
+)
 from django_project.category_app.models import Category as CategoryModel
 
 
@@ -26,4 +39,502 @@ class TestSave:
         assert category_db.id == category.id
         assert category_db.name == category.name
         assert category_db.description == category.description
-        assert category_db.is_active == category.is_active
\ No newline at end of file
+        assert category_db.is_active == category.is_active
+
+@pytest.mark.django_db
+class TestListPage:
+    faker = Faker()
+
+    @pytest.fixture
+    def categories(self) -> list[CategoryProjection]:
+        repository = DjangoORMCategoryRepository()
+        categories = [
+            Category(
+                name=self.faker.word(),
+                description=self.faker.sentence(),
+                is_active=self.faker.boolean()
+            ) for _ in range(5)
+        ]
+        for category in categories:
+            repository.save(category)
+
+        return sorted(map(CategoryProjection.from_category, categories))
+
+    def test_list_page_returns_read_only_projections(self, categories: list[CategoryProjection]):
+        page = DjangoORMCategoryRepository().list_page(cursor=None, page_size=1)
+
+        assert isinstance(page.data[0], CategoryProjection)
+        with pytest.raises(AttributeError):
+            page.data[0].name = "changed"
+
+    def test_list_page_returns_empty_page_when_there_are_no_categories(self):
+        page = DjangoORMCategoryRepository().list_page(cursor=None, page_size=2)
+
+        assert page.data == []
+        assert page.next_cursor is None
+
+    def test_list_page_orders_by_id_and_returns_next_cursor(
+        self,
+        categories: list[CategoryProjection]
+    ):
+        page = DjangoORMCategoryRepository().list_page(cursor=None, page_size=2)
+
+        assert page.data == categories[:2]
+        assert page.next_cursor is not None
+
+    def test_list_page_walks_through_all_pages_with_cursor(
+        self,
+        categories: list[CategoryProjection]
+    ):
+        repository = DjangoORMCategoryRepository()
+        listed, cursor = [], None
+
+        while True:
+            page = repository.list_page(cursor=cursor, page_size=2)
+            listed.extend(page.data)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert listed == categories
+
+    def test_list_page_does_not_return_cursor_on_last_full_page(
+        self,
+        categories: list[CategoryProjection]
+    ):
+        page = DjangoORMCategoryRepository().list_page(cursor=None, page_size=5)
+
+        assert page.data == categories
+        assert page.next_cursor is None
+
+    def test_list_page_does_not_use_offset(self, categories: list[CategoryProjection]):
+        repository = DjangoORMCategoryRepository()
+        first_page = repository.list_page(cursor=None, page_size=2)
+
+        with CaptureQueriesContext(connection) as queries:
+            repository.list_page(cursor=first_page.next_cursor, page_size=2)
+
+        assert len(queries) == 1
+        assert "OFFSET" not in queries[0]["sql"].upper()
+
+    def test_list_page_raises_ValueError_when_cursor_is_invalid(self):
+        with pytest.raises(ValueError, match="invalid cursor"):
+            DjangoORMCategoryRepository().list_page(cursor="invalid", page_size=2)
+
+
+@pytest.mark.django_db
+class TestBulkOperations:
+    faker = Faker()
+
+    @pytest.fixture
+    def categories(self) -> list[Category]:
+        return [
+            Category(
+                name=self.faker.word(),
+                description=self.faker.sentence(),
+                is_active=self.faker.boolean()
+            ) for _ in range(5)
+        ]
+
+    def test_save_many_inserts_in_batches_inside_one_transaction(
+        self,
+        categories: list[Category]
+    ):
+        repository = DjangoORMCategoryRepository(batch_size=2)
+
+        with CaptureQueriesContext(connection) as queries:
+            repository.save_many(categories)
+
+        inserts = [query for query in queries if query["sql"].startswith("INSERT")]
+        assert len(inserts) == 3
+        assert CategoryModel.objects.count() == 5
+        assert sorted(repository.list(), key=lambda c: c.id) == sorted(categories, key=lambda c: c.id)
+
+    def test_save_many_rolls_back_every_batch_on_failure(
+        self,
+        categories: list[Category]
+    ):
+        repository = DjangoORMCategoryRepository(batch_size=2)
+        repository.save(categories[-1])
+
+        with pytest.raises(IntegrityError):
+            repository.save_many(categories)
+
+        assert CategoryModel.objects.count() == 1
+
+    def test_update_many_updates_every_category(self, categories: list[Category]):
+        repository = DjangoORMCategoryRepository(batch_size=2)
+        repository.save_many(categories)
+        for category in categories:
+            category.update_category(name=self.faker.word(), description=self.faker.sentence())
+            category.deactivate()
+
+        with CaptureQueriesContext(connection) as queries:
+            assert repository.update_many(categories) == len(categories)
+
+        updates = [query for query in queries if query["sql"].startswith("UPDATE")]
+        assert len(updates) == 3
+        for category in categories:
+            category_db = CategoryModel.objects.get(id=category.id)
+            assert category_db.name == category.name
+            assert category_db.description == category.description
+            assert category_db.is_active is False
+
+    def test_update_many_and_delete_many_write_nothing_when_an_id_is_missing(
+        self,
+        categories: list[Category]
+    ):
+        repository = DjangoORMCategoryRepository(batch_size=2)
+        repository.save_many(categories)
+        renamed = [Category(id=category.id, name="Renamed") for category in categories]
+
+        assert repository.update_many(renamed + [Category(name="Unknown")]) == 0
+        assert repository.delete_many([category.id for category in categories] + [uuid4()]) == 0
+
+        assert sorted(CategoryModel.objects.values_list("name", flat=True)) == sorted(
+            category.name for category in categories
+        )
+
+    def test_delete_many_deletes_only_given_categories(self, categories: list[Category]):
+        repository = DjangoORMCategoryRepository(batch_size=2)
+        repository.save_many(categories)
+
+        assert repository.delete_many([category.id for category in categories[:3]]) == 3
+
+        assert set(CategoryModel.objects.values_list("id", flat=True)) == {
+            category.id for category in categories[3:]
+        }
+
+
+class TestGetCategoryRepository:
+    def test_return_orm_repository_when_cache_is_disabled(self, settings):
+        settings.CATEGORY_REPOSITORY_CACHE = {"ENABLED": False}
+
+        assert isinstance(get_category_repository(), DjangoORMCategoryRepository)
+
+    def test_return_shared_cached_repository_when_cache_is_enabled(self, settings):
+        settings.CATEGORY_REPOSITORY_CACHE = {"ENABLED": True, "MAX_SIZE": 10, "TTL": 5}
+
+        repository = get_category_repository()
+
+        assert isinstance(repository, CachedCategoryRepository)
+        assert isinstance(repository.repository, DjangoORMCategoryRepository)
+        assert (repository.max_size, repository.ttl) == (10, 5)
+        assert get_category_repository() is repository
+
+    @pytest.mark.django_db
+    def test_cached_repository_sees_writes_made_through_it(self, settings):
+        settings.CATEGORY_REPOSITORY_CACHE = {"ENABLED": True, "MAX_SIZE": 10, "TTL": 60}
+        repository = get_category_repository()
+        repository.clear()
+        category = Category(name="Movie")
+        repository.save(category)
+        repository.get_by_id(category.id)
+
+        category.update_category(name="Series", description="")
+        repository.update(category)
+
+        assert repository.get_by_id(category.id).name == "Series"
+        repository.clear()
+
+
+@pytest.mark.django_db
+class TestIterAll:
+    def test_iter_all_reads_rows_in_chunks_and_yields_projections(self):
+        repository = DjangoORMCategoryRepository()
+        categories = [Category(name=f"category {index}") for index in range(5)]
+        repository.save_many(categories)
+
+        rows = repository.iter_all(chunk_size=2)
+
+        assert list(rows) == sorted(map(CategoryProjection.from_category, categories))
+
+    def test_iter_all_filters_in_sql_and_sorts_by_name(self):
+        repository = DjangoORMCategoryRepository()
+        repository.save_many([
+            Category(name="Movies", is_active=True),
+            Category(name="Documentary", is_active=True),
+            Category(name="Movie", is_active=False),
+            Category(name="Mockumentary", is_active=True),
+        ])
+
+        rows = repository.iter_all(
+            chunk_size=2,
+            filters=CategoryFilter(is_active=True, name_prefix="Mo"),
+            sort=CategorySort.NAME
+        )
+
+        assert [row.name for row in rows] == ["Mockumentary", "Movies"]
+
+
+@pytest.mark.django_db
+class TestListPageFiltersAndSort:
+    @pytest.fixture
+    def categories(self) -> list[Category]:
+        categories = [
+            Category(name="Movie", is_active=True),
+            Category(name="Movies", is_active=False),
+            Category(name="Documentary", is_active=True),
+            Category(name="Mockumentary", is_active=True),
+            Category(name="movie night", is_active=True),
+        ]
+        DjangoORMCategoryRepository().save_many(categories)
+        return categories
+
+    def walk(self, **kwargs) -> list[CategoryProjection]:
+        repository = DjangoORMCategoryRepository()
+        listed, cursor = [], None
+        while True:
+            page = repository.list_page(cursor=cursor, page_size=2, **kwargs)
+            listed.extend(page.data)
+            cursor = page.next_cursor
+            if cursor is None:
+                return listed
+
+    def test_sort_by_name_walks_pages_in_name_order(self, categories: list[Category]):
+        listed = self.walk(sort=CategorySort.NAME)
+
+        assert [category.name for category in listed] == sorted(
+            category.name for category in categories
+        )
+
+    def test_filter_by_is_active(self, categories: list[Category]):
+        listed = self.walk(filters=CategoryFilter(is_active=False))
+
+        assert [category.name for category in listed] == ["Movies"]
+
+    def test_filter_by_case_sensitive_name_prefix(self, categories: list[Category]):
+        listed = self.walk(filters=CategoryFilter(name_prefix="Movie"), sort=CategorySort.NAME)
+
+        assert [category.name for category in listed] == ["Movie", "Movies"]
+
+    def test_filter_by_case_insensitive_name_contains(self, categories: list[Category]):
+        listed = self.walk(filters=CategoryFilter(name_contains="MENTARY"), sort=CategorySort.NAME)
+
+        assert [category.name for category in listed] == ["Documentary", "Mockumentary"]
+
+    def test_combine_filters(self, categories: list[Category]):
+        listed = self.walk(
+            filters=CategoryFilter(is_active=True, name_prefix="Mo"),
+            sort=CategorySort.NAME
+        )
+
+        assert [category.name for category in listed] == ["Mockumentary", "Movie"]
+
+    def test_cursor_from_another_sort_is_rejected(self, categories: list[Category]):
+        repository = DjangoORMCategoryRepository()
+        page = repository.list_page(cursor=None, page_size=1, sort=CategorySort.NAME)
+
+        with pytest.raises(ValueError, match="invalid cursor"):
+            repository.list_page(cursor=page.next_cursor, page_size=1)
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+    def test_name_prefix_filter_uses_name_index(self):
+        queryset = DjangoORMCategoryRepository()._filter(CategoryFilter(name_prefix="Mo"))
+        sql, params = queryset.order_by("name", "id").query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+
+        assert "USING INDEX category_name_id_idx" in plan or "USING COVERING INDEX category_name_id_idx" in plan
+
+
+@pytest.mark.django_db
+class TestAffectedRows:
+    @pytest.fixture
+    def category(self) -> Category:
+        category = Category(name="Movie", description="Movie description")
+        DjangoORMCategoryRepository().save(category)
+        return category
+
+    def test_delete_returns_number_of_deleted_categories(
+        self,
+        category: Category,
+        django_assert_num_queries
+    ):
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(1):
+            assert repository.delete(category.id) == 1
+
+        assert repository.delete(category.id) == 0
+
+    def test_update_returns_number_of_updated_categories(self, category: Category):
+        repository = DjangoORMCategoryRepository()
+
+        assert repository.update(category) == 1
+        assert repository.update(Category(name="Series")) == 0
+
+    def test_update_fields_changes_only_given_fields_in_one_query(
+        self,
+        category: Category,
+        django_assert_num_queries
+    ):
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(1):
+            assert repository.update_fields(category.id, {"name": "Series", "is_active": False}) == 1
+
+        assert repository.get_by_id(category.id) == Category(
+            id=category.id,
+            name="Series",
+            description="Movie description",
+            is_active=False
+        )
+        category_db = CategoryModel.objects.get(id=category.id)
+        assert (category_db.name, category_db.description, category_db.is_active) == (
+            "Series", "Movie description", False
+        )
+
+    def test_update_fields_returns_zero_when_category_does_not_exist(self):
+        assert DjangoORMCategoryRepository().update_fields(uuid4(), {"name": "Series"}) == 0
+
+    def test_update_fields_without_fields_reports_existence(self, category: Category):
+        repository = DjangoORMCategoryRepository()
+
+        assert repository.update_fields(category.id, {}) == 1
+        assert repository.update_fields(uuid4(), {}) == 0
+
+
+@pytest.mark.django_db
+class TestOptimisticConcurrency:
+    @pytest.fixture
+    def category(self) -> Category:
+        category = Category(name="Movie", description="Movie description")
+        DjangoORMCategoryRepository().save(category)
+        return category
+
+    def test_writes_increment_version(self, category: Category):
+        repository = DjangoORMCategoryRepository()
+
+        repository.update_fields(category.id, {"name": "Series"})
+        assert repository.get_by_id(category.id).version == 2
+
+        repository.update(repository.get_by_id(category.id))
+        assert repository.get_by_id(category.id).version == 3
+
+    def test_update_fields_applies_when_expected_version_matches(self, category: Category):
+        repository = DjangoORMCategoryRepository()
+
+        assert repository.update_fields(category.id, {"name": "Series"}, expected_version=1) == 1
+
+        category_db = CategoryModel.objects.get(id=category.id)
+        assert (category_db.name, category_db.version) == ("Series", 2)
+
+    def test_update_fields_loses_race_against_a_concurrent_writer(
+        self,
+        category: Category,
+        django_assert_num_queries
+    ):
+        repository = DjangoORMCategoryRepository()
+        repository.update_fields(category.id, {"name": "Documentary"}, expected_version=1)
+
+        with django_assert_num_queries(1):
+            assert repository.update_fields(category.id, {"name": "Series"}, expected_version=1) == 0
+
+        category_db = CategoryModel.objects.get(id=category.id)
+        assert (category_db.name, category_db.version) == ("Documentary", 2)
+
+
+@pytest.mark.django_db
+class TestVersionsAndRevision:
+    def test_get_version_reads_only_the_version_column(self, django_assert_num_queries):
+        category = Category(name="Movie")
+        repository = DjangoORMCategoryRepository()
+        repository.save(category)
+        repository.update_fields(category.id, {"name": "Series"})
+
+        with django_assert_num_queries(1) as context:
+            assert repository.get_version(category.id) == 2
+
+        assert '"description"' not in context.captured_queries[0]["sql"]
+        assert repository.get_version(uuid4()) is None
+
+    def test_revision_changes_on_every_write(self):
+        repository = DjangoORMCategoryRepository()
+        category = Category(name="Movie")
+        revisions = [repository.get_revision()]
+
+        repository.save(category)
+        revisions.append(repository.get_revision())
+        repository.update_fields(category.id, {"name": "Series"})
+        revisions.append(repository.get_revision())
+        repository.update_many([Category(id=category.id, name="Documentary")])
+        revisions.append(repository.get_revision())
+        repository.save(Category(name="Drama"))
+        revisions.append(repository.get_revision())
+        repository.delete(category.id)
+        revisions.append(repository.get_revision())
+
+        assert len(set(revisions)) == len(revisions)
+
+    def test_revision_is_stable_without_writes(self):
+        repository = DjangoORMCategoryRepository()
+        repository.save(Category(name="Movie"))
+
+        assert repository.get_revision() == repository.get_revision()
+
+    def test_revision_reads_one_row_without_counting(self, django_assert_num_queries):
+        repository = DjangoORMCategoryRepository()
+        repository.save_many([Category(name=f"Category {index}") for index in range(3)])
+
+        with django_assert_num_queries(1) as context:
+            repository.get_revision()
+
+        assert "COUNT" not in context.captured_queries[0]["sql"].upper()
+
+    def test_revision_changes_when_rows_are_deleted_outside_the_repository(self):
+        repository = DjangoORMCategoryRepository()
+        repository.save_many([Category(name="Movie"), Category(name="Series")])
+        before = repository.get_revision()
+
+        CategoryModel.objects.filter(name="Series").delete()
+        after = repository.get_revision()
+        CategoryModel.objects.all().delete()
+
+        assert len({before, after, repository.get_revision()}) == 3
+
+
+@pytest.mark.django_db
+class TestBatchedLookups:
+    @pytest.fixture
+    def categories(self) -> list[Category]:
+        categories = [Category(name=f"Category {index}") for index in range(3)]
+        DjangoORMCategoryRepository().save_many(categories)
+        return categories
+
+    def test_get_by_ids_reads_every_category_in_one_query(
+        self,
+        categories: list[Category],
+        django_assert_num_queries
+    ):
+        missing = uuid4()
+
+        with django_assert_num_queries(1):
+            found = DjangoORMCategoryRepository().get_by_ids([categories[0].id, categories[2].id, missing])
+
+        assert sorted(found, key=lambda category: category.name) == [categories[0], categories[2]]
+
+    def test_exists_many_returns_existing_ids_from_one_query(
+        self,
+        categories: list[Category],
+        django_assert_num_queries
+    ):
+        missing = uuid4()
+
+        with django_assert_num_queries(1) as context:
+            found = DjangoORMCategoryRepository().exists_many(
+                category.id for category in [*categories, categories[0]]
+            )
+
+        assert found == {category.id for category in categories}
+        assert '"name"' not in context.captured_queries[0]["sql"]
+        assert DjangoORMCategoryRepository().exists_many([missing]) == set()
+
+    def test_empty_input_does_not_query(self, django_assert_num_queries):
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(0):
+            assert repository.get_by_ids([]) == []
+            assert repository.exists_many([]) == set()
@@ -0,0 +1,74 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+import pytest
+
+from django_project.category_app.models import Category as CategoryModel
+from django_project.genre_app.models import Genre as GenreModel, GenreCategory
+
+
+def seed(count: int, **options) -> str:
+    out = StringIO()
+    call_command("seed_categories", count, stdout=out, **options)
+    return out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSeedCategoriesCommand:
+    def test_insert_requested_number_of_categories(self):
+        output = seed(250, batch_size=100, workers=2)
+
+        assert CategoryModel.objects.count() == 250
+        assert "Inserted 250 categories" in output
+        category = CategoryModel.objects.first()
+        assert category.name and category.description.endswith(".")
+        assert category.version == 1
+
+    def test_same_seed_generates_same_rows_whatever_the_worker_count(self):
+        seed(120, seed=7, batch_size=50, workers=1)
+        first = list(CategoryModel.objects.order_by("id").values_list("id", "name", "description", "is_active"))
+        CategoryModel.objects.all().delete()
+
+        seed(120, seed=7, batch_size=50, workers=3)
+        second = list(CategoryModel.objects.order_by("id").values_list("id", "name", "description", "is_active"))
+
+        assert first == second
+
+    def test_different_seeds_generate_different_rows(self):
+        seed(10, seed=1, workers=1)
+        seed(10, seed=2, workers=1)
+
+        assert CategoryModel.objects.count() == 20
+
+    @pytest.mark.parametrize("keep_indexes", [False, True])
+    def test_secondary_indexes_exist_after_seeding(self, keep_indexes: bool):
+        seed(50, workers=1, keep_indexes=keep_indexes)
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, CategoryModel._meta.db_table)
+        assert {index.name for index in CategoryModel._meta.indexes} <= set(constraints)
+
+    def test_seed_genres_linked_to_seeded_categories(self):
+        output = seed(40, genres=25, categories_per_genre=3, batch_size=10, workers=2)
+
+        assert "Inserted 40 categories, 25 genres and 75 links" in output
+        assert GenreModel.objects.count() == 25
+        assert GenreCategory.objects.count() == 75
+        counts = dict(CategoryModel.objects.values_list("id", "genre_count"))
+        linked = GenreCategory.objects.values_list("category_id", flat=True)
+        assert counts == {id: list(linked).count(id) for id in counts}
+
+    def test_same_seed_generates_same_links(self):
+        seed(30, seed=3, genres=10, batch_size=7, workers=1)
+        first = set(GenreCategory.objects.values_list("genre_id", "category_id"))
+        GenreModel.objects.all().delete()
+        CategoryModel.objects.all().delete()
+
+        seed(30, seed=3, genres=10, batch_size=7, workers=3)
+
+        assert set(GenreCategory.objects.values_list("genre_id", "category_id")) == first
+
+    def test_reject_invalid_batch_size(self):
+        with pytest.raises(CommandError):
+            seed(10, batch_size=0)
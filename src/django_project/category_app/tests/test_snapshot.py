@@ -0,0 +1,198 @@
+import gzip
+import json
+import threading
+from pathlib import Path
+from unittest.mock import create_autospec
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core.category.domain import Category, CategoryFilter, CategoryRepository, CategorySort
+from src.core.category.infra import ObservedCategoryRepository
+from django_project.category_app.repository import (
+    DjangoORMCategoryRepository,
+    get_category_repository,
+    get_category_snapshot,
+    schedule_category_snapshot
+)
+from django_project.category_app.snapshot import CategorySnapshot, SnapshotScheduler
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path, settings) -> Path:
+    path = tmp_path / "snapshot" / "categories.json.gz"
+    settings.CATEGORY_SNAPSHOT = {"ENABLED": True, "PATH": path, "DELAY": 0}
+    return path
+
+
+@pytest.mark.django_db
+class TestCategorySnapshot:
+    def test_build_writes_active_categories_as_gzipped_json(self, tmp_path: Path):
+        movie = Category(name="Movie", description="Ação ")
+        DjangoORMCategoryRepository().save_many([movie, Category(name="Hidden", is_active=False)])
+        snapshot = CategorySnapshot(path=tmp_path / "categories.json.gz", repository=DjangoORMCategoryRepository())
+
+        snapshot.build()
+
+        content = gzip.decompress(snapshot.path.read_bytes())
+        assert b"\\u2028" in content
+        assert json.loads(content) == {"data": [{
+            "id": str(movie.id),
+            "name": "Movie",
+            "description": "Ação ",
+            "is_active": True,
+            "genre_count": 0
+        }]}
+        assert [path.name for path in tmp_path.iterdir()] == ["categories.json.gz"]
+
+    def test_build_of_empty_catalog(self, tmp_path: Path):
+        snapshot = CategorySnapshot(path=tmp_path / "categories.json.gz", repository=DjangoORMCategoryRepository())
+
+        snapshot.build()
+
+        assert json.loads(gzip.decompress(snapshot.path.read_bytes())) == {"data": []}
+
+    def test_build_asks_the_repository_for_active_categories_only(self, tmp_path: Path):
+        repository = create_autospec(CategoryRepository, instance=True)
+        repository.iter_all.return_value = iter([])
+        snapshot = CategorySnapshot(path=tmp_path / "categories.json.gz", repository=repository, chunk_size=10)
+
+        snapshot.build()
+
+        repository.iter_all.assert_called_once_with(
+            chunk_size=10,
+            filters=CategoryFilter(is_active=True),
+            sort=CategorySort.ID
+        )
+
+
+class TestSnapshotScheduler:
+    def test_requests_during_a_build_are_folded_into_one_more_build(self):
+        started, release, done = threading.Event(), threading.Event(), threading.Semaphore(0)
+        builds = []
+
+        def build():
+            builds.append(len(builds))
+            started.set()
+            release.wait(5)
+            done.release()
+
+        scheduler = SnapshotScheduler(build=build, delay=0)
+        scheduler.request()
+        assert started.wait(5)
+        for _ in range(10):
+            scheduler.request()
+        release.set()
+
+        assert done.acquire(timeout=5) and done.acquire(timeout=5)
+        assert not done.acquire(timeout=0.2)
+        assert builds == [0, 1]
+
+    def test_failed_build_does_not_stop_later_builds(self):
+        failed, built = threading.Event(), threading.Event()
+
+        def build():
+            if not failed.is_set():
+                failed.set()
+                raise RuntimeError("disk full")
+            built.set()
+
+        scheduler = SnapshotScheduler(build=build, delay=0)
+        scheduler.request()
+        assert failed.wait(5)
+        scheduler.request()
+
+        assert built.wait(5)
+
+
+@pytest.mark.django_db
+class TestCategorySnapshotSettings:
+    def test_disabled_by_default(self):
+        assert get_category_snapshot() is None
+        assert not isinstance(get_category_repository(), ObservedCategoryRepository)
+
+    def test_enabled_repository_schedules_rebuilds_on_write(self, snapshot_path: Path):
+        assert isinstance(get_category_repository(), ObservedCategoryRepository)
+        assert get_category_snapshot().path == snapshot_path
+
+    def test_schedule_rebuild_for_writes_outside_the_repository(self, tmp_path: Path, settings, monkeypatch):
+        requested = []
+        monkeypatch.setattr(SnapshotScheduler, "request", lambda scheduler: requested.append(scheduler))
+
+        schedule_category_snapshot()
+        assert requested == []
+
+        settings.CATEGORY_SNAPSHOT = {"ENABLED": True, "PATH": tmp_path / "categories.json.gz", "DELAY": 0}
+        schedule_category_snapshot()
+        assert len(requested) == 1
+
+
+@pytest.mark.django_db
+class TestCategorySnapshotAPI:
+    url = "/api/categories/snapshot/"
+
+    def test_return_404_when_disabled(self):
+        assert APIClient().get(self.url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_build_on_first_request_and_serve_gzipped_file(self, snapshot_path: Path):
+        category = Category(name="Movie")
+        DjangoORMCategoryRepository().save(category)
+
+        response = APIClient().get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        assert response["Content-Encoding"] == "gzip"
+        assert "Content-Disposition" not in response
+        body = b"".join(response.streaming_content)
+        assert body == snapshot_path.read_bytes()
+        assert json.loads(gzip.decompress(body))["data"][0]["id"] == str(category.id)
+
+    def test_decompress_for_clients_without_gzip(self, snapshot_path: Path):
+        DjangoORMCategoryRepository().save(Category(name="Movie"))
+
+        response = APIClient().get(self.url)
+
+        assert "Content-Encoding" not in response
+        assert json.loads(b"".join(response.streaming_content))["data"][0]["name"] == "Movie"
+
+    def test_return_304_without_database_work_when_etag_matches(
+        self,
+        snapshot_path: Path,
+        django_assert_num_queries
+    ):
+        get_category_snapshot().build()
+        etag = APIClient().get(self.url)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = APIClient().get(self.url, HTTP_IF_NONE_MATCH=etag)
+            served = APIClient().get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert served.status_code == status.HTTP_200_OK
+
+    def test_writes_through_the_api_schedule_a_rebuild(self, snapshot_path: Path, monkeypatch):
+        requested = threading.Event()
+        monkeypatch.setattr(SnapshotScheduler, "request", lambda scheduler: requested.set())
+
+        response = APIClient().post(
+            "/api/categories/",
+            data={"name": "Movie", "description": "Films"},
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert requested.is_set()
+
+    def test_imports_through_the_api_schedule_a_rebuild(self, snapshot_path: Path, monkeypatch):
+        requested = threading.Event()
+        monkeypatch.setattr(SnapshotScheduler, "request", lambda scheduler: requested.set())
+        upload = SimpleUploadedFile("catalog.ndjson", b'{"name": "Movie"}\n')
+
+        response = APIClient().post("/api/categories/import/", data={"file": upload}, format="multipart")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert requested.is_set()
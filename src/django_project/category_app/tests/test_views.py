@@ -1,11 +1,16 @@
+import gzip
+import json
 from uuid import UUID, uuid4
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 from faker import Faker
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from src.core.category.application.usecases import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.core.category.domain import Category
+from django_project.category_app.etags import category_etag
 from django_project.category_app.repository import DjangoORMCategoryRepository
 
 
@@ -48,23 +53,64 @@ class TestListAPI:
         expected_data = {
             "data": [
                 {
-                    "id": str(category.id),
-                    "name": category.name,
-                    "description": category.description,
-                    "is_active": category.is_active
-                },
-                {
-                    "id": str(other_category.id),
-                    "name": other_category.name,
-                    "description": other_category.description,
-                    "is_active": other_category.is_active
+                    "id": str(item.id),
+                    "name": item.name,
+                    "description": item.description,
+                    "is_active": item.is_active,
+                    "genre_count": 0
                 }
-            ]
+                for item in sorted([category, other_category], key=lambda item: item.id)
+            ],
+            "meta": {
+                "next_cursor": None,
+                "page_size": DEFAULT_PAGE_SIZE
+            }
         }
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_list_categories_with_page_size_and_cursor(
+        self,
+        category: Category,
+        other_category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        category_repository.save(other_category)
+        first, second = sorted([category, other_category], key=lambda item: item.id)
+
+        url = "/api/categories/"
+        first_page = APIClient().get(url, {"page_size": 1})
+
+        assert first_page.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in first_page.data["data"]] == [str(first.id)]
+        assert first_page.data["meta"]["next_cursor"] is not None
+
+        second_page = APIClient().get(
+            url,
+            {"page_size": 1, "cursor": first_page.data["meta"]["next_cursor"]}
+        )
+
+        assert second_page.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in second_page.data["data"]] == [str(second.id)]
+        assert second_page.data["meta"] == {"next_cursor": None, "page_size": 1}
+
+    def test_return_400_when_cursor_is_invalid(self):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"cursor": "invalid"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "cursor" in response.data
+
+    @pytest.mark.parametrize("page_size", [0, MAX_PAGE_SIZE + 1, "invalid"])
+    def test_return_400_when_page_size_is_invalid(self, page_size):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"page_size": page_size})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "page_size" in response.data
+
 @pytest.mark.django_db
 class TestRetrieveAPI:
     def test_return_400_when_id_is_not_valid(self):
@@ -89,7 +135,8 @@ class TestRetrieveAPI:
                 "id": str(other_category.id),
                 "name": other_category.name,
                 "description": other_category.description,
-                "is_active": other_category.is_active
+                "is_active": other_category.is_active,
+                "genre_count": 0
             }
         }
 
@@ -102,6 +149,24 @@ class TestRetrieveAPI:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    @pytest.mark.parametrize("request_kwargs", [
+        {"data": {"format": "ndjson"}},
+        {"HTTP_ACCEPT": "application/x-ndjson"},
+    ])
+    def test_return_category_as_ndjson_line(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        request_kwargs: dict
+    ):
+        category_repository.save(category)
+
+        response = APIClient().get(f"/api/categories/{category.id}/", **request_kwargs)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert json.loads(response.content)["data"]["id"] == str(category.id)
+
 @pytest.mark.django_db
 class TestCreateAPI:
     def test_return_400_when_payload_is_invalid(self, category: Category):
@@ -350,3 +415,616 @@ class TestDeleteCategoryAPI:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert category_repository.list() == []
+
+@pytest.mark.django_db
+class TestBulkAPI:
+    url = "/api/categories/bulk/"
+
+    def test_bulk_create_categories_and_return_201(
+        self,
+        category: Category,
+        other_category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        response = APIClient().post(
+            self.url,
+            data={
+                "data": [
+                    {"name": category.name, "description": category.description},
+                    {
+                        "name": other_category.name,
+                        "description": other_category.description,
+                        "is_active": False
+                    },
+                ]
+            },
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        created_ids = [UUID(item["id"]) for item in response.data["data"]]
+        assert [category_repository.get_by_id(id) for id in created_ids] == [
+            Category(id=created_ids[0], name=category.name, description=category.description),
+            Category(
+                id=created_ids[1],
+                name=other_category.name,
+                description=other_category.description,
+                is_active=False
+            ),
+        ]
+
+    def test_bulk_create_reports_per_item_errors_and_creates_nothing(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        response = APIClient().post(
+            self.url,
+            data={
+                "data": [
+                    {"name": category.name, "description": category.description},
+                    {"name": "", "description": category.description},
+                ]
+            },
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {
+            "data": [{}, {"name": ["This field may not be blank."]}]
+        }
+        assert category_repository.list() == []
+
+    def test_bulk_create_return_400_when_batch_is_empty(self):
+        response = APIClient().post(self.url, data={"data": []}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_update_categories_and_return_204(
+        self,
+        category: Category,
+        other_category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save_many([category, other_category])
+
+        response = APIClient().put(
+            self.url,
+            data={
+                "data": [
+                    {
+                        "id": str(item.id),
+                        "name": f"{item.name} updated",
+                        "description": item.description,
+                        "is_active": not item.is_active
+                    } for item in [category, other_category]
+                ]
+            },
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        for item in [category, other_category]:
+            updated = category_repository.get_by_id(item.id)
+            assert updated.name == f"{item.name} updated"
+            assert updated.is_active is not item.is_active
+
+    def test_bulk_update_reports_duplicated_ids_per_item(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        item = {
+            "id": str(category.id),
+            "name": category.name,
+            "description": category.description,
+            "is_active": category.is_active
+        }
+
+        response = APIClient().put(self.url, data={"data": [item, item]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {
+            "data": [
+                {},
+                {"non_field_errors": [f"Category with id {category.id} is duplicated in batch"]}
+            ]
+        }
+
+    def test_bulk_update_reports_unknown_ids_per_item_and_updates_nothing(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        unknown = uuid4()
+
+        response = APIClient().put(
+            self.url,
+            data={
+                "data": [
+                    {"id": str(id), "name": "Updated", "description": "Films", "is_active": True}
+                    for id in [category.id, unknown]
+                ]
+            },
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {
+            "data": [
+                {},
+                {"non_field_errors": [f"Category with id {unknown} not found"]}
+            ]
+        }
+        assert category_repository.get_by_id(category.id).name == category.name
+
+    def test_bulk_delete_categories_and_return_204(
+        self,
+        category: Category,
+        other_category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save_many([category, other_category])
+
+        response = APIClient().delete(
+            self.url,
+            data={"ids": [str(category.id)]},
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert category_repository.list() == [other_category]
+
+    def test_bulk_delete_reports_unknown_ids_per_item_and_deletes_nothing(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        unknown = uuid4()
+
+        response = APIClient().delete(
+            self.url,
+            data={"ids": [str(category.id), str(unknown)]},
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"ids": {1: [f"Category with id {unknown} not found"]}}
+        assert category_repository.list() == [category]
+
+@pytest.mark.django_db
+class TestStreamListAPI:
+    def test_stream_categories_as_ndjson_when_accept_header_asks_for_it(
+        self,
+        category: Category,
+        other_category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save_many([category, other_category])
+
+        response = APIClient().get("/api/categories/", HTTP_ACCEPT="application/x-ndjson")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming is True
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ] == [
+            {
+                "id": str(item.id),
+                "name": item.name,
+                "description": item.description,
+                "is_active": item.is_active,
+                "genre_count": 0
+            }
+            for item in sorted([category, other_category], key=lambda item: item.id)
+        ]
+
+    def test_stream_categories_as_ndjson_when_format_query_param_asks_for_it(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+
+        response = APIClient().get("/api/categories/", {"format": "ndjson"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming is True
+        assert b"".join(response.streaming_content).decode().count("\n") == 1
+
+    def test_stream_empty_catalog(self):
+        response = APIClient().get("/api/categories/", HTTP_ACCEPT="application/x-ndjson")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b""
+
+    def test_stream_applies_filters_and_sort(self, category_repository: DjangoORMCategoryRepository):
+        category_repository.save_many([
+            Category(name="Movies", is_active=False),
+            Category(name="Movie", is_active=True),
+            Category(name="Mockumentary", is_active=False),
+        ])
+
+        response = APIClient().get(
+            "/api/categories/",
+            {"format": "ndjson", "is_active": "false", "name_prefix": "Mo", "sort": "name"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            json.loads(line)["name"]
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ] == ["Mockumentary", "Movies"]
+
+    @pytest.mark.parametrize("params", [
+        {"page_size": "abc"},
+        {"is_active": "maybe"},
+        {"sort": "description"},
+        {"page_size": "10"},
+        {"cursor": "anything"},
+    ])
+    def test_stream_rejects_invalid_or_paging_parameters(self, params: dict):
+        response = APIClient().get("/api/categories/", {"format": "ndjson", **params})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(json.loads(response.content)) == set(params)
+
+@pytest.mark.django_db
+class TestListFilterAndSortAPI:
+    @pytest.fixture(autouse=True)
+    def categories(self, category_repository: DjangoORMCategoryRepository):
+        category_repository.save_many([
+            Category(name="Movie", is_active=True),
+            Category(name="Movies", is_active=False),
+            Category(name="Documentary", is_active=True),
+        ])
+
+    @pytest.mark.parametrize("params, expected", [
+        ({"sort": "name"}, ["Documentary", "Movie", "Movies"]),
+        ({"sort": "name", "is_active": "false"}, ["Movies"]),
+        ({"sort": "name", "is_active": "true"}, ["Documentary", "Movie"]),
+        ({"sort": "name", "name_prefix": "Movie"}, ["Movie", "Movies"]),
+        ({"sort": "name", "name_contains": "DOC"}, ["Documentary"]),
+    ])
+    def test_list_categories_filtered_and_sorted(self, params: dict, expected: list[str]):
+        response = APIClient().get("/api/categories/", params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["name"] for item in response.data["data"]] == expected
+
+    def test_return_400_when_sort_is_invalid(self):
+        response = APIClient().get("/api/categories/", {"sort": "description"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "sort" in response.data
+
+@pytest.mark.django_db
+class TestSingleQueryWritesAPI:
+    def test_partial_update_issues_a_single_query(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries
+    ):
+        category_repository.save(category)
+
+        with django_assert_num_queries(1):
+            response = APIClient().patch(
+                f"/api/categories/{category.id}/",
+                data={"name": "Series"},
+                format="json"
+            )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_delete_issues_a_single_query(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries
+    ):
+        category_repository.save(category)
+
+        with django_assert_num_queries(1):
+            response = APIClient().delete(f"/api/categories/{category.id}/")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+@pytest.mark.django_db
+class TestOptimisticConcurrencyAPI:
+    def test_retrieve_returns_version_as_etag(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+
+        response = APIClient().get(f"/api/categories/{category.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == category_etag(1, "application/json")
+
+    def test_partial_update_with_current_etag_succeeds(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        etag = APIClient().get(f"/api/categories/{category.id}/")["ETag"]
+
+        response = APIClient().patch(
+            f"/api/categories/{category.id}/",
+            data={"name": "Series"},
+            format="json",
+            HTTP_IF_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert APIClient().get(f"/api/categories/{category.id}/")["ETag"] == category_etag(2, "application/json")
+
+    def test_update_with_stale_etag_returns_409_and_keeps_category(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        category_repository.update_fields(category.id, {"name": "Documentary"})
+
+        response = APIClient().put(
+            f"/api/categories/{category.id}/",
+            data={"name": "Series", "description": "Series description", "is_active": True},
+            format="json",
+            HTTP_IF_MATCH=category_etag(1, "application/json")
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data == {"detail": f"Category with id {category.id} is not at version 1"}
+        assert category_repository.get_by_id(category.id).name == "Documentary"
+
+    def test_update_with_etag_of_missing_category_returns_404(self):
+        response = APIClient().patch(
+            f"/api/categories/{uuid4()}/",
+            data={"name": "Series"},
+            format="json",
+            HTTP_IF_MATCH=category_etag(1, "application/json")
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("if_match", ['W/"1"', "1", '"abc"'])
+    def test_update_with_malformed_if_match_returns_400(
+        self,
+        if_match: str,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+
+        response = APIClient().patch(
+            f"/api/categories/{category.id}/",
+            data={"name": "Series"},
+            format="json",
+            HTTP_IF_MATCH=if_match
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "If-Match" in response.data
+
+@pytest.mark.django_db
+class TestConditionalGetAPI:
+    def test_retrieve_returns_304_when_etag_matches_without_loading_row(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries
+    ):
+        category_repository.save(category)
+
+        with django_assert_num_queries(1):
+            response = APIClient().get(
+                f"/api/categories/{category.id}/",
+                HTTP_IF_NONE_MATCH=category_etag(1, "application/json")
+            )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == category_etag(1, "application/json")
+        assert response.content == b""
+
+    def test_retrieve_returns_200_when_category_changed(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        category_repository.update_fields(category.id, {"name": "Series"})
+
+        response = APIClient().get(
+            f"/api/categories/{category.id}/",
+            HTTP_IF_NONE_MATCH=category_etag(1, "application/json")
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == category_etag(2, "application/json")
+        assert response.data["data"]["name"] == "Series"
+
+    def test_retrieve_etag_depends_on_the_media_type(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+        url = f"/api/categories/{category.id}/"
+        json_etag = APIClient().get(url, HTTP_ACCEPT="application/json")["ETag"]
+
+        response = APIClient().get(url, HTTP_ACCEPT="text/html", HTTP_IF_NONE_MATCH=json_etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] not in (json_etag, '"1"')
+
+    @pytest.mark.parametrize("if_match, expected_status", [
+        ('"1-0000000g"', status.HTTP_400_BAD_REQUEST),
+        ('"1-abc"', status.HTTP_400_BAD_REQUEST),
+        ('"1"', status.HTTP_204_NO_CONTENT),
+    ])
+    def test_if_match_reads_the_version_in_front_of_the_media_type_suffix(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        if_match: str,
+        expected_status: int
+    ):
+        category_repository.save(category)
+
+        response = APIClient().patch(
+            f"/api/categories/{category.id}/",
+            data={"name": "Series"},
+            format="json",
+            HTTP_IF_MATCH=if_match
+        )
+
+        assert response.status_code == expected_status
+
+    def test_retrieve_with_if_none_match_returns_404_for_missing_category(self):
+        response = APIClient().get(f"/api/categories/{uuid4()}/", HTTP_IF_NONE_MATCH=category_etag(1, "application/json"))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_returns_304_until_a_category_changes(
+        self,
+        category: Category,
+        other_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries
+    ):
+        category_repository.save(category)
+        etag = APIClient().get("/api/categories/")["ETag"]
+
+        with django_assert_num_queries(1):
+            response = APIClient().get("/api/categories/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+        category_repository.save(other_category)
+        response = APIClient().get("/api/categories/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert len(response.data["data"]) == 2
+
+    def test_list_validates_query_before_answering_304(
+        self,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        etag = APIClient().get("/api/categories/")["ETag"]
+
+        response = APIClient().get(
+            "/api/categories/",
+            {"page_size": 0},
+            HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_rejects_invalid_cursor_before_answering_304(self):
+        etag = APIClient().get("/api/categories/")["ETag"]
+
+        response = APIClient().get("/api/categories/", {"cursor": "garbage"}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"cursor": ["invalid cursor: garbage"]}
+
+    def test_list_etag_depends_on_the_media_type(self):
+        json_etag = APIClient().get("/api/categories/", HTTP_ACCEPT="application/json")["ETag"]
+        indented_etag = APIClient().get("/api/categories/", HTTP_ACCEPT="application/json; indent=2")["ETag"]
+
+        response = APIClient().get("/api/categories/", HTTP_ACCEPT="text/html", HTTP_IF_NONE_MATCH=json_etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len({json_etag, indented_etag, response["ETag"]}) == 3
+
+@pytest.mark.django_db
+class TestImportAPI:
+    url = "/api/categories/import/"
+
+    def test_import_csv_upload_and_report_rejects(self, category_repository: DjangoORMCategoryRepository):
+        upload = SimpleUploadedFile(
+            "catalog.csv",
+            b"name,description,is_active\nMovie,Films,true\n,Nameless,true\n",
+            content_type="text/csv"
+        )
+
+        response = APIClient().post(self.url, data={"file": upload}, format="multipart")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["imported"] == 1
+        assert response.data["rejected"] == 1
+        assert response.data["rejects"] == [{
+            "record": 2,
+            "data": {"name": "", "description": "Nameless", "is_active": "true"},
+            "error": "name can not be empty or null"
+        }]
+        assert [item.name for item in category_repository.list()] == ["Movie"]
+
+    def test_import_ndjson_with_explicit_format(self, category_repository: DjangoORMCategoryRepository):
+        upload = SimpleUploadedFile("catalog.txt", b'{"name": "Movie"}\n{"name": "Series"}\n')
+
+        response = APIClient().post(self.url, data={"file": upload, "format": "ndjson"}, format="multipart")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["imported"] == 2
+        assert sorted(item.name for item in category_repository.list()) == ["Movie", "Series"]
+
+    def test_return_400_when_format_cannot_be_inferred(self):
+        upload = SimpleUploadedFile("catalog.txt", b"name\nMovie\n")
+
+        response = APIClient().post(self.url, data={"file": upload}, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"format": ["Cannot tell the format from the file name."]}
+
+@pytest.mark.django_db
+class TestExportAPI:
+    url = "/api/categories/export/"
+
+    def test_export_ndjson_by_default(
+        self,
+        category: Category,
+        other_category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save_many([category, other_category])
+
+        response = APIClient().get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert "Content-Encoding" not in response
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert sorted(json.loads(line)["id"] for line in lines) == sorted([str(category.id), str(other_category.id)])
+
+    def test_export_gzipped_csv_when_client_accepts_gzip(
+        self,
+        category: Category,
+        category_repository: DjangoORMCategoryRepository
+    ):
+        category_repository.save(category)
+
+        response = APIClient().get(self.url, {"output": "csv"}, HTTP_ACCEPT_ENCODING="gzip, br")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        assert content.splitlines()[0] == "id,name,description,is_active"
+        assert content.splitlines()[1].startswith(f"{category.id},")
+
+    def test_return_400_when_output_is_invalid(self):
+        response = APIClient().get(self.url, {"output": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,68 +1,169 @@
+import csv
+import gzip
+import os
+from io import TextIOWrapper
+from typing import Iterator
+
+from django.http import FileResponse, Http404, HttpRequest, HttpResponseBase, StreamingHttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
-    HTTP_404_NOT_FOUND
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT
 )
 
-from src.core.category.application.exceptions import CategoryNotFound
+from src.core.category.application.exceptions import (
+    CategoryNotFound,
+    CategoryVersionConflict,
+    InvalidCategoryBatch,
+    InvalidCursor
+)
 from src.core.category.application.usecases import (
+    BulkCreateCategory,
+    BulkCreateCategoryRequest,
+    BulkDeleteCategory,
+    BulkDeleteCategoryRequest,
+    BulkUpdateCategory,
+    BulkUpdateCategoryItem,
+    BulkUpdateCategoryRequest,
     CreateCategory,
     CreateCategoryRequest,
     DeleteCategory,
     DeleteCategoryRequest,
     GetCategoryRequest,
     GetCategory,
+    GetCategoryRevision,
+    GetCategoryVersion,
+    GetCategoryVersionRequest,
     ListCategory,
+    ListCategoryRequest,
+    StreamCategory,
+    StreamCategoryRequest,
     UpdateCategory,
     UpdateCategoryRequest
 )
-from .repository import DjangoORMCategoryRepository
+from .etags import category_etag, category_list_etag, if_none_match_matches, parse_if_match
+from .exporting import CONTENT_TYPES, export_categories
+from .importing import CategoryImporter, format_from_name, iter_records
+from .renderers import CategoryJSONRenderer, NDJSONRenderer, SerializableResponse
+from .repository import get_category_repository, get_category_snapshot
 from .serializers import (
+    BulkCreateCategoryRequestSerializer,
+    BulkCreateCategoryResponseSerializer,
+    BulkDeleteCategoryRequestSerializer,
+    BulkUpdateCategoryRequestSerializer,
     CreateCategoryRequestSerializer,
     CreateCategoryResponseSerializer,
     DeleteCategoryRequestSerializer,
+    ExportCategoryRequestSerializer,
+    ImportCategoryRequestSerializer,
+    ImportCategoryResponseSerializer,
+    ListCategoryRequestSerializer,
     ListCategoryResponseSerializer,
     PartialUpdateCategoryRequestSerializer,
     RetrieveCategoryRequestSerializer,
     RetrieveCategoryResponseSerializer,
-    UpdateCategoryRequestSerializer
+    UpdateCategoryRequestSerializer,
+    MAX_IMPORT_REJECTS
 )
 from .schema_extensions import category_viewset_schema
 
 
 @category_viewset_schema
 class CategoryViewSet(viewsets.ViewSet):
+    renderer_classes = [
+        CategoryJSONRenderer if renderer is JSONRenderer else renderer
+        for renderer in api_settings.DEFAULT_RENDERER_CLASSES
+    ] + [NDJSONRenderer]
+
     def list(self, request: Request) -> Response:
-        usecase = ListCategory(repository=DjangoORMCategoryRepository())
-        response = usecase.execute()
-        serializer = ListCategoryResponseSerializer(instance=response)
+        serializer = ListCategoryRequestSerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+
+        if isinstance(request.accepted_renderer, NDJSONRenderer):
+            return self._stream_list(request, serializer.validated_data)
+
+        # The revision is read before the page, so a write landing in between
+        # can only make the ETag older than the body, never newer.
+        revision = GetCategoryRevision(repository=get_category_repository()).execute().revision
+        etag = category_list_etag(revision, request.accepted_media_type)
+        if if_none_match_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        usecase = ListCategory(repository=get_category_repository())
+        try:
+            response = usecase.execute(ListCategoryRequest(**serializer.validated_data))
+        except InvalidCursor as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"cursor": [str(e)]})
 
         return Response(
             status=HTTP_200_OK,
-            data=serializer.data
+            data=SerializableResponse(response, ListCategoryResponseSerializer),
+            headers={"ETag": etag}
+        )
+
+    def _stream_list(self, request: Request, query: dict) -> StreamingHttpResponse | Response:
+        # The stream already carries every matching category, so paging
+        # parameters are rejected rather than silently ignored.
+        paging = {
+            name: ["Not supported when streaming NDJSON."]
+            for name in ("cursor", "page_size") if name in request.query_params
+        }
+        if paging:
+            return Response(status=HTTP_400_BAD_REQUEST, data=paging)
+
+        query = {name: value for name, value in query.items() if name not in ("cursor", "page_size")}
+        use_case = StreamCategory(repository=get_category_repository())
+        response = use_case.execute(StreamCategoryRequest(**query))
+
+        return StreamingHttpResponse(
+            request.accepted_renderer.stream(response.data),
+            status=HTTP_200_OK,
+            content_type=NDJSONRenderer.media_type
         )
 
     def retrieve(self, request: Request, pk: None) -> Response:
         serializer = RetrieveCategoryRequestSerializer(data={"id": pk})
         serializer.is_valid(raise_exception=True)
 
-        use_case = GetCategory(repository=DjangoORMCategoryRepository())
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            try:
+                version = GetCategoryVersion(repository=get_category_repository()).execute(
+                    GetCategoryVersionRequest(serializer.validated_data["id"])
+                ).version
+            except CategoryNotFound:
+                return Response(status=HTTP_404_NOT_FOUND)
+
+            etag = category_etag(version, request.accepted_media_type)
+            if if_none_match_matches(if_none_match, etag):
+                return Response(status=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        use_case = GetCategory(repository=get_category_repository())
 
         try:
-            request = GetCategoryRequest(serializer.validated_data["id"])
-            response = use_case.execute(request)
+            response = use_case.execute(GetCategoryRequest(serializer.validated_data["id"]))
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
-        category_out = RetrieveCategoryResponseSerializer(instance=response)
-
         return Response(
             status=HTTP_200_OK,
-            data=category_out.data
+            data=SerializableResponse(response, RetrieveCategoryResponseSerializer),
+            headers={"ETag": category_etag(response.version, request.accepted_media_type)}
         )
 
     def create(self, request: Request) -> Response:
@@ -70,7 +171,7 @@ class CategoryViewSet(viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
 
         request = CreateCategoryRequest(**serializer.validated_data)
-        use_case = CreateCategory(repository=DjangoORMCategoryRepository())
+        use_case = CreateCategory(repository=get_category_repository())
         output = use_case.execute(request)
         serializer = CreateCategoryResponseSerializer(output)
 
@@ -88,12 +189,19 @@ class CategoryViewSet(viewsets.ViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        request = UpdateCategoryRequest(**serializer.validated_data)
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
+        try:
+            version = parse_if_match(request.headers.get("If-Match"))
+        except ValueError as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"If-Match": [str(e)]})
+
+        request = UpdateCategoryRequest(**serializer.validated_data, version=version)
+        use_case = UpdateCategory(repository=get_category_repository())
         try:
             use_case.execute(request)
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
+        except CategoryVersionConflict as e:
+            return Response(status=HTTP_409_CONFLICT, data={"detail": str(e)})
 
         return Response(status=HTTP_204_NO_CONTENT)
 
@@ -104,13 +212,20 @@ class CategoryViewSet(viewsets.ViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        request_data = UpdateCategoryRequest(**serializer.validated_data)
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
+        try:
+            version = parse_if_match(request.headers.get("If-Match"))
+        except ValueError as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"If-Match": [str(e)]})
+
+        request_data = UpdateCategoryRequest(**serializer.validated_data, version=version)
+        use_case = UpdateCategory(repository=get_category_repository())
 
         try:
             use_case.execute(request_data)
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
+        except CategoryVersionConflict as e:
+            return Response(status=HTTP_409_CONFLICT, data={"detail": str(e)})
 
         return Response(status=HTTP_204_NO_CONTENT)
 
@@ -119,7 +234,7 @@ class CategoryViewSet(viewsets.ViewSet):
         serializer = DeleteCategoryRequestSerializer(data={"id": pk})
         serializer.is_valid(raise_exception=True)
 
-        use_case = DeleteCategory(repository=DjangoORMCategoryRepository())
+        use_case = DeleteCategory(repository=get_category_repository())
         try:
             use_case.execute(DeleteCategoryRequest(**serializer.validated_data))
         except CategoryNotFound:
@@ -127,4 +242,177 @@ class CategoryViewSet(viewsets.ViewSet):
 
         return Response(status=HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=["post", "put", "delete"])
+    def bulk(self, request: Request) -> Response:
+        if request.method == "POST":
+            return self._bulk_create(request)
+
+        if request.method == "PUT":
+            return self._bulk_update(request)
+
+        return self._bulk_destroy(request)
+
+    def _bulk_create(self, request: Request) -> Response:
+        serializer = BulkCreateCategoryRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        use_case = BulkCreateCategory(repository=get_category_repository())
+        try:
+            output = use_case.execute(BulkCreateCategoryRequest(
+                items=[CreateCategoryRequest(**item) for item in serializer.validated_data["data"]]
+            ))
+        except InvalidCategoryBatch as e:
+            return self._bulk_errors_response(e, size=len(serializer.validated_data["data"]))
+
+        serializer = BulkCreateCategoryResponseSerializer(
+            instance={"data": [{"id": id} for id in output.ids]}
+        )
+
+        return Response(
+            status=HTTP_201_CREATED,
+            data=serializer.data,
+        )
+
+    def _bulk_update(self, request: Request) -> Response:
+        serializer = BulkUpdateCategoryRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        use_case = BulkUpdateCategory(repository=get_category_repository())
+        try:
+            use_case.execute(BulkUpdateCategoryRequest(
+                items=[BulkUpdateCategoryItem(**item) for item in serializer.validated_data["data"]]
+            ))
+        except InvalidCategoryBatch as e:
+            return self._bulk_errors_response(e, size=len(serializer.validated_data["data"]))
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    def _bulk_destroy(self, request: Request) -> Response:
+        serializer = BulkDeleteCategoryRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        use_case = BulkDeleteCategory(repository=get_category_repository())
+        try:
+            use_case.execute(BulkDeleteCategoryRequest(**serializer.validated_data))
+        except InvalidCategoryBatch as e:
+            # Same shape as the serializer's per-item errors on `ids`.
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"ids": {index: [message] for index, message in e.errors.items()}}
+            )
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        serializer = ExportCategoryRequestSerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+        output = serializer.validated_data["output"]
+        compress = bool(re_accepts_gzip.search(request.headers.get("Accept-Encoding", "")))
+
+        use_case = StreamCategory(repository=get_category_repository())
+        response = use_case.execute(StreamCategoryRequest())
+
+        streaming = StreamingHttpResponse(
+            export_categories(response.data, output, compress=compress),
+            status=HTTP_200_OK,
+            content_type=CONTENT_TYPES[output],
+            headers={"Content-Disposition": f'attachment; filename="categories.{output}"'}
+        )
+        if compress:
+            streaming.headers["Content-Encoding"] = "gzip"
+        patch_vary_headers(streaming, ["Accept-Encoding"])
+        return streaming
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_(self, request: Request) -> Response:
+        serializer = ImportCategoryRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # Uploads past FILE_UPLOAD_MAX_MEMORY_SIZE are already spooled to a
+        # temporary file; records are read from it one at a time.
+        upload = serializer.validated_data["file"]
+        format = serializer.validated_data.get("format") or format_from_name(upload.name)
+        if format is None:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"format": ["Cannot tell the format from the file name."]}
+            )
+
+        rejects = []
+
+        def keep_reject(reject):
+            if len(rejects) < MAX_IMPORT_REJECTS:
+                rejects.append(reject)
+
+        try:
+            progress = CategoryImporter(repository=get_category_repository()).run(
+                iter_records(
+                    TextIOWrapper(upload.file, encoding="utf-8", newline=""),
+                    format
+                ),
+                on_reject=keep_reject
+            )
+        except (UnicodeDecodeError, csv.Error) as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"file": [f"Could not read the file: {e}"]})
+
+        serializer = ImportCategoryResponseSerializer(instance={
+            "imported": progress.imported,
+            "rejected": progress.rejected,
+            "rejects": rejects,
+        })
+
+        return Response(status=HTTP_200_OK, data=serializer.data)
+
+    def _bulk_errors_response(self, error: InvalidCategoryBatch, size: int) -> Response:
+        return Response(
+            status=HTTP_400_BAD_REQUEST,
+            data={
+                "data": [
+                    {"non_field_errors": [error.errors[index]]} if index in error.errors else {}
+                    for index in range(size)
+                ]
+            }
+        )
+
+
+SNAPSHOT_CHUNK_SIZE = 64 * 1024
+
+
+@require_safe
+def category_snapshot_view(request: HttpRequest) -> HttpResponseBase:
+    snapshot = get_category_snapshot()
+    if snapshot is None:
+        raise Http404("The category snapshot is disabled")
+
+    try:
+        file = snapshot.path.open("rb")
+    except FileNotFoundError:
+        snapshot.build()
+        file = snapshot.path.open("rb")
+
+    # Stat the open file: the path may be swapped by a rebuild meanwhile.
+    stat = os.fstat(file.fileno())
+    etag = snapshot.etag(stat)
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is not None:
+        file.close()
+    elif re_accepts_gzip.search(request.headers.get("Accept-Encoding", "")):
+        # FileResponse hands the file to wsgi.file_wrapper, which servers
+        # send with sendfile() instead of copying it through Python.
+        response = FileResponse(file, content_type="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers.pop("Content-Disposition", None)
+    else:
+        response = StreamingHttpResponse(_decompressed(file), content_type="application/json")
+
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = http_date(stat.st_mtime)
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
 
+def _decompressed(file) -> Iterator[bytes]:
+    with file, gzip.GzipFile(fileobj=file) as decompressed:
+        while chunk := decompressed.read(SNAPSHOT_CHUNK_SIZE):
+            yield chunk
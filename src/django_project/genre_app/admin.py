@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from django_project.genre_app.models import Genre
+from django_project.genre_app.repository import get_genre_repository
+
+
+class GenreAdmin(admin.ModelAdmin):
+    # Deleting a genre row directly would leave the link cascade to the
+    # database and every linked category's genre_count unchanged, so deletes
+    # go through the repository, which also moves the counters.
+    def delete_model(self, request, obj: Genre) -> None:
+        get_genre_repository().delete(obj.id)
+
+    def delete_queryset(self, request, queryset) -> None:
+        repository = get_genre_repository()
+        for id in queryset.values_list("id", flat=True):
+            repository.delete(id)
+
+admin.site.register(Genre, GenreAdmin)
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class GenreAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'django_project.genre_app'
@@ -0,0 +1,31 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.core.category.application.usecases import StreamCategory, StreamCategoryRequest
+from django_project.category_app.repository import DjangoORMCategoryRepository
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the id of every category no genre is linked to, one per line. "
+        "Categories are read in --chunk-size chunks and each chunk is checked "
+        "against the genre links with one indexed query."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, chunk_size: int, **options):
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be >= 1")
+
+        categories = StreamCategory(repository=DjangoORMCategoryRepository()).execute(
+            StreamCategoryRequest(chunk_size=chunk_size)
+        ).data
+        repository = DjangoORMGenreRepository()
+
+        while chunk := [category.id for category in islice(categories, chunk_size)]:
+            for category_id in sorted(repository.find_unused_categories(chunk)):
+                self.stdout.write(str(category_id))
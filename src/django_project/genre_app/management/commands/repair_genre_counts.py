@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the genre_count of every category from the genre links. "
+        "Categories are walked once in id order, --batch-size per transaction, "
+        "and only the counters that drifted are written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, batch_size: int, **options):
+        if batch_size < 1:
+            raise CommandError("--batch-size must be >= 1")
+
+        started = time.perf_counter()
+        repaired = DjangoORMGenreRepository().repair_genre_counts(batch_size=batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Repaired {repaired:,} genre counts in {time.perf_counter() - started:.1f}s"
+        ))
@@ -0,0 +1,81 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:55
+
+from contextlib import contextmanager
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+@contextmanager
+def _cascading_foreign_keys(schema_editor):
+    # Django emulates ON DELETE CASCADE by selecting the related rows first;
+    # the link table declares it in the database instead, so deleting a genre
+    # or a category stays one DELETE statement.
+    templates = {
+        name: getattr(schema_editor, name)
+        for name in ("sql_create_fk", "sql_create_inline_fk")
+        if getattr(schema_editor, name)
+    }
+    for name, template in templates.items():
+        setattr(schema_editor, name, template.replace("(%(to_column)s)", "(%(to_column)s) ON DELETE CASCADE"))
+    try:
+        yield
+    finally:
+        for name, template in templates.items():
+            setattr(schema_editor, name, template)
+
+
+def create_genre_category_table(apps, schema_editor):
+    with _cascading_foreign_keys(schema_editor):
+        schema_editor.create_model(apps.get_model("genre_app", "GenreCategory"))
+
+
+def delete_genre_category_table(apps, schema_editor):
+    schema_editor.delete_model(apps.get_model("genre_app", "GenreCategory"))
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('category_app', '0004_category_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Genre',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'db_table': 'genre',
+                'indexes': [models.Index(fields=['name', 'id'], name='genre_name_id_idx')],
+            },
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='GenreCategory',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('category', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='genre_links', to='category_app.category')),
+                        ('genre', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='category_links', to='genre_app.genre')),
+                    ],
+                    options={
+                        'db_table': 'genre_category',
+                        'constraints': [models.UniqueConstraint(fields=('genre', 'category'), name='genre_category_unique')],
+                    },
+                ),
+            ],
+        ),
+        migrations.RunPython(create_genre_category_table, delete_genre_category_table),
+        migrations.AddField(
+            model_name='genre',
+            name='categories',
+            field=models.ManyToManyField(related_name='genres', through='genre_app.GenreCategory', to='category_app.category'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from contextlib import contextmanager
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+@contextmanager
+def _cascading_foreign_keys(schema_editor):
+    # Same as in 0001_initial: SQLite rebuilds the table to alter a column,
+    # and the rebuilt foreign keys must keep their ON DELETE CASCADE.
+    templates = {
+        name: getattr(schema_editor, name)
+        for name in ("sql_create_fk", "sql_create_inline_fk")
+        if getattr(schema_editor, name)
+    }
+    for name, template in templates.items():
+        setattr(schema_editor, name, template.replace("(%(to_column)s)", "(%(to_column)s) ON DELETE CASCADE"))
+    try:
+        yield
+    finally:
+        for name, template in templates.items():
+            setattr(schema_editor, name, template)
+
+
+class AlterCascadingField(migrations.AlterField):
+    # AlterField.database_backwards runs database_forwards, so this covers both.
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        with _cascading_foreign_keys(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0001_initial'),
+    ]
+
+    operations = [
+        AlterCascadingField(
+            model_name='genrecategory',
+            name='category',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='genre_links', to='category_app.category'),
+        ),
+        migrations.AddIndex(
+            model_name='genrecategory',
+            index=models.Index(fields=['category', 'genre'], name='genre_category_category_idx'),
+        ),
+    ]
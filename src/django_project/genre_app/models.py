@@ -0,0 +1,45 @@
+from uuid import uuid4
+
+from django.db import models
+
+class Genre(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4)
+    name = models.CharField(max_length=255)
+    is_active = models.BooleanField(default=True)
+    categories = models.ManyToManyField(
+        "category_app.Category",
+        through="GenreCategory",
+        related_name="genres"
+    )
+
+    class Meta:
+        db_table = "genre"
+        indexes = [
+            models.Index(fields=["name", "id"], name="genre_name_id_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+class GenreCategory(models.Model):
+    # Both foreign keys are created ON DELETE CASCADE by the initial
+    # migration, so Django leaves the cascade to the database (DO_NOTHING)
+    # and deletes stay a single statement. The unique (genre, category)
+    # index serves lookups by genre and (category, genre) the reverse ones,
+    # so neither column needs an index of its own.
+    genre = models.ForeignKey(Genre, on_delete=models.DO_NOTHING, related_name="category_links", db_index=False)
+    category = models.ForeignKey(
+        "category_app.Category",
+        on_delete=models.DO_NOTHING,
+        related_name="genre_links",
+        db_index=False
+    )
+
+    class Meta:
+        db_table = "genre_category"
+        constraints = [
+            models.UniqueConstraint(fields=["genre", "category"], name="genre_category_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["category", "genre"], name="genre_category_category_idx"),
+        ]
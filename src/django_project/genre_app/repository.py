@@ -0,0 +1,226 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Iterable, Iterator
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from src.core.genre.domain import Genre, GenreProjection, GenreRepository
+from django_project.category_app.models import Category as CategoryModel
+from django_project.category_app.repository import notify_categories_changed
+from .models import Genre as GenreModel, GenreCategory
+
+
+@dataclass
+class DjangoORMGenreRepository(GenreRepository):
+    """
+    Genres and their category links live in two tables. Reads never go
+    through the many-to-many manager per genre: category ids are loaded for
+    all requested genres with one query on the link table. Updates write
+    only the links that changed since the genre was loaded or last written.
+
+    Every link written or deleted moves the linked category's genre_count in
+    the same transaction; `on_categories_changed` gets the changed category
+    ids after such a commit. Genre rows are deleted through `delete` only,
+    the admin included; a delete that skips it leaves the counters to
+    repair_genre_counts.
+    """
+    genre_model: type[GenreModel] = GenreModel
+    link_model: type[GenreCategory] = GenreCategory
+    category_model: type[CategoryModel] = CategoryModel
+    batch_size: int = 500
+    on_categories_changed: Callable[[set[UUID]], None] | None = None
+
+    def save(self, genre: Genre) -> None:
+        with transaction.atomic():
+            self.genre_model.objects.create(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active
+            )
+            self._link(genre.id, genre.categories)
+            self._count_genres(genre.categories, 1)
+        genre.clear_category_changes()
+
+    def get_by_id(self, id: UUID) -> Genre | None:
+        row = self.genre_model.objects.filter(id=id).values_list("id", "name", "is_active").first()
+        if row is None:
+            return None
+
+        return self._to_genres([row])[0]
+
+    def update(self, genre: Genre) -> int:
+        with transaction.atomic():
+            updated = self.genre_model.objects.filter(id=genre.id).update(
+                name=genre.name,
+                is_active=genre.is_active
+            )
+            if updated:
+                added, removed = self._relink(genre)
+                self._count_genres(added, 1)
+                self._count_genres(removed, -1)
+
+        if updated:
+            genre.clear_category_changes()
+        return updated
+
+    def delete(self, id: UUID) -> int:
+        with transaction.atomic():
+            # Locking the genre keeps a concurrent update from relinking it
+            # between the counter update and the delete.
+            if self.genre_model.objects.select_for_update().filter(id=id).values_list("id").first() is None:
+                return 0
+
+            self._count_genres(self.link_model.objects.filter(genre_id=id).values("category_id"), -1)
+            self.genre_model.objects.filter(id=id).delete()
+
+        return 1
+
+    def list_by_category(self, category_ids: set[UUID], match_all: bool = False) -> list[Genre]:
+        if not category_ids:
+            return []
+
+        # Both forms read the (category, genre) index only; "all" keeps the
+        # genres linked to every requested category.
+        links = self.link_model.objects.filter(category_id__in=category_ids)
+        if match_all:
+            links = links.values("genre_id").annotate(matched=Count("category_id")).filter(
+                matched=len(category_ids)
+            )
+        rows = self.genre_model.objects.filter(id__in=links.values("genre_id")).order_by(
+            "name", "id"
+        ).values_list("id", "name", "is_active")
+
+        return self._to_genres(list(rows))
+
+    def find_unused_categories(self, category_ids: Iterable[UUID]) -> set[UUID]:
+        category_ids = set(category_ids)
+        if not category_ids:
+            return set()
+
+        used = self.link_model.objects.filter(category_id__in=category_ids).values_list(
+            "category_id", flat=True
+        ).distinct()
+        return category_ids - set(used)
+
+    def iter_all(self, chunk_size: int) -> Iterator[GenreProjection]:
+        # Keyset chunks over the genre primary key, each followed by one
+        # query on genre_category for that chunk's links, so no cursor is
+        # held open while the caller consumes rows.
+        genres = self.genre_model.objects.order_by("id").values_list("id", "name", "is_active")
+        last_id = None
+        while True:
+            chunk = list((genres if last_id is None else genres.filter(id__gt=last_id))[:chunk_size])
+            if not chunk:
+                return
+
+            categories = defaultdict(list)
+            links = self.link_model.objects.filter(genre_id__in=[id for id, _, _ in chunk]).order_by(
+                "genre_id", "category_id"
+            ).values_list("genre_id", "category_id")
+            for genre_id, category_id in links:
+                categories[genre_id].append(category_id)
+
+            for id, name, is_active in chunk:
+                yield GenreProjection(id=id, name=name, is_active=is_active, categories=tuple(categories[id]))
+            last_id = chunk[-1][0]
+
+    def _link(self, genre_id: UUID, category_ids: set[UUID], ignore_conflicts: bool = False) -> None:
+        self.link_model.objects.bulk_create(
+            [self.link_model(genre_id=genre_id, category_id=category_id) for category_id in category_ids],
+            batch_size=self.batch_size,
+            ignore_conflicts=ignore_conflicts
+        )
+
+    def _relink(self, genre: Genre) -> tuple[set[UUID], set[UUID]]:
+        if genre.persisted_categories is not None and not (genre.added_categories or genre.removed_categories):
+            return set(), set()
+
+        # The genre row is locked by the update that precedes this, so the
+        # stored links are current and the diff below is exact, which the
+        # genre counters depend on.
+        links = self.link_model.objects.filter(genre_id=genre.id)
+        linked = set(links.values_list("category_id", flat=True))
+        added, removed = genre.categories - linked, linked - genre.categories
+
+        if removed:
+            links.filter(category_id__in=removed).delete()
+        self._link(genre.id, added)
+        return added, removed
+
+    def _count_genres(self, category_ids: set[UUID] | QuerySet, delta: int) -> None:
+        if not isinstance(category_ids, QuerySet) and not category_ids:
+            return
+
+        # genre_count is part of the category representation, so changing it
+        # moves version and updated_at like any other category write.
+        changed = self.category_model.objects.filter(id__in=category_ids).update(
+            genre_count=F("genre_count") + delta,
+            version=F("version") + 1,
+            updated_at=timezone.now()
+        )
+        if changed and self.on_categories_changed is not None:
+            if isinstance(category_ids, QuerySet):
+                # Read before the caller deletes the links it selects.
+                category_ids = set(category_ids.values_list("category_id", flat=True))
+            transaction.on_commit(partial(self.on_categories_changed, set(category_ids)))
+
+    def repair_genre_counts(self, batch_size: int | None = None) -> int:
+        """
+        Recompute every category's genre_count from the link table in one
+        pass over the categories, one id-ordered batch per transaction.
+        Returns how many counters were wrong.
+        """
+        batch_size = batch_size or self.batch_size
+        linked = self.link_model.objects.filter(category_id=OuterRef("id")).order_by().values(
+            "category_id"
+        ).annotate(count=Count("genre_id")).values("count")
+        actual = Coalesce(Subquery(linked), 0)
+
+        categories = self.category_model.objects.order_by("id")
+        repaired, last_id = 0, None
+        while True:
+            batch = categories if last_id is None else categories.filter(id__gt=last_id)
+            bound = list(batch.values_list("id", flat=True)[batch_size - 1:batch_size])
+            if bound:
+                batch = batch.filter(id__lte=bound[0])
+
+            with transaction.atomic():
+                repaired += batch.exclude(genre_count=actual).update(
+                    genre_count=actual,
+                    version=F("version") + 1,
+                    updated_at=timezone.now()
+                )
+
+            if not bound:
+                return repaired
+            last_id = bound[0]
+
+    def _to_genres(self, rows: list[tuple], all_genres: bool = False) -> list[Genre]:
+        links = self.link_model.objects.values_list("genre_id", "category_id")
+        if not all_genres:
+            links = links.filter(genre_id__in=[id for id, _, _ in rows])
+
+        categories = defaultdict(set)
+        for genre_id, category_id in links:
+            categories[genre_id].add(category_id)
+
+        genres = [
+            Genre(id=id, name=name, is_active=is_active, categories=categories[id])
+            for id, name, is_active in rows
+        ]
+        for genre in genres:
+            genre.clear_category_changes()
+        return genres
+
+    def list(self) -> list[Genre]:
+        rows = self.genre_model.objects.order_by("name", "id").values_list("id", "name", "is_active")
+        return self._to_genres(list(rows), all_genres=True)
+
+
+def get_genre_repository() -> GenreRepository:
+    return DjangoORMGenreRepository(on_categories_changed=notify_categories_changed)
@@ -0,0 +1,99 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema, extend_schema_view
+from .serializers import (
+    MATCH_ALL,
+    MATCH_ANY,
+    CreateGenreRequestSerializer,
+    CreateGenreResponseSerializer,
+    DeleteGenreRequestSerializer,
+    ExportGenreRequestSerializer,
+    ListGenreResponseSerializer,
+    PartialUpdateGenreRequestSerializer,
+    RetrieveGenreRequestSerializer,
+    RetrieveGenreResponseSerializer,
+    UpdateGenreRequestSerializer,
+)
+
+GENRE_NOT_FOUND = {
+    'description': 'Genre not found',
+    'content': {
+        'application/json': {
+            'example': {
+                'detail': 'Not found.'
+            }
+        }
+    }
+}
+
+INVALID_GENRE = {
+    'description': 'Invalid genre or unknown category ids',
+    'content': {
+        'application/json': {
+            'example': {
+                'error': 'Categories with provided IDs not found: 3fa85f64-5717-4562-b3fc-2c963f66afa6'
+            }
+        }
+    }
+}
+
+genre_viewset_schema = extend_schema_view(
+    list=extend_schema(
+        tags=['Genre'],
+        parameters=[
+            OpenApiParameter(
+                'categories',
+                OpenApiTypes.STR,
+                description='Comma-separated category ids; only genres linked to them are listed',
+            ),
+            OpenApiParameter(
+                'match',
+                OpenApiTypes.STR,
+                enum=[MATCH_ANY, MATCH_ALL],
+                default=MATCH_ANY,
+                description='Whether a genre needs any or all of the given categories',
+            ),
+        ],
+        responses={200: ListGenreResponseSerializer},
+    ),
+    create=extend_schema(
+        tags=['Genre'],
+        request=CreateGenreRequestSerializer,
+        responses={201: CreateGenreResponseSerializer, 400: INVALID_GENRE},
+    ),
+    retrieve=extend_schema(
+        tags=['Genre'],
+        request=RetrieveGenreRequestSerializer,
+        responses={200: RetrieveGenreResponseSerializer, 404: GENRE_NOT_FOUND},
+    ),
+    update=extend_schema(
+        tags=['Genre'],
+        request=UpdateGenreRequestSerializer,
+        responses={204: None, 400: INVALID_GENRE, 404: GENRE_NOT_FOUND},
+    ),
+    partial_update=extend_schema(
+        tags=['Genre'],
+        request=PartialUpdateGenreRequestSerializer,
+        responses={204: None, 400: INVALID_GENRE, 404: GENRE_NOT_FOUND},
+    ),
+    destroy=extend_schema(
+        tags=['Genre'],
+        request=DeleteGenreRequestSerializer,
+        responses={204: None, 404: GENRE_NOT_FOUND},
+    ),
+    export=extend_schema(
+        tags=['Genre'],
+        parameters=[ExportGenreRequestSerializer],
+        responses={
+            (200, 'application/x-ndjson'): OpenApiResponse(
+                OpenApiTypes.STR,
+                description='Every genre with a list of its category ids, one JSON object per line; '
+                            'gzip-encoded when Accept-Encoding allows it'
+            ),
+            (200, 'text/csv'): OpenApiResponse(
+                OpenApiTypes.STR,
+                description='Every genre as CSV with an id,name,is_active,categories header; '
+                            'categories holds space-separated ids'
+            ),
+        }
+    ),
+)
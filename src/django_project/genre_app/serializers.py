@@ -0,0 +1,69 @@
+from rest_framework import serializers
+
+
+MAX_FILTER_CATEGORIES = 100
+MATCH_ANY = "any"
+MATCH_ALL = "all"
+
+
+class SetField(serializers.ListField):
+    def to_internal_value(self, data):
+        return set(super().to_internal_value(data))
+
+    def to_representation(self, data):
+        return sorted(super().to_representation(data))
+
+class CommaSeparatedSetField(SetField):
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [item.strip() for item in data.split(",") if item.strip()]
+        return super().to_internal_value(data)
+
+class GenreResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255)
+    is_active = serializers.BooleanField()
+    categories = SetField(child=serializers.UUIDField())
+
+class ListGenreRequestSerializer(serializers.Serializer):
+    categories = CommaSeparatedSetField(
+        child=serializers.UUIDField(),
+        max_length=MAX_FILTER_CATEGORIES,
+        default=set
+    )
+    match = serializers.ChoiceField(choices=[MATCH_ANY, MATCH_ALL], default=MATCH_ANY)
+
+class ListGenreResponseSerializer(serializers.Serializer):
+    data = GenreResponseSerializer(many=True)
+
+class RetrieveGenreRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+
+class RetrieveGenreResponseSerializer(serializers.Serializer):
+    data = GenreResponseSerializer(source='*')
+
+class CreateGenreRequestSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=255, allow_blank=False)
+    is_active = serializers.BooleanField(default=True)
+    categories = SetField(child=serializers.UUIDField(), default=set)
+
+class CreateGenreResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+
+class UpdateGenreRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255, allow_blank=False)
+    is_active = serializers.BooleanField()
+    categories = SetField(child=serializers.UUIDField())
+
+class PartialUpdateGenreRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255, allow_blank=False, required=False)
+    is_active = serializers.BooleanField(required=False)
+    categories = SetField(child=serializers.UUIDField(), required=False)
+
+class DeleteGenreRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+
+class ExportGenreRequestSerializer(serializers.Serializer):
+    output = serializers.ChoiceField(choices=["ndjson", "csv"], default="ndjson")
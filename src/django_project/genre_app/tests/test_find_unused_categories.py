@@ -0,0 +1,29 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+import pytest
+
+from src.core.category.domain import Category
+from src.core.genre.domain import Genre
+from django_project.category_app.repository import DjangoORMCategoryRepository
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+@pytest.mark.django_db
+class TestFindUnusedCategoriesCommand:
+    def test_print_categories_without_genres(self):
+        categories = [Category(name=f"Category {index}") for index in range(5)]
+        DjangoORMCategoryRepository().save_many(categories)
+        DjangoORMGenreRepository().save(Genre(name="Drama", categories={categories[1].id, categories[3].id}))
+        out = StringIO()
+
+        call_command("find_unused_categories", "--chunk-size", "2", stdout=out)
+
+        assert out.getvalue().split() == sorted(
+            str(category.id) for category in [categories[0], categories[2], categories[4]]
+        )
+
+    def test_reject_invalid_chunk_size(self):
+        with pytest.raises(CommandError):
+            call_command("find_unused_categories", "--chunk-size", "0")
@@ -0,0 +1,286 @@
+from uuid import uuid4
+
+from django.contrib import admin
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from src.core.category.domain import Category
+from src.core.genre.domain import Genre, GenreProjection
+from django_project.category_app.models import Category as CategoryModel
+from django_project.category_app.repository import DjangoORMCategoryRepository
+from django_project.genre_app.models import Genre as GenreModel, GenreCategory
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+@pytest.fixture
+def categories() -> list[Category]:
+    categories = [Category(name=f"Category {index}") for index in range(3)]
+    DjangoORMCategoryRepository().save_many(categories)
+    return categories
+
+
+@pytest.mark.django_db
+class TestDjangoORMGenreRepository:
+    def test_save_genre_with_category_links(self, categories: list[Category]):
+        genre = Genre(name="Drama", categories={category.id for category in categories[:2]})
+
+        DjangoORMGenreRepository().save(genre)
+
+        assert GenreModel.objects.get(id=genre.id).name == "Drama"
+        assert set(GenreCategory.objects.filter(genre_id=genre.id).values_list("category_id", flat=True)) == {
+            categories[0].id,
+            categories[1].id
+        }
+
+    def test_get_by_id_loads_categories(self, categories: list[Category], django_assert_num_queries):
+        genre = Genre(name="Drama", is_active=False, categories={categories[0].id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        with django_assert_num_queries(2):
+            stored = repository.get_by_id(genre.id)
+
+        assert (stored.id, stored.name, stored.is_active, stored.categories) == (
+            genre.id, "Drama", False, {categories[0].id}
+        )
+        assert repository.get_by_id(uuid4()) is None
+
+    def test_list_takes_two_queries_whatever_the_number_of_genres(
+        self,
+        categories: list[Category],
+        django_assert_num_queries
+    ):
+        repository = DjangoORMGenreRepository()
+        for index in range(20):
+            repository.save(Genre(name=f"Genre {index:02}", categories={categories[index % 3].id}))
+        repository.save(Genre(name="Empty"))
+
+        with django_assert_num_queries(2):
+            genres = repository.list()
+
+        assert [genre.name for genre in genres] == ["Empty"] + [f"Genre {index:02}" for index in range(20)]
+        assert genres[0].categories == set()
+        assert genres[1].categories == {categories[0].id}
+
+    def test_iter_all_reads_genres_and_links_two_queries_per_chunk(
+        self,
+        categories: list[Category],
+        django_assert_num_queries
+    ):
+        repository = DjangoORMGenreRepository()
+        genres = [
+            Genre(name=f"Genre {index}", is_active=index % 2 == 0, categories={categories[index % 3].id})
+            for index in range(5)
+        ] + [Genre(name="Empty")]
+        for genre in genres:
+            repository.save(genre)
+
+        # Three chunks of two, then one query that finds no more genres.
+        with django_assert_num_queries(7):
+            exported = list(repository.iter_all(chunk_size=2))
+
+        assert exported == sorted(GenreProjection.from_genre(genre) for genre in genres)
+
+    def test_update_replaces_fields_and_links(self, categories: list[Category]):
+        genre = Genre(name="Drama", categories={categories[0].id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        genre.change_name("Comedy")
+        genre.categories = {categories[1].id, categories[2].id}
+
+        assert repository.update(genre) == 1
+        assert repository.get_by_id(genre.id).categories == {categories[1].id, categories[2].id}
+        assert repository.update(Genre(name="Missing")) == 0
+
+    def test_update_writes_only_the_changed_links(self, categories: list[Category]):
+        genre = Genre(name="Drama", categories={categories[0].id, categories[1].id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+        genre = repository.get_by_id(genre.id)
+        genre.replace_categories({categories[1].id, categories[2].id})
+
+        with CaptureQueriesContext(connection) as context:
+            assert repository.update(genre) == 1
+
+        statements = [query["sql"] for query in context.captured_queries if '"genre_category"' in query["sql"]]
+        assert [sql.split()[0] for sql in statements] == ["SELECT", "DELETE", "INSERT"]
+        assert categories[0].id.hex in statements[1] and categories[1].id.hex not in statements[1]
+        assert categories[2].id.hex in statements[2] and categories[1].id.hex not in statements[2]
+        assert repository.get_by_id(genre.id).categories == {categories[1].id, categories[2].id}
+        assert (genre.added_categories, genre.removed_categories) == (set(), set())
+
+    def test_update_without_category_changes_does_not_touch_links(self, categories: list[Category]):
+        genre = Genre(name="Drama", categories={categories[0].id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+        genre.change_name("Comedy")
+
+        with CaptureQueriesContext(connection) as context:
+            repository.update(genre)
+
+        assert not [query for query in context.captured_queries if '"genre_category"' in query["sql"]]
+
+    def test_delete_genre_leaves_its_links_to_the_database_cascade(self, categories: list[Category]):
+        genre = Genre(name="Drama", categories={categories[0].id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        with CaptureQueriesContext(connection) as context:
+            assert repository.delete(genre.id) == 1
+
+        statements = [query["sql"].split()[0] for query in context.captured_queries]
+        assert statements.count("DELETE") == 1
+        assert repository.delete(genre.id) == 0
+        assert not GenreCategory.objects.exists()
+
+    def test_deleting_a_category_removes_it_from_genres(self, categories: list[Category]):
+        genre = Genre(name="Drama", categories={categories[0].id, categories[1].id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        DjangoORMCategoryRepository().delete(categories[0].id)
+
+        assert repository.get_by_id(genre.id).categories == {categories[1].id}
+
+
+@pytest.mark.django_db
+class TestListByCategory:
+    @pytest.fixture
+    def genres(self, categories: list[Category]) -> list[Genre]:
+        genres = [
+            Genre(name="Action", categories={categories[0].id}),
+            Genre(name="Comedy"),
+            Genre(name="Drama", categories={categories[0].id, categories[1].id}),
+        ]
+        repository = DjangoORMGenreRepository()
+        for genre in genres:
+            repository.save(genre)
+        return genres
+
+    def test_list_genres_with_any_of_the_categories(
+        self,
+        categories: list[Category],
+        genres: list[Genre],
+        django_assert_num_queries
+    ):
+        with django_assert_num_queries(2):
+            found = DjangoORMGenreRepository().list_by_category({categories[0].id, categories[1].id})
+
+        assert [genre.name for genre in found] == ["Action", "Drama"]
+        assert found[1].categories == {categories[0].id, categories[1].id}
+
+    def test_list_genres_with_all_of_the_categories(self, categories: list[Category], genres: list[Genre]):
+        repository = DjangoORMGenreRepository()
+
+        assert repository.list_by_category({categories[0].id, categories[1].id}, match_all=True) == [genres[2]]
+        assert repository.list_by_category({categories[1].id, categories[2].id}, match_all=True) == []
+        assert repository.list_by_category(set()) == []
+
+    def test_find_unused_categories(self, categories: list[Category], genres: list[Genre]):
+        unknown = uuid4()
+
+        assert DjangoORMGenreRepository().find_unused_categories(
+            [category.id for category in categories] + [unknown]
+        ) == {categories[2].id, unknown}
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+    def test_lookup_by_category_uses_the_category_index(self, categories: list[Category]):
+        queryset = GenreCategory.objects.filter(category_id__in=[categories[0].id]).values("genre_id")
+        sql, params = queryset.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+
+        assert "USING COVERING INDEX genre_category_category_idx" in plan
+
+
+@pytest.mark.django_db
+class TestGenreCounts:
+    def count(self, category: Category) -> int:
+        return DjangoORMCategoryRepository().get_by_id(category.id).genre_count
+
+    def test_counts_follow_every_membership_change(self, categories: list[Category]):
+        repository = DjangoORMGenreRepository()
+        drama = Genre(name="Drama", categories={categories[0].id, categories[1].id})
+        action = Genre(name="Action", categories={categories[0].id})
+        repository.save(drama)
+        repository.save(action)
+        assert [self.count(category) for category in categories] == [2, 1, 0]
+
+        drama.replace_categories({categories[1].id, categories[2].id})
+        repository.update(drama)
+        assert [self.count(category) for category in categories] == [1, 1, 1]
+
+        repository.update(Genre(id=action.id, name="Action", categories={categories[2].id}))
+        assert [self.count(category) for category in categories] == [0, 1, 2]
+
+        repository.delete(drama.id)
+        assert [self.count(category) for category in categories] == [0, 0, 1]
+
+    def test_admin_deletes_move_the_counts(self, categories: list[Category]):
+        repository = DjangoORMGenreRepository()
+        genres = [
+            Genre(name="Drama", categories={categories[0].id, categories[1].id}),
+            Genre(name="Action", categories={categories[0].id}),
+            Genre(name="Comedy", categories={categories[1].id}),
+        ]
+        for genre in genres:
+            repository.save(genre)
+        genre_admin = admin.site._registry[GenreModel]
+
+        genre_admin.delete_model(None, GenreModel.objects.get(id=genres[0].id))
+        assert [self.count(category) for category in categories] == [1, 1, 0]
+
+        genre_admin.delete_queryset(None, GenreModel.objects.filter(id__in=[genres[1].id, genres[2].id]))
+        assert [self.count(category) for category in categories] == [0, 0, 0]
+        assert not GenreModel.objects.exists()
+
+    def test_count_change_moves_category_version(self, categories: list[Category]):
+        version = DjangoORMCategoryRepository().get_version(categories[0].id)
+
+        DjangoORMGenreRepository().save(Genre(name="Drama", categories={categories[0].id}))
+
+        assert DjangoORMCategoryRepository().get_version(categories[0].id) == version + 1
+        assert DjangoORMCategoryRepository().get_version(categories[1].id) == 1
+
+    def test_rename_does_not_touch_links_or_counts(self, categories: list[Category]):
+        repository = DjangoORMGenreRepository()
+        genre = Genre(name="Drama", categories={categories[0].id})
+        repository.save(genre)
+        genre.change_name("Comedy")
+
+        with CaptureQueriesContext(connection) as context:
+            repository.update(genre)
+
+        assert not [query for query in context.captured_queries if '"category"' in query["sql"]]
+        assert self.count(categories[0]) == 1
+
+    def test_notify_after_commit_only_when_counts_changed(
+        self,
+        categories: list[Category],
+        django_capture_on_commit_callbacks
+    ):
+        notified = []
+        repository = DjangoORMGenreRepository(on_categories_changed=notified.append)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            repository.save(Genre(name="Comedy"))
+        assert notified == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            repository.save(Genre(name="Drama", categories={categories[0].id}))
+        assert notified == [{categories[0].id}]
+
+    def test_repair_recomputes_every_counter_in_batches(self, categories: list[Category]):
+        repository = DjangoORMGenreRepository()
+        repository.save(Genre(name="Drama", categories={categories[0].id, categories[1].id}))
+        repository.save(Genre(name="Action", categories={categories[0].id}))
+        CategoryModel.objects.filter(id=categories[0].id).update(genre_count=7)
+        CategoryModel.objects.filter(id=categories[2].id).update(genre_count=3)
+
+        assert repository.repair_genre_counts(batch_size=2) == 2
+        assert [self.count(category) for category in categories] == [2, 1, 0]
+        assert repository.repair_genre_counts(batch_size=2) == 0
@@ -0,0 +1,285 @@
+import csv
+import gzip
+import json
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core.category.domain import Category
+from src.core.genre.domain import Genre
+from django_project.category_app.repository import DjangoORMCategoryRepository, get_category_repository
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+@pytest.fixture
+def movie() -> Category:
+    category = Category(name="Movie")
+    DjangoORMCategoryRepository().save(category)
+    return category
+
+@pytest.fixture
+def series() -> Category:
+    category = Category(name="Series")
+    DjangoORMCategoryRepository().save(category)
+    return category
+
+@pytest.fixture
+def genre_repository() -> DjangoORMGenreRepository:
+    return DjangoORMGenreRepository()
+
+
+@pytest.mark.django_db
+class TestGenreAPI:
+    url = "/api/genres/"
+
+    def test_list_genres_in_constant_queries(
+        self,
+        movie: Category,
+        series: Category,
+        genre_repository: DjangoORMGenreRepository,
+        django_assert_num_queries
+    ):
+        drama = Genre(name="Drama", categories={movie.id, series.id})
+        action = Genre(name="Action", is_active=False)
+        genre_repository.save(drama)
+        genre_repository.save(action)
+
+        with django_assert_num_queries(2):
+            response = APIClient().get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "data": [
+                {"id": str(action.id), "name": "Action", "is_active": False, "categories": []},
+                {
+                    "id": str(drama.id),
+                    "name": "Drama",
+                    "is_active": True,
+                    "categories": sorted([str(movie.id), str(series.id)])
+                },
+            ]
+        }
+
+    def test_filter_genres_by_categories(
+        self,
+        movie: Category,
+        series: Category,
+        genre_repository: DjangoORMGenreRepository
+    ):
+        genre_repository.save(Genre(name="Drama", categories={movie.id, series.id}))
+        genre_repository.save(Genre(name="Action", categories={movie.id}))
+        genre_repository.save(Genre(name="Comedy"))
+        categories = f"{movie.id}, {series.id}"
+
+        any_response = APIClient().get(self.url, {"categories": categories})
+        all_response = APIClient().get(self.url, {"categories": categories, "match": "all"})
+
+        assert [genre["name"] for genre in any_response.data["data"]] == ["Action", "Drama"]
+        assert [genre["name"] for genre in all_response.data["data"]] == ["Drama"]
+
+    @pytest.mark.parametrize("params", [{"categories": "not-an-id"}, {"match": "some"}])
+    def test_invalid_filter_returns_400(self, params: dict):
+        response = APIClient().get(self.url, params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.data) == set(params)
+
+    def test_create_genre(self, movie: Category, genre_repository: DjangoORMGenreRepository):
+        response = APIClient().post(
+            self.url,
+            data={"name": "Drama", "categories": [str(movie.id)]},
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        genre = genre_repository.get_by_id(response.data["id"])
+        assert (genre.name, genre.is_active, genre.categories) == ("Drama", True, {movie.id})
+
+    def test_category_responses_count_linked_genres(self, movie: Category, series: Category):
+        response = APIClient().post(
+            self.url,
+            data={"name": "Drama", "categories": [str(movie.id)]},
+            format="json"
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        listed = APIClient().get("/api/categories/", {"sort": "name"}).data["data"]
+        retrieved = APIClient().get(f"/api/categories/{movie.id}/").data["data"]
+
+        assert [(category["name"], category["genre_count"]) for category in listed] == [("Movie", 1), ("Series", 0)]
+        assert retrieved["genre_count"] == 1
+
+    def test_create_genre_with_unknown_category_returns_400(self, genre_repository: DjangoORMGenreRepository):
+        missing = uuid4()
+
+        response = APIClient().post(self.url, data={"name": "Drama", "categories": [str(missing)]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"error": f"Categories with provided IDs not found: {missing}"}
+        assert genre_repository.list() == []
+
+    def test_report_every_unknown_category_from_one_lookup(
+        self,
+        movie: Category,
+        django_assert_num_queries
+    ):
+        missing = sorted(str(uuid4()) for _ in range(3))
+
+        with django_assert_num_queries(1):
+            response = APIClient().post(
+                self.url,
+                data={"name": "Drama", "categories": [str(movie.id), *missing]},
+                format="json"
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"error": f"Categories with provided IDs not found: {', '.join(missing)}"}
+
+    def test_create_genre_with_blank_name_returns_400(self):
+        response = APIClient().post(self.url, data={"name": ""}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_retrieve_genre(self, movie: Category, genre_repository: DjangoORMGenreRepository):
+        genre = Genre(name="Drama", categories={movie.id})
+        genre_repository.save(genre)
+
+        response = APIClient().get(f"{self.url}{genre.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "data": {"id": str(genre.id), "name": "Drama", "is_active": True, "categories": [str(movie.id)]}
+        }
+
+    def test_retrieve_missing_genre_returns_404(self):
+        assert APIClient().get(f"{self.url}{uuid4()}/").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_update_genre(self, movie: Category, series: Category, genre_repository: DjangoORMGenreRepository):
+        genre = Genre(name="Drama", categories={movie.id})
+        genre_repository.save(genre)
+
+        response = APIClient().put(
+            f"{self.url}{genre.id}/",
+            data={"name": "Comedy", "is_active": False, "categories": [str(series.id)]},
+            format="json"
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        updated = genre_repository.get_by_id(genre.id)
+        assert (updated.name, updated.is_active, updated.categories) == ("Comedy", False, {series.id})
+
+    def test_partial_update_keeps_missing_fields(self, movie: Category, genre_repository: DjangoORMGenreRepository):
+        genre = Genre(name="Drama", categories={movie.id})
+        genre_repository.save(genre)
+
+        response = APIClient().patch(f"{self.url}{genre.id}/", data={"is_active": False}, format="json")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        updated = genre_repository.get_by_id(genre.id)
+        assert (updated.name, updated.is_active, updated.categories) == ("Drama", False, {movie.id})
+
+    def test_update_missing_genre_returns_404(self):
+        response = APIClient().patch(f"{self.url}{uuid4()}/", data={"name": "Comedy"}, format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_delete_genre(self, genre_repository: DjangoORMGenreRepository):
+        genre = Genre(name="Drama")
+        genre_repository.save(genre)
+
+        response = APIClient().delete(f"{self.url}{genre.id}/")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert genre_repository.get_by_id(genre.id) is None
+        assert APIClient().delete(f"{self.url}{genre.id}/").status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestGenreAPIWithCategoryCache:
+    @pytest.fixture(autouse=True)
+    def cache(self, settings):
+        settings.CATEGORY_REPOSITORY_CACHE = {"ENABLED": True, "MAX_SIZE": 10, "TTL": 60}
+        cache = get_category_repository()
+        cache.clear()
+        yield cache
+        cache.clear()
+
+    def test_linking_a_genre_invalidates_the_cached_category(
+        self,
+        movie: Category,
+        django_capture_on_commit_callbacks
+    ):
+        url = f"/api/categories/{movie.id}/"
+        etag = APIClient().get(url)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = APIClient().post(
+                "/api/genres/",
+                data={"name": "Drama", "categories": [str(movie.id)]},
+                format="json"
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        retrieved = APIClient().get(url, HTTP_IF_NONE_MATCH=etag)
+        assert retrieved.status_code == status.HTTP_200_OK
+        assert retrieved.data["data"]["genre_count"] == 1
+        assert retrieved["ETag"] != etag
+
+        patched = APIClient().patch(url, data={"name": "Movies"}, format="json", HTTP_IF_MATCH=retrieved["ETag"])
+        assert patched.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+class TestGenreExportAPI:
+    url = "/api/genres/export/"
+
+    def test_export_ndjson_with_category_ids(
+        self,
+        movie: Category,
+        series: Category,
+        genre_repository: DjangoORMGenreRepository
+    ):
+        drama, empty = Genre(name="Drama", categories={movie.id, series.id}), Genre(name="Empty", is_active=False)
+        genre_repository.save(drama)
+        genre_repository.save(empty)
+
+        response = APIClient().get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert response["Content-Disposition"] == 'attachment; filename="genres.ndjson"'
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert sorted((json.loads(line) for line in lines), key=lambda record: record["name"]) == [
+            {"id": str(drama.id), "name": "Drama", "is_active": True, "categories": sorted(map(str, drama.categories))},
+            {"id": str(empty.id), "name": "Empty", "is_active": False, "categories": []},
+        ]
+
+    def test_export_gzipped_csv_when_client_accepts_gzip(
+        self,
+        movie: Category,
+        series: Category,
+        genre_repository: DjangoORMGenreRepository
+    ):
+        genre = Genre(name="Drama", categories={movie.id, series.id})
+        genre_repository.save(genre)
+
+        response = APIClient().get(self.url, {"output": "csv"}, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        assert list(csv.DictReader(StringIO(content, newline=""))) == [{
+            "id": str(genre.id),
+            "name": "Drama",
+            "is_active": "true",
+            "categories": " ".join(sorted(map(str, genre.categories)))
+        }]
+
+    def test_return_400_when_output_is_invalid(self):
+        response = APIClient().get(self.url, {"output": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
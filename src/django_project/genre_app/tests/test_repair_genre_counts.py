@@ -0,0 +1,32 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+import pytest
+
+from src.core.category.domain import Category
+from src.core.genre.domain import Genre
+from django_project.category_app.models import Category as CategoryModel
+from django_project.category_app.repository import DjangoORMCategoryRepository
+from django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+@pytest.mark.django_db
+class TestRepairGenreCountsCommand:
+    def test_recompute_drifted_counters(self):
+        categories = [Category(name=f"Category {index}") for index in range(5)]
+        DjangoORMCategoryRepository().save_many(categories)
+        DjangoORMGenreRepository().save(Genre(name="Drama", categories={categories[1].id}))
+        CategoryModel.objects.update(genre_count=4)
+        out = StringIO()
+
+        call_command("repair_genre_counts", "--batch-size", "2", stdout=out)
+
+        assert "Repaired 5 genre counts" in out.getvalue()
+        assert dict(CategoryModel.objects.values_list("id", "genre_count")) == {
+            category.id: 1 if category is categories[1] else 0 for category in categories
+        }
+
+    def test_reject_invalid_batch_size(self):
+        with pytest.raises(CommandError):
+            call_command("repair_genre_counts", "--batch-size", "0")
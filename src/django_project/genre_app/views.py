@@ -0,0 +1,153 @@
+from django.http import StreamingHttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import patch_vary_headers
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND
+)
+
+from src.core.genre.application.exceptions import GenreNotFound, InvalidGenre, RelatedCategoriesNotFound
+from src.core.genre.application.usecases import (
+    CreateGenre,
+    CreateGenreRequest,
+    DeleteGenre,
+    DeleteGenreRequest,
+    GetGenre,
+    GetGenreRequest,
+    ListGenre,
+    ListGenreRequest,
+    StreamGenre,
+    StreamGenreRequest,
+    UpdateGenre,
+    UpdateGenreRequest
+)
+from django_project.category_app.exporting import CONTENT_TYPES, export_genres
+from django_project.category_app.repository import get_category_repository
+from .repository import get_genre_repository
+from .serializers import (
+    MATCH_ALL,
+    CreateGenreRequestSerializer,
+    CreateGenreResponseSerializer,
+    DeleteGenreRequestSerializer,
+    ExportGenreRequestSerializer,
+    ListGenreRequestSerializer,
+    ListGenreResponseSerializer,
+    PartialUpdateGenreRequestSerializer,
+    RetrieveGenreRequestSerializer,
+    RetrieveGenreResponseSerializer,
+    UpdateGenreRequestSerializer
+)
+from .schema_extensions import genre_viewset_schema
+
+
+@genre_viewset_schema
+class GenreViewSet(viewsets.ViewSet):
+    def list(self, request: Request) -> Response:
+        serializer = ListGenreRequestSerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+
+        use_case = ListGenre(repository=get_genre_repository())
+        response = use_case.execute(ListGenreRequest(
+            categories=serializer.validated_data["categories"],
+            match_all=serializer.validated_data["match"] == MATCH_ALL
+        ))
+        serializer = ListGenreResponseSerializer(instance=response)
+
+        return Response(status=HTTP_200_OK, data=serializer.data)
+
+    def retrieve(self, request: Request, pk: None) -> Response:
+        serializer = RetrieveGenreRequestSerializer(data={"id": pk})
+        serializer.is_valid(raise_exception=True)
+
+        use_case = GetGenre(repository=get_genre_repository())
+        try:
+            response = use_case.execute(GetGenreRequest(**serializer.validated_data))
+        except GenreNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+
+        serializer = RetrieveGenreResponseSerializer(instance=response)
+        return Response(status=HTTP_200_OK, data=serializer.data)
+
+    def create(self, request: Request) -> Response:
+        serializer = CreateGenreRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        use_case = CreateGenre(
+            repository=get_genre_repository(),
+            category_repository=get_category_repository()
+        )
+        try:
+            output = use_case.execute(CreateGenreRequest(**serializer.validated_data))
+        except (InvalidGenre, RelatedCategoriesNotFound) as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
+
+        return Response(
+            status=HTTP_201_CREATED,
+            data=CreateGenreResponseSerializer(output).data,
+        )
+
+    def update(self, request: Request, pk: None) -> Response:
+        serializer = UpdateGenreRequestSerializer(data={**request.data, "id": pk})
+        serializer.is_valid(raise_exception=True)
+
+        return self._update(UpdateGenreRequest(**serializer.validated_data))
+
+    def partial_update(self, request: Request, pk: None) -> Response:
+        serializer = PartialUpdateGenreRequestSerializer(data={**request.data, "id": pk}, partial=True)
+        serializer.is_valid(raise_exception=True)
+
+        return self._update(UpdateGenreRequest(**serializer.validated_data))
+
+    def _update(self, request: UpdateGenreRequest) -> Response:
+        use_case = UpdateGenre(
+            repository=get_genre_repository(),
+            category_repository=get_category_repository()
+        )
+        try:
+            use_case.execute(request)
+        except GenreNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+        except (InvalidGenre, RelatedCategoriesNotFound) as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"error": str(e)})
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    def destroy(self, request: Request, pk: None) -> Response:
+        serializer = DeleteGenreRequestSerializer(data={"id": pk})
+        serializer.is_valid(raise_exception=True)
+
+        use_case = DeleteGenre(repository=get_genre_repository())
+        try:
+            use_case.execute(DeleteGenreRequest(**serializer.validated_data))
+        except GenreNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        serializer = ExportGenreRequestSerializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+        output = serializer.validated_data["output"]
+        compress = bool(re_accepts_gzip.search(request.headers.get("Accept-Encoding", "")))
+
+        use_case = StreamGenre(repository=get_genre_repository())
+        response = use_case.execute(StreamGenreRequest())
+
+        streaming = StreamingHttpResponse(
+            export_genres(response.data, output, compress=compress),
+            status=HTTP_200_OK,
+            content_type=CONTENT_TYPES[output],
+            headers={"Content-Disposition": f'attachment; filename="genres.{output}"'}
+        )
+        if compress:
+            streaming.headers["Content-Encoding"] = "gzip"
+        patch_vary_headers(streaming, ["Accept-Encoding"])
+        return streaming
@@ -0,0 +1,67 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_string
+from drf_spectacular.views import SpectacularAPIView
+
+
+accepts_gzip = _lazy_re_compile(r"\bgzip\b")
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    SpectacularAPIView that generates each schema variant (media type,
+    language, API version) once per CODE_VERSION and then serves the stored
+    bytes from the Django cache, gzipped when the client accepts it, with a
+    strong ETag for 304 answers.
+    """
+
+    def _get_schema_response(self, request):
+        version = self.api_version or request.version or self._get_version_parameter(request)
+        key = ":".join([
+            "api-schema",
+            settings.CODE_VERSION,
+            request.accepted_media_type,
+            translation.get_language() or "",
+            version or "",
+        ])
+
+        schema = cache.get(key)
+        if schema is None:
+            schema = self._render_schema(request)
+            cache.set(key, schema, timeout=None)
+
+        response = get_conditional_response(request, etag=schema["etag"])
+        if response is None:
+            if accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+                response = HttpResponse(schema["gzip_content"], content_type=schema["content_type"])
+                response["Content-Encoding"] = "gzip"
+            else:
+                response = HttpResponse(schema["content"], content_type=schema["content_type"])
+            response["Content-Disposition"] = schema["content_disposition"]
+
+        response["ETag"] = schema["etag"]
+        patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+        return response
+
+    def _render_schema(self, request) -> dict:
+        response = super()._get_schema_response(request)
+        renderer = request.accepted_renderer
+        content = renderer.render(response.data, request.accepted_media_type, self.get_renderer_context())
+
+        content_type = request.accepted_media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+
+        return {
+            "content": content,
+            "gzip_content": compress_string(content),
+            "content_type": content_type,
+            "content_disposition": response["Content-Disposition"],
+            "etag": f'"{hashlib.sha256(content).hexdigest()}"',
+        }
@@ -0,0 +1,94 @@
+import logging
+from contextlib import ExitStack
+from dataclasses import dataclass
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestTiming:
+    queries: int = 0
+    db: float = 0.0
+    view: float = 0.0
+    render: float = 0.0
+    total: float = 0.0
+    _view_started: float | None = None
+    _view_finished: float | None = None
+
+    def record_query(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += perf_counter() - started
+            self.queries += 1
+
+    def header(self) -> str:
+        return ", ".join([
+            f'db;dur={self.db * 1000:.2f};desc="{self.queries} queries"',
+            f"view;dur={self.view * 1000:.2f}",
+            f"render;dur={self.render * 1000:.2f}",
+            f"total;dur={self.total * 1000:.2f}",
+        ])
+
+
+class ServerTimingMiddleware:
+    """
+    Adds a Server-Timing header and a log line with the number of queries,
+    time spent in the database, in the view (request validation plus the
+    use case), rendering the response, and in total.
+
+    Disabled unless SERVER_TIMING["ENABLED"] is set; Django then drops the
+    middleware from the chain, so it costs nothing.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "SERVER_TIMING", {}).get("ENABLED", False):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timing = request.server_timing = RequestTiming()
+
+        started = perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timing.record_query))
+            response = self.get_response(request)
+        finished = perf_counter()
+
+        timing.total = finished - started
+        if timing._view_started is not None:
+            view_finished = timing._view_finished or finished
+            timing.view = view_finished - timing._view_started
+            timing.render = finished - view_finished if timing._view_finished else 0.0
+
+        response["Server-Timing"] = timing.header()
+        logger.info(
+            "method=%s path=%s status=%d queries=%d db_ms=%.2f view_ms=%.2f render_ms=%.2f total_ms=%.2f",
+            request.method,
+            request.path,
+            response.status_code,
+            timing.queries,
+            timing.db * 1000,
+            timing.view * 1000,
+            timing.render * 1000,
+            timing.total * 1000,
+            extra={"server_timing": timing},
+        )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.server_timing._view_started = perf_counter()
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook returns.
+        request.server_timing._view_finished = perf_counter()
+        return response
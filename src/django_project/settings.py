@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -40,9 +41,11 @@ INSTALLED_APPS = [
     'drf_spectacular',
     'rest_framework',
     'django_project.category_app',
+    'django_project.genre_app',
 ]
 
 MIDDLEWARE = [
+    'django_project.server_timing.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -135,4 +138,29 @@ SPECTACULAR_SETTINGS = {
     'DESCRIPTION': 'Criando uma API com Django REST Framework para catalogar vídeos.',
     'VERSION': '1.0.0',
     'SERVE_INCLUDE_SCHEMA': False
-}
\ No newline at end of file
+}
+
+# Identifies the deployed code. /api/schema/ is generated once per value, so
+# deploys should set it (e.g. to the commit hash) whenever the API changes.
+CODE_VERSION = os.environ.get('CODE_VERSION', SPECTACULAR_SETTINGS['VERSION'])
+
+# Read-through cache in front of the category repository used by the views.
+# The cache lives in each worker process, so writes made by other workers are
+# only seen after TTL seconds.
+CATEGORY_REPOSITORY_CACHE = {
+    'ENABLED': False,
+    'MAX_SIZE': 1024,
+    'TTL': 60,
+}
+# Gzipped JSON file of all active categories served at
+# /api/categories/snapshot/; rebuilt DELAY seconds after category writes.
+CATEGORY_SNAPSHOT = {
+    'ENABLED': False,
+    'PATH': BASE_DIR / 'var' / 'category_snapshot.json.gz',
+    'DELAY': 1.0,
+}
+# Server-Timing header and per-request log line with query count and timings.
+# When disabled the middleware removes itself from the chain.
+SERVER_TIMING = {
+    'ENABLED': DEBUG,
+}
@@ -0,0 +1,25 @@
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core.category.domain import Category
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    def test_exposes_use_case_metrics_in_prometheus_format(self):
+        APIClient().get("/api/categories/")
+        APIClient().get(f"/api/categories/{Category(name='Movie').id}/")
+
+        response = APIClient().get("/internal/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/plain; version=0.0.4; charset=utf-8"
+        body = response.content.decode()
+        assert "# TYPE use_case_duration_seconds histogram" in body
+        assert 'use_case_calls_total{use_case="ListCategory"}' in body
+        assert 'use_case_errors_total{exception="CategoryNotFound",use_case="GetCategory"}' in body
+        assert 'use_case_duration_seconds_bucket{use_case="ListCategory",le="+Inf"}' in body
+
+    def test_only_accepts_get(self):
+        assert APIClient().post("/internal/metrics").status_code == status.HTTP_405_METHOD_NOT_ALLOWED
@@ -0,0 +1,73 @@
+import gzip
+from unittest.mock import patch
+
+from django.core.cache import cache
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from django_project.schema import CachedSpectacularAPIView
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestCachedSchemaAPI:
+    def test_schema_is_generated_once_and_then_served_from_cache(self):
+        with patch.object(
+            CachedSpectacularAPIView,
+            "_render_schema",
+            autospec=True,
+            side_effect=CachedSpectacularAPIView._render_schema
+        ) as render_schema:
+            first = APIClient().get("/api/schema/")
+            second = APIClient().get("/api/schema/")
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert first.content == second.content
+        assert first["ETag"] == second["ETag"]
+        assert b"/api/categories/" in first.content
+        assert render_schema.call_count == 1
+
+    def test_each_format_is_cached_separately(self):
+        yaml = APIClient().get("/api/schema/")
+        json = APIClient().get("/api/schema/", {"format": "json"})
+
+        assert yaml["Content-Type"].startswith("application/vnd.oai.openapi")
+        assert json["Content-Type"].startswith("application/vnd.oai.openapi+json")
+        assert json.content.startswith(b"{")
+        assert yaml["ETag"] != json["ETag"]
+
+    def test_schema_returns_304_when_etag_matches(self):
+        etag = APIClient().get("/api/schema/")["ETag"]
+
+        response = APIClient().get("/api/schema/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+    def test_schema_is_gzipped_when_client_accepts_it(self):
+        plain = APIClient().get("/api/schema/")
+        compressed = APIClient().get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        assert compressed["Content-Encoding"] == "gzip"
+        assert gzip.decompress(compressed.content) == plain.content
+        assert "Accept-Encoding" in compressed["Vary"]
+
+    def test_new_code_version_regenerates_schema(self, settings):
+        with patch.object(
+            CachedSpectacularAPIView,
+            "_render_schema",
+            autospec=True,
+            side_effect=CachedSpectacularAPIView._render_schema
+        ) as render_schema:
+            APIClient().get("/api/schema/")
+            settings.CODE_VERSION = "next"
+            APIClient().get("/api/schema/")
+
+        assert render_schema.call_count == 2
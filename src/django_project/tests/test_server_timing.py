@@ -0,0 +1,55 @@
+import logging
+import re
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core.category.domain import Category
+from django_project.category_app.repository import DjangoORMCategoryRepository
+
+
+def parse_server_timing(header: str) -> dict[str, str]:
+    return {
+        metric.split(";")[0].strip(): metric
+        for metric in header.split(",")
+    }
+
+
+@pytest.mark.django_db
+class TestServerTimingMiddleware:
+    def test_reports_queries_and_timings_for_each_request(self, settings):
+        settings.SERVER_TIMING = {"ENABLED": True}
+        category = Category(name="Movie")
+        DjangoORMCategoryRepository().save(category)
+
+        response = APIClient().get(f"/api/categories/{category.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        metrics = parse_server_timing(response["Server-Timing"])
+        assert set(metrics) == {"db", "view", "render", "total"}
+        assert 'desc="1 queries"' in metrics["db"]
+        assert all(re.search(r"dur=\d+\.\d{2}", metric) for metric in metrics.values())
+
+    def test_logs_one_structured_line_per_request(self, settings, caplog):
+        settings.SERVER_TIMING = {"ENABLED": True}
+
+        id = Category(name="Movie").id
+
+        with caplog.at_level(logging.INFO, logger="django_project.server_timing"):
+            APIClient().delete(f"/api/categories/{id}/")
+
+        record, = [record for record in caplog.records if record.name == "django_project.server_timing"]
+        assert record.getMessage().startswith(
+            f"method=DELETE path=/api/categories/{id}/ status=404 queries=1 db_ms="
+        )
+        assert record.server_timing.queries == 1
+
+    def test_is_removed_from_the_chain_when_disabled(self, settings, caplog):
+        settings.SERVER_TIMING = {"ENABLED": False}
+
+        with caplog.at_level(logging.INFO, logger="django_project.server_timing"):
+            response = APIClient().get("/api/categories/")
+
+        assert "Server-Timing" not in response
+        assert not [record for record in caplog.records if record.name == "django_project.server_timing"]
@@ -16,22 +16,24 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView
-)
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 from rest_framework.routers import DefaultRouter
 
-from django_project.category_app.views import CategoryViewSet
+from django_project.category_app.views import CategoryViewSet, category_snapshot_view
+from django_project.genre_app.views import GenreViewSet
+from django_project.metrics import metrics_view
+from django_project.schema import CachedSpectacularAPIView
 
 
 router = DefaultRouter()
 router.register(r"api/categories", CategoryViewSet, basename="category")
+router.register(r"api/genres", GenreViewSet, basename="genre")
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/categories/snapshot/', category_snapshot_view, name='category-snapshot'),
+    path('internal/metrics', metrics_view, name='metrics'),
+    path('api/schema/', CachedSpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 ] + router.urls
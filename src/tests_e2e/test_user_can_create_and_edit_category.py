@@ -1,6 +1,8 @@
 import pytest
 from rest_framework.test import APIClient
 
+from src.core.category.application.usecases import DEFAULT_PAGE_SIZE
+
 
 @pytest.mark.django_db
 class TestCreateAndEditCategory:
@@ -8,7 +10,10 @@ class TestCreateAndEditCategory:
         api_client = APIClient()
 
         list_response = api_client.get("/api/categories/")
-        assert list_response.data == {"data": []}
+        assert list_response.data == {
+            "data": [],
+            "meta": {"next_cursor": None, "page_size": DEFAULT_PAGE_SIZE}
+        }
 
         create_response = api_client.post(
             "/api/categories/",
@@ -27,9 +32,11 @@ class TestCreateAndEditCategory:
                     "id": created_category_id,
                     "name": "Movie",
                     "description": "Movie description",
-                    "is_active": True
+                    "is_active": True,
+                    "genre_count": 0
                 }
-            ]
+            ],
+            "meta": {"next_cursor": None, "page_size": DEFAULT_PAGE_SIZE}
         }
 
         update_request = api_client.put(
@@ -50,7 +57,9 @@ class TestCreateAndEditCategory:
                     "id": created_category_id,
                     "name": "New Movie",
                     "description": "New Movie description",
-                    "is_active": False
+                    "is_active": False,
+                    "genre_count": 0
                 }
-            ]
+            ],
+            "meta": {"next_cursor": None, "page_size": DEFAULT_PAGE_SIZE}
         }